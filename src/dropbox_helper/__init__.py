@@ -4,6 +4,11 @@ from .parquet_mixin import ParquetMixin
 from .pickle_mixin import PickleMixin
 from .shapefile_mixin import ShapefileMixin
 from .npz_mixin import NPZMixin
+from .batch_mixin import BatchMixin
+from .sync_mixin import SyncMixin
+from .async_helper import AsyncDropboxHelper
+from .transport import RetryPolicy, TokenBucket
+from .content_hash import ContentHashMismatch
 # from .raster_mixin import RasterMixin
 # from .json_mixin import JSONMixin
 # from .report_mixin import ReportMixin
@@ -13,7 +18,7 @@ load_dotenv()
 
 # __all__ = ["DropboxHelper", "get_dbx_helper"]
 
-class DropboxHelper(CoreMixin, CSVMixin, ParquetMixin, PickleMixin, ShapefileMixin, NPZMixin): # , RasterMixin, JSONMixin, ReportMixin):
+class DropboxHelper(CoreMixin, CSVMixin, ParquetMixin, PickleMixin, ShapefileMixin, NPZMixin, BatchMixin, SyncMixin): # , RasterMixin, JSONMixin, ReportMixin):
     """
     Class for interfacing with Dropbox.
 
@@ -33,6 +38,41 @@ class DropboxHelper(CoreMixin, CSVMixin, ParquetMixin, PickleMixin, ShapefileMix
         If True, the input_path and output_path will be used as is.
         If False, the input_path and output_path will be used to create the raw_input_path,
         clean_input_path and output_path.
+    cache_dir : str or None, optional
+        Local directory for a persistent cache of downloaded files, keyed by
+        Dropbox path and content hash. If None (default), caching is disabled.
+    cache_size_mb : float, optional
+        Maximum size of the download cache in megabytes. Least recently used
+        files are evicted first. Default is 10240.
+    upload_chunk_size : int, optional
+        Chunk size in bytes for uploads of 150 MB or more, rounded down to a
+        multiple of 4 MiB. Default is 32 MiB.
+    upload_workers : int, optional
+        Number of chunks sent concurrently by large uploads. Default is 4.
+    max_connections : int, optional
+        Size of the HTTP connection pool shared by all requests. Default is 16.
+    state_dir : str or None, optional
+        Local directory for persistent state such as listing cursors and
+        the unpacked files of memory-mapped reads. Defaults to `~/.dropbox_helper`.
+    skip_if_unchanged : bool, optional
+        If True, writes are skipped when Dropbox already holds identical
+        content. Default is False.
+    max_retries : int, optional
+        Number of retries of a request after a rate-limit error, a server
+        error or a dropped connection, with exponential backoff. Default is 5.
+    requests_per_second : float or TokenBucket, optional
+        Client-side rate limit shared by all threads. Default is no limit.
+    raise_on_error : bool, optional
+        If True, reads and writes raise errors instead of printing them and
+        returning None. Default is False.
+    object_cache_mb : float or None, optional
+        Memory budget in megabytes of an in-process cache of decoded objects,
+        revalidated by file revision on every read. Cached objects are shared
+        and should be treated as read-only. If None (default), it is disabled.
+    metadata_ttl : float, optional
+        Seconds that file and folder metadata seen in listings, uploads and
+        folder creation is trusted for existence checks and cache
+        revalidation. Default is 60; 0 disables the metadata cache.
 
     Attributes
     ----------
@@ -44,10 +84,18 @@ class DropboxHelper(CoreMixin, CSVMixin, ParquetMixin, PickleMixin, ShapefileMix
         The path of the Dropbox folder containing the clean data.
     output_path : str
         The path of the Dropbox folder where the output data will be saved.
+    cache : DiskCache or None
+        The local download cache, or None if caching is disabled.
+    object_cache : ObjectCache or None
+        The in-memory cache of decoded objects, or None if it is disabled.
+    metadata_cache : MetadataCache or None
+        The in-memory cache of file and folder metadata, or None if it is disabled.
+    retry_policy : RetryPolicy
+        The retry and rate-limit policy applied to every request.
     """
     pass
 
-def get_dbx_helper(token='DROPBOX_TOKEN', key='DROPBOX_KEY', secret='DROPBOX_SECRET'):
+def get_dbx_helper(token='DROPBOX_TOKEN', key='DROPBOX_KEY', secret='DROPBOX_SECRET', **kwargs):
     """
     Instantiate a DropboxHelper using environment variables.
 
@@ -62,6 +110,8 @@ def get_dbx_helper(token='DROPBOX_TOKEN', key='DROPBOX_KEY', secret='DROPBOX_SEC
     secret : str, optional
         The name of the environment variable containing the Dropbox app secret.
         Defaults to 'DROPBOX_SECRET'.
+    **kwargs
+        Additional keyword arguments passed to `DropboxHelper`, e.g. `cache_dir`.
 
     Returns
     -------
@@ -73,13 +123,35 @@ def get_dbx_helper(token='DROPBOX_TOKEN', key='DROPBOX_KEY', secret='DROPBOX_SEC
     ValueError
         If any of the required environment variables are missing or empty.
     """
+    return DropboxHelper(**_credentials_from_env(token, key, secret), **kwargs)
+
+def get_async_dbx_helper(token='DROPBOX_TOKEN', key='DROPBOX_KEY', secret='DROPBOX_SECRET', **kwargs):
+    """
+    Instantiate an AsyncDropboxHelper using environment variables.
+
+    Takes the same arguments as `get_dbx_helper`; `**kwargs` are passed to
+    `AsyncDropboxHelper`, e.g. `max_concurrency`.
+
+    Returns
+    -------
+    AsyncDropboxHelper
+        An instance of AsyncDropboxHelper configured with the specified credentials.
+
+    Raises
+    ------
+    ValueError
+        If any of the required environment variables are missing or empty.
+    """
+    return AsyncDropboxHelper(**_credentials_from_env(token, key, secret), **kwargs)
+
+def _credentials_from_env(token, key, secret):
     token = os.getenv(token)
     app_key = os.getenv(key)
     app_secret = os.getenv(secret)
 
     if not token or not app_key or not app_secret:
         raise ValueError("Missing Dropbox credentials in environment variables.")
-    
-    return DropboxHelper(dbx_token=token, dbx_key=app_key, dbx_secret=app_secret)
+
+    return dict(dbx_token=token, dbx_key=app_key, dbx_secret=app_secret)
 
 # dbx_helper = get_dbx_helper()
\ No newline at end of file
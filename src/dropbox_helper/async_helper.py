@@ -0,0 +1,588 @@
+import asyncio
+import fnmatch
+import json
+import logging
+import os
+import time
+from dropbox import files
+from dropbox.exceptions import ApiError, AuthError, HttpError, InternalServerError, RateLimitError
+from stone.backends.python_rsrc import stone_serializers
+from .core_mixin import MAX_SINGLE_UPLOAD, UPLOAD_BLOCK_SIZE
+from .csv_mixin import CSVMixin
+from .parquet_mixin import ParquetMixin
+from .pickle_mixin import PickleMixin
+from .transport import RetryPolicy
+from .npz_mixin import NPZMixin
+
+try:
+    import httpx
+except ImportError:  # optional dependency, see the `async` extra
+    httpx = None
+
+API_HOST = "https://api.dropboxapi.com"
+CONTENT_HOST = "https://content.dropboxapi.com"
+# Refresh the access token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN = 5 * 60
+
+class AsyncDropboxHelper:
+    """
+    Asyncio-native counterpart of `DropboxHelper`.
+
+    Every request goes through one shared `httpx.AsyncClient`, so a single
+    event loop can drive hundreds of concurrent transfers over a pooled set of
+    connections without a thread per call. Requests are built from the route
+    definitions of the `dropbox` SDK, so arguments, results and errors are the
+    same `dropbox.files` objects and `dropbox.exceptions` the synchronous
+    helper uses. (De)serialization reuses the mixins' loaders and dumpers and
+    runs in a worker thread to keep the event loop responsive.
+
+    Requires the optional `httpx` dependency (`pip install dropbox-helper[async]`).
+
+    Parameters
+    ----------
+    dbx_token : str
+        OAuth2 refresh token for Dropbox API.
+    dbx_key : str
+        App key for Dropbox API.
+    dbx_secret : str
+        App secret for Dropbox API.
+    input_path : str
+        Base path in Dropbox for input data.
+    output_path : str
+        Base path in Dropbox for output data.
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once, which is also the size
+        of the connection pool. Default is 64.
+    upload_chunk_size : int, optional
+        Chunk size in bytes for uploads of 150 MB or more, rounded down to a
+        multiple of 4 MiB. Default is 32 MiB.
+    upload_workers : int, optional
+        Number of chunks sent concurrently by one large upload. Default is 4.
+    timeout : float, optional
+        Timeout in seconds for each request. Default is 100.
+    max_retries : int, optional
+        Number of times a request is retried after a rate-limit error, a
+        server error or a dropped connection, following the same `RetryPolicy`
+        as the synchronous helper. Default is 5.
+
+    Examples
+    --------
+    >>> async with get_async_dbx_helper() as helper:
+    ...     dfs = await asyncio.gather(*(helper.read_csv('/input', 'raw', f) for f in names))
+    """
+
+    def __init__(self, dbx_token, dbx_key, dbx_secret, input_path='/input', output_path='/output',
+                 max_concurrency=64, upload_chunk_size=32 * 1024 * 1024, upload_workers=4, timeout=100,
+                 max_retries=5):
+        if httpx is None:
+            raise ImportError(
+                "AsyncDropboxHelper requires httpx. Install it with `pip install dropbox-helper[async]`."
+            )
+        self._refresh_token = dbx_token
+        self._app_key = dbx_key
+        self._app_secret = dbx_secret
+        self.input_path = input_path
+        self.output_path = output_path
+        self.upload_chunk_size = max(UPLOAD_BLOCK_SIZE, upload_chunk_size - upload_chunk_size % UPLOAD_BLOCK_SIZE)
+        self.upload_workers = upload_workers
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.retry_policy = RetryPolicy(max_retries=max_retries)
+        self._token_lock = asyncio.Lock()
+        self._access_token = None
+        self._token_expires = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and its connections.
+        """
+        await self.client.aclose()
+
+    def _construct_path(self, dbx_path: str, directory: str, filename: str) -> str:
+        return os.path.join(dbx_path, directory, filename)
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    async def _get_access_token(self, force_refresh: bool = False) -> str:
+        """
+        Return a valid short-lived access token, refreshing it when needed.
+        """
+        async with self._token_lock:
+            if force_refresh or self._access_token is None or time.monotonic() >= self._token_expires:
+                res = await self.client.post(f"{API_HOST}/oauth2/token", data={
+                    "grant_type": "refresh_token",
+                    "refresh_token": self._refresh_token,
+                    "client_id": self._app_key,
+                    "client_secret": self._app_secret,
+                })
+                if res.status_code != 200:
+                    raise AuthError(res.headers.get("x-dropbox-request-id"), res.text)
+                token = res.json()
+                self._access_token = token["access_token"]
+                self._token_expires = time.monotonic() + token["expires_in"] - TOKEN_EXPIRY_MARGIN
+            return self._access_token
+
+    async def _request(self, route, arg, body: bytes = None):
+        """
+        Call a Dropbox API route.
+
+        Parameters
+        ----------
+        route : stone_base.Route
+            The route definition from the SDK, e.g. `dropbox.files.get_metadata`.
+        arg : object
+            Route argument, an instance of the route's argument type.
+        body : bytes, optional
+            Request payload of upload-style routes.
+
+        Returns
+        -------
+        object or tuple
+            The deserialized route result; download-style routes return
+            `(result, content)`.
+
+        Raises
+        ------
+        dropbox.exceptions.ApiError
+            With the deserialized route error if the call failed.
+        """
+        style = route.attrs["style"] or "rpc"
+        host = CONTENT_HOST if route.attrs["host"] == "content" else API_HOST
+        name = route.name if route.version == 1 else f"{route.name}_v{route.version}"
+        url = f"{host}/2/files/{name}"
+        serialized_arg = stone_serializers.json_encode(route.arg_type, arg)
+
+        if style == "rpc":
+            headers = {"Content-Type": "application/json"}
+            content = serialized_arg
+        else:
+            headers = {"Dropbox-API-Arg": serialized_arg}
+            content = body if style == "upload" else None
+            if style == "upload":
+                headers["Content-Type"] = "application/octet-stream"
+
+        refreshed = force_refresh = False
+        attempt = 0
+        while True:
+            headers["Authorization"] = f"Bearer {await self._get_access_token(force_refresh)}"
+            force_refresh = False
+            try:
+                async with self._semaphore:
+                    res = await self.client.post(url, headers=headers, content=content)
+            except httpx.TransportError:
+                if attempt == self.retry_policy.max_retries:
+                    raise
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if res.status_code == 401 and not refreshed:
+                # The token was revoked or expired early; refresh it once, without using up an attempt
+                refreshed = force_refresh = True
+                continue
+            error = self._response_error(route, res)
+            if error is None:
+                break
+            if attempt == self.retry_policy.max_retries or not self.retry_policy.is_retryable(error):
+                raise error
+            await asyncio.sleep(self.retry_policy.backoff(attempt, error))
+            attempt += 1
+
+        if style == "download":
+            raw_result = res.headers["Dropbox-API-Result"]
+        else:
+            raw_result = res.text
+        result = stone_serializers.json_compat_obj_decode(
+            route.result_type, json.loads(raw_result), strict=False
+        )
+        return (result, res.content) if style == "download" else result
+
+    @staticmethod
+    def _response_error(route, res):
+        """
+        Return the `dropbox.exceptions` error matching a failed response, or None on success.
+        """
+        if res.status_code == 200:
+            return None
+        request_id = res.headers.get("x-dropbox-request-id")
+        if res.status_code == 409:
+            obj = res.json()
+            error = stone_serializers.json_compat_obj_decode(route.error_type, obj["error"], strict=False)
+            user_message = obj.get("user_message") or {}
+            return ApiError(request_id, error, user_message.get("text"), user_message.get("locale"))
+        if res.status_code == 429:
+            backoff = res.headers.get("Retry-After")
+            return RateLimitError(request_id, backoff=float(backoff) if backoff else None)
+        if res.status_code == 401:
+            return AuthError(request_id, res.text)
+        if res.status_code >= 500:
+            return InternalServerError(request_id, res.status_code, res.text)
+        return HttpError(request_id, res.status_code, res.text)
+
+    async def _download_content(self, full_path: str) -> bytes:
+        _, content = await self._request(files.download, files.DownloadArg(path=full_path))
+        return content
+
+    async def _upload(self, content, full_path: str):
+        """
+        Upload content to `full_path`, overwriting any existing file.
+
+        Content of 150 MB or more goes through a concurrent upload session
+        whose chunks are sent in parallel.
+        """
+        view = memoryview(content).cast("B")
+        if len(view) < MAX_SINGLE_UPLOAD:
+            arg = files.UploadArg(path=full_path, mode=files.WriteMode.overwrite)
+            return await self._request(files.upload, arg, bytes(view))
+
+        total = len(view)
+        chunk_size = self.upload_chunk_size
+        start = await self._request(
+            files.upload_session_start,
+            files.UploadSessionStartArg(session_type=files.UploadSessionType.concurrent),
+            b"",
+        )
+        workers = asyncio.Semaphore(self.upload_workers)
+
+        async def upload_chunk(offset, close=False):
+            async with workers:
+                # Copy the chunk only when it is about to be sent
+                chunk = bytes(view[offset:offset + chunk_size])
+                cursor = files.UploadSessionCursor(session_id=start.session_id, offset=offset)
+                try:
+                    await self._request(files.upload_session_append_v2,
+                                        files.UploadSessionAppendArg(cursor=cursor, close=close), chunk)
+                except ApiError as err:
+                    # A retry of an append that did land the first time (but whose response
+                    # was lost) is rejected with the offset the session has moved on to
+                    error = err.error
+                    if not (isinstance(error, files.UploadSessionLookupError) and error.is_incorrect_offset() and
+                            error.get_incorrect_offset().correct_offset >= offset + len(chunk)):
+                        raise
+
+        offsets = range(0, total, chunk_size)
+        await asyncio.gather(*(upload_chunk(offset) for offset in offsets[:-1]))
+        # Closing the session must come after every other chunk has landed
+        await upload_chunk(offsets[-1], close=True)
+
+        cursor = files.UploadSessionCursor(session_id=start.session_id, offset=total)
+        commit = files.CommitInfo(path=full_path, mode=files.WriteMode.overwrite)
+        return await self._request(files.upload_session_finish,
+                                   files.UploadSessionFinishArg(cursor=cursor, commit=commit), b"")
+
+    # ------------------------------------------------------------------
+    # Generic read / write
+    # ------------------------------------------------------------------
+
+    async def _base_read(self, dbx_path: str, directory: str, filename: str, loader: callable, **loader_kwargs):
+        """
+        Download a file and decode it with `loader` in a worker thread.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            content = await self._download_content(full_path)
+            return await asyncio.to_thread(loader, content, **loader_kwargs)
+        except Exception as e:
+            print(f"Error reading '{filename}' from Dropbox: {e}")
+            return None
+
+    async def _base_write(self, obj, dbx_path: str, directory: str, filename: str, dumper: callable,
+                          print_success: bool = True, **dumper_kwargs):
+        """
+        Encode `obj` with `dumper` in a worker thread and upload the result.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            content = await asyncio.to_thread(dumper, obj, **dumper_kwargs)
+            md = await self._upload(content, full_path)
+            if print_success:
+                print(f"Uploaded '{filename}' to '{full_path}'")
+            return md
+        except Exception as e:
+            print(f"Error uploading '{filename}' to Dropbox: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Formats
+    # ------------------------------------------------------------------
+
+    async def read_csv(self, dbx_path: str, directory: str, filename: str, **kwargs):
+        """
+        Read a CSV file from Dropbox into a pandas DataFrame.
+
+        See `CSVMixin.read_csv`. Keyword arguments are passed to :func:`pandas.read_csv`.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            DataFrame containing the CSV data, or None if an error occurred.
+        """
+        return await self._base_read(dbx_path, directory, filename, CSVMixin._load_csv, **kwargs)
+
+    async def write_csv(self, df, dbx_path: str, directory: str, filename: str,
+                        print_success: bool = True, **kwargs):
+        """
+        Write a pandas DataFrame to a CSV file on Dropbox.
+
+        See `CSVMixin.write_csv`. Keyword arguments are passed to :meth:`pandas.DataFrame.to_csv`.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        return await self._base_write(df, dbx_path, directory, filename, CSVMixin._dump_csv,
+                                      print_success=print_success, **kwargs)
+
+    async def read_parquet(self, dbx_path: str, directory: str, filename: str, engine='pyarrow', **kwargs):
+        """
+        Read a parquet file from Dropbox into a pandas DataFrame.
+
+        See `ParquetMixin.read_parquet`. Keyword arguments are passed to `pandas.read_parquet`.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            The DataFrame loaded from the parquet file, or None if an error occurs.
+        """
+        return await self._base_read(dbx_path, directory, filename, ParquetMixin._load_parquet,
+                                     engine=engine, **kwargs)
+
+    async def write_parquet(self, df, dbx_path: str, directory: str, filename: str,
+                            print_success=True, engine='pyarrow', **kwargs):
+        """
+        Write a pandas DataFrame to a parquet file on Dropbox.
+
+        See `ParquetMixin.write_parquet`. Keyword arguments are passed to `to_parquet`.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        return await self._base_write(df, dbx_path, directory, filename, ParquetMixin._dump_parquet,
+                                      print_success=print_success, engine=engine, **kwargs)
+
+    async def read_pickle(self, dbx_path: str, directory: str, filename: str):
+        """
+        Download and deserialize a pickle file from Dropbox.
+
+        Returns
+        -------
+        object or None
+            The deserialized Python object if successful, otherwise None.
+        """
+        return await self._base_read(dbx_path, directory, filename, PickleMixin._load_pickle)
+
+    async def write_pickle(self, obj, dbx_path: str, directory: str, filename: str, print_success: bool = True,
+                           out_of_band: bool = False):
+        """
+        Serialize a Python object and upload it to Dropbox as a pickle file.
+
+        See `PickleMixin.write_pickle` for `out_of_band`.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        return await self._base_write(obj, dbx_path, directory, filename, PickleMixin._dump_pickle,
+                                      print_success=print_success, out_of_band=out_of_band)
+
+    async def read_npz(self, dbx_path: str, directory: str, filename: str):
+        """
+        Download and deserialize a `.npz` file from Dropbox into a sparse matrix.
+
+        Returns
+        -------
+        scipy.sparse.spmatrix or None
+            The loaded sparse matrix, or None if an error occurs.
+        """
+        return await self._base_read(dbx_path, directory, filename, NPZMixin._load_sparse_matrix_from_bytes)
+
+    async def write_npz(self, matrix, dbx_path: str, directory: str, filename: str,
+                        print_success: bool = True, **kwargs):
+        """
+        Serialize and upload a sparse matrix as a `.npz` file to Dropbox.
+
+        Keyword arguments are passed to `scipy.sparse.save_npz`.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        return await self._base_write(matrix, dbx_path, directory, filename, NPZMixin._dump_npz,
+                                      print_success=print_success, **kwargs)
+
+    async def read_npy(self, dbx_path: str, directory: str, filename: str):
+        """
+        Download a `.npy` file from Dropbox into a dense array.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The loaded array, or None if an error occurs.
+        """
+        return await self._base_read(dbx_path, directory, filename, NPZMixin._load_npy)
+
+    async def write_npy(self, array, dbx_path: str, directory: str, filename: str, print_success: bool = True):
+        """
+        Serialize and upload a dense array as a `.npy` file to Dropbox.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        return await self._base_write(array, dbx_path, directory, filename, NPZMixin._dump_npy,
+                                      print_success=print_success)
+
+    async def write_bytes(self, file_bytes, dbx_path: str, directory: str, filename: str, print_success=True):
+        """
+        Upload file bytes to Dropbox.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the uploaded file, or None if an error occurred.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            md = await self._upload(file_bytes, full_path)
+            if print_success:
+                print(f"Uploaded '{filename}' to '{full_path}'")
+            return md
+        except Exception as e:
+            print(f"Error uploading '{filename}' to Dropbox: {e}")
+            return None
+
+    async def download_file_directly(self, dbx_path: str, directory: str, filename: str) -> bytes:
+        """
+        Download raw file bytes from Dropbox.
+
+        Returns
+        -------
+        bytes or None
+            File content as bytes, or None if an error occurred.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            return await self._download_content(full_path)
+        except Exception as e:
+            print(f"Error downloading '{filename}' from Dropbox: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Folders and listings
+    # ------------------------------------------------------------------
+
+    async def folder_exists(self, folder_path):
+        """
+        Check if a Dropbox folder exists.
+
+        Returns
+        -------
+        exists : bool
+            True if the folder exists, False if not.
+        """
+        try:
+            await self._request(files.get_metadata, files.GetMetadataArg(path=folder_path))
+            return True
+        except ApiError as err:
+            if not (err.error.is_path() and err.error.get_path().is_not_found()):
+                logging.error(f"Error checking existence of folder '{folder_path}': {err}")
+            return False
+
+    async def create_folder(self, folder_path, return_path=False):
+        """
+        Create a folder in Dropbox if it does not exist.
+
+        Returns
+        -------
+        folder_path : str, optional
+            The path of the created folder if return_path is True.
+        """
+        try:
+            await self._request(files.create_folder_v2, files.CreateFolderArg(path=folder_path))
+            logging.info(f"Folder '{folder_path}' created successfully.")
+        except ApiError as err:
+            if err.error.is_path() and err.error.get_path().is_conflict():
+                logging.info(f"Folder '{folder_path}' already exists.")
+            else:
+                logging.error(f"Failed to create folder '{folder_path}': {err}")
+
+        if return_path:
+            return folder_path
+
+    async def _iter_entries(self, folder_path, recursive=False):
+        """
+        Lazily yield every entry of a Dropbox folder, following all result pages.
+        """
+        result = await self._request(
+            files.list_folder, files.ListFolderArg(path=folder_path, recursive=recursive, limit=2000)
+        )
+        for entry in result.entries:
+            yield entry
+        while result.has_more:
+            result = await self._request(files.list_folder_continue,
+                                         files.ListFolderContinueArg(cursor=result.cursor))
+            for entry in result.entries:
+                yield entry
+
+    async def iter_files(self, folder_path, recursive=False, extensions=None, pattern=None):
+        """
+        Lazily iterate over the files in a Dropbox folder with their metadata.
+
+        See `CoreMixin.iter_files`; use with ``async for``.
+
+        Yields
+        ------
+        dropbox.files.FileMetadata
+            Metadata of each file.
+
+        Raises
+        ------
+        dropbox.exceptions.ApiError
+            If the folder cannot be listed.
+        """
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        if extensions is not None:
+            extensions = tuple(ext.lower() for ext in extensions)
+
+        prefix_len = len(folder_path.rstrip('/')) + 1
+        async for entry in self._iter_entries(folder_path, recursive=recursive):
+            if not isinstance(entry, files.FileMetadata):
+                continue
+            if extensions is not None and not entry.name.lower().endswith(extensions):
+                continue
+            if pattern is not None and not fnmatch.fnmatch(entry.path_display[prefix_len:], pattern):
+                continue
+            yield entry
+
+    async def list_files_in_folder(self, folder_path, recursive=False):
+        """
+        List file names in a Dropbox folder.
+
+        Returns
+        -------
+        file_names : list of str
+            List of file names in the specified folder.
+        """
+        try:
+            return [entry.name async for entry in self._iter_entries(folder_path, recursive=recursive)]
+        except ApiError as err:
+            logging.error(f"Failed to list files in folder '{folder_path}': {err}")
+            return []
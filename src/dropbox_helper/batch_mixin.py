@@ -0,0 +1,157 @@
+import dropbox
+import os
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+# File extension -> format name used by the read_<fmt> / write_<fmt> methods
+FORMATS_BY_EXTENSION = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pkl': 'pickle',
+    '.pickle': 'pickle',
+    '.npz': 'npz',
+    '.npy': 'npy',
+    '.shp': 'shp',
+}
+
+class BatchMixin:
+    """
+    Mixin providing batch operations over many files at once.
+
+    Transfers run concurrently from a bounded thread pool on top of the
+    single-file `read_*` / `write_*` methods of the other mixins, all sharing
+    the helper's HTTP connection pool.
+    """
+
+    @staticmethod
+    def _infer_format(filename: str) -> str:
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in FORMATS_BY_EXTENSION:
+            raise ValueError(f"Cannot infer the format of '{filename}'; pass fmt explicitly.")
+        return FORMATS_BY_EXTENSION[ext]
+
+    def read_many(self, dbx_path: str, directory: str, filenames: list, fmt: str = None,
+                  max_workers: int = 8, concat: bool = False, **kwargs):
+        """
+        Download and load many files concurrently.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Base Dropbox path where the files are stored.
+        directory : str
+            Subdirectory within the base path containing the files.
+        filenames : list of str
+            Names of the files to read.
+        fmt : str, optional
+            Format of the files: 'csv', 'parquet', 'pickle', 'npz', 'npy' or 'shp'.
+            If None, it is inferred from each file's extension.
+        max_workers : int, optional
+            Maximum number of files transferred and decoded at the same time,
+            by default 8.
+        concat : bool, optional
+            If True, concatenate the resulting DataFrames into one, by default False.
+        **kwargs
+            Additional keyword arguments passed to each `read_<fmt>` call.
+
+        Returns
+        -------
+        list or pandas.DataFrame or None
+            The loaded objects in the order of `filenames` (None for files that
+            failed to load), or a single DataFrame if `concat` is True, in which
+            case failed files are left out; None if they all failed.
+        """
+        def read_one(filename):
+            reader = getattr(self, f"read_{fmt or self._infer_format(filename)}")
+            return reader(dbx_path, directory, filename, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(read_one, filenames))
+
+        if concat:
+            frames = [df for df in results if df is not None]
+            if not frames:
+                print(f"Error reading files from Dropbox: none of the {len(filenames)} files could be loaded")
+                return None
+            return pd.concat(frames, ignore_index=True)
+        return results
+
+    def write_many(self, objs: dict, dbx_path: str, directory: str, fmt: str = None,
+                   max_workers: int = 8, print_success: bool = True, **kwargs):
+        """
+        Serialize and upload many files concurrently, committing them in one batch.
+
+        Each object is serialized and uploaded into its own upload session from
+        a thread pool; all sessions are then committed together with
+        `files_upload_session_finish_batch_v2`, which avoids the namespace lock
+        contention of many concurrent single-file commits.
+
+        Parameters
+        ----------
+        objs : dict
+            Mapping of file name to the object to write, e.g.
+            `{'ITA.pkl': model_ita, 'FRA.pkl': model_fra}`.
+        dbx_path : str
+            Base Dropbox path where the files will be saved.
+        directory : str
+            Subdirectory within the base path where the files will be saved.
+        fmt : str, optional
+            Format of the files: 'csv', 'parquet', 'pickle', 'npz' or 'npy'.
+            If None, it is inferred from each file's extension.
+        max_workers : int, optional
+            Maximum number of files serialized and uploaded at the same time,
+            by default 8.
+        print_success : bool, optional
+            Whether to print a message for each uploaded file, by default True.
+        **kwargs
+            Additional keyword arguments passed to the serializer, e.g.
+            `index=False` for CSV.
+
+        Returns
+        -------
+        dict
+            Mapping of file name to the uploaded file's
+            `dropbox.files.FileMetadata`, or to the error if that file failed.
+        """
+        def upload_one(filename):
+            file_fmt = fmt or self._infer_format(filename)
+            dumper = getattr(self, f"_dump_{file_fmt}", None)
+            if dumper is None:
+                raise ValueError(f"write_many does not support the '{file_fmt}' format.")
+            full_path = self._construct_path(dbx_path, directory, filename)
+            session_id, total = self._upload_to_session(dumper(objs[filename], **kwargs), full_path=full_path)
+            return dropbox.files.UploadSessionFinishArg(
+                cursor=dropbox.files.UploadSessionCursor(session_id=session_id, offset=total),
+                commit=dropbox.files.CommitInfo(path=full_path, mode=dropbox.files.WriteMode.overwrite),
+            )
+
+        def try_upload_one(filename):
+            try:
+                return upload_one(filename)
+            except Exception as e:
+                return e
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            uploaded = dict(zip(objs, pool.map(try_upload_one, objs)))
+
+        entries = []
+        for filename, entry in uploaded.items():
+            if isinstance(entry, Exception):
+                results[filename] = entry
+            else:
+                entries.append((filename, entry))
+
+        outcomes = self._finish_upload_sessions([entry for _, entry in entries])
+        for (filename, _), outcome in zip(entries, outcomes):
+            results[filename] = outcome
+
+        # Report in the order the files were given
+        results = {filename: results[filename] for filename in objs}
+        for filename, outcome in results.items():
+            if isinstance(outcome, dropbox.files.FileMetadata):
+                if print_success:
+                    print(f"Uploaded '{filename}' to '{outcome.path_display}'")
+            else:
+                print(f"Error uploading '{filename}' to Dropbox: {outcome}")
+        return results
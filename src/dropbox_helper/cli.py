@@ -0,0 +1,42 @@
+import argparse
+from . import get_dbx_helper
+
+def main(argv=None):
+    """
+    Command line entry point, e.g. `dropbox-helper sync-down /input/raw ./raw`
+    or `dropbox-helper sync-up ./results /output/results`.
+
+    Credentials are read from the DROPBOX_TOKEN, DROPBOX_KEY and
+    DROPBOX_SECRET environment variables (or a `.env` file).
+    """
+    parser = argparse.ArgumentParser(prog="dropbox-helper", description="Dropbox helper utilities.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_down = subparsers.add_parser("sync-down", help="Mirror a Dropbox folder to a local directory.")
+    sync_down.add_argument("dbx_folder", help="Dropbox folder to download, e.g. /input/raw.")
+    sync_down.add_argument("local_dir", help="Local directory to mirror into.")
+    sync_down.add_argument("--workers", type=int, default=8, help="Number of concurrent downloads (default: 8).")
+    sync_down.add_argument("--ext", nargs="*", default=None, help="Only sync files with these extensions.")
+    sync_down.add_argument("--pattern", default=None, help="Only sync files whose relative path matches this glob.")
+
+    sync_up = subparsers.add_parser("sync-up", help="Mirror a local directory to a Dropbox folder.")
+    sync_up.add_argument("local_dir", help="Local directory to upload.")
+    sync_up.add_argument("dbx_folder", help="Destination Dropbox folder, e.g. /output/run1.")
+    sync_up.add_argument("--workers", type=int, default=8, help="Number of concurrent uploads (default: 8).")
+    sync_up.add_argument("--ext", nargs="*", default=None, help="Only sync files with these extensions.")
+    sync_up.add_argument("--pattern", default=None, help="Only sync files whose relative path matches this glob.")
+
+    args = parser.parse_args(argv)
+    dbx_helper = get_dbx_helper(max_connections=max(16, args.workers))
+
+    if args.command == "sync-down":
+        summary = dbx_helper.sync_down(args.dbx_folder, args.local_dir, max_workers=args.workers,
+                                       extensions=args.ext, pattern=args.pattern)
+        return 1 if summary["failed"] else 0
+    if args.command == "sync-up":
+        summary = dbx_helper.sync_up(args.local_dir, args.dbx_folder, max_workers=args.workers,
+                                     extensions=args.ext, pattern=args.pattern)
+        return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
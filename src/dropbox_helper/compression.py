@@ -0,0 +1,174 @@
+import contextlib
+import gzip
+import io
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, see the `zstd` extra
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # optional dependency, see the `lz4` extra
+    lz4 = None
+
+# File extension of each supported codec
+CODECS = {"gzip": ".gz", "zstd": ".zst", "lz4": ".lz4"}
+# Leading bytes of a compressed stream of each codec
+MAGIC_BYTES = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\x04\x22\x4d\x18": "lz4",
+}
+
+def parse_compression(compression, filename: str = None):
+    """
+    Split a `compression` argument into a codec name and its options.
+
+    Parameters
+    ----------
+    compression : str, dict or None
+        None for no compression, a codec name ('gzip', 'zstd' or 'lz4'),
+        'infer' to pick the codec from the extension of `filename`, or a dict
+        with a 'method' key and codec options, e.g.
+        ``{'method': 'zstd', 'level': 10, 'threads': -1}``.
+    filename : str, optional
+        Name of the file, used with 'infer'.
+
+    Returns
+    -------
+    method : str or None
+        The codec name, or None for uncompressed data.
+    options : dict
+        Options for `compressed_writer`: 'level' and, for zstd, 'threads'.
+
+    Raises
+    ------
+    ValueError
+        If the codec is not supported.
+    """
+    options = {}
+    if isinstance(compression, dict):
+        options = dict(compression)
+        compression = options.pop("method", None)
+    if compression == "infer":
+        compression = infer_compression(filename)
+    if compression is not None and compression not in CODECS:
+        raise ValueError(f"Unsupported compression '{compression}', expected one of {sorted(CODECS)}")
+    return compression, options
+
+def infer_compression(filename: str = None) -> str | None:
+    """
+    Return the codec matching the extension of `filename`, or None.
+    """
+    if filename:
+        for method, extension in CODECS.items():
+            if filename.lower().endswith(extension):
+                return method
+    return None
+
+def detect_compression(head: bytes) -> str | None:
+    """
+    Return the codec whose magic bytes start `head`, or None.
+    """
+    for magic, method in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return method
+    return None
+
+@contextlib.contextmanager
+def compressed_writer(f, method: str = None, level: int = None, threads: int = None):
+    """
+    Wrap a writable binary file object so that data written to it is compressed.
+
+    The compressed stream is finished on exit, but `f` itself is left open.
+    Output is deterministic (no timestamps or file names in the gzip
+    header), so identical data compresses to identical bytes.
+
+    Parameters
+    ----------
+    f : file object
+        Writable binary file object receiving the compressed data.
+    method : str, optional
+        Codec name; if None, `f` is yielded unchanged.
+    level : int, optional
+        Compression level. Defaults favour speed: 6 for gzip, 3 for zstd and
+        0 for lz4.
+    threads : int, optional
+        Number of zstd worker threads, -1 for one per CPU core. Ignored by
+        the other codecs.
+
+    Yields
+    ------
+    file object
+        Writable binary file object.
+    """
+    if method is None:
+        yield f
+        return
+
+    if method == "gzip":
+        writer = gzip.GzipFile(filename="", mode="wb", fileobj=f, mtime=0,
+                               compresslevel=6 if level is None else level)
+    elif method == "zstd":
+        cctx = _require(zstandard, method).ZstdCompressor(level=3 if level is None else level,
+                                                          threads=threads or 0)
+        # Buffered, so that pandas recognises it as a binary file object
+        writer = io.BufferedWriter(cctx.stream_writer(f, closefd=False))
+    elif method == "lz4":
+        writer = _require(lz4, method).frame.LZ4FrameFile(f, mode="wb", compression_level=level or 0)
+    else:
+        raise ValueError(f"Unsupported compression '{method}', expected one of {sorted(CODECS)}")
+
+    with writer:
+        yield writer
+
+def open_decompressed(f, compression="infer", filename: str = None):
+    """
+    Wrap a readable binary file object so that reads return decompressed data.
+
+    Parameters
+    ----------
+    f : file object
+        Readable binary file object, such as a download stream.
+    compression : str or None, optional
+        Codec name, None if the data is not compressed, or 'infer' (default)
+        to pick the codec from the extension of `filename` or, failing that,
+        from the magic bytes at the start of the data.
+    filename : str, optional
+        Name of the file, used with 'infer'.
+
+    Returns
+    -------
+    file object
+        Readable binary file object over the decompressed data, or `f` itself
+        if the data isn't compressed.
+    """
+    if isinstance(compression, dict):
+        compression = compression.get("method")
+    if compression == "infer":
+        compression = infer_compression(filename)
+        if compression is None:
+            if not hasattr(f, "peek"):
+                f = io.BufferedReader(f)
+            compression = detect_compression(f.peek(4)[:4])
+
+    if compression is None:
+        return f
+    if compression == "gzip":
+        return gzip.GzipFile(mode="rb", fileobj=f)
+    if compression == "zstd":
+        reader = _require(zstandard, compression).ZstdDecompressor().stream_reader(f, closefd=False)
+        # Buffered, since pickle and pandas expect `readline` and `peek`
+        return io.BufferedReader(reader)
+    if compression == "lz4":
+        return _require(lz4, compression).frame.LZ4FrameFile(f, mode="rb")
+    raise ValueError(f"Unsupported compression '{compression}', expected one of {sorted(CODECS)}")
+
+def _require(module, method: str):
+    if module is None:
+        raise ImportError(
+            f"{method} compression requires an optional dependency. "
+            f"Install it with `pip install dropbox-helper[{method}]`."
+        )
+    return module
@@ -0,0 +1,72 @@
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Dropbox hashes files in blocks of 4 MiB
+BLOCK_SIZE = 4 * 1024 * 1024
+# Below this size the blocks are hashed on the calling thread
+PARALLEL_THRESHOLD = 16 * BLOCK_SIZE
+
+class ContentHashMismatch(IOError):
+    """
+    Downloaded data doesn't match the Dropbox `content_hash` or size of the
+    file, typically because the file changed since its metadata was fetched.
+    """
+
+def content_hash(data) -> str:
+    """
+    Compute the Dropbox `content_hash` of in-memory data.
+
+    The file is split into 4 MiB blocks, each block is hashed with SHA-256,
+    and the hash of the concatenated block digests is returned, as described
+    in https://www.dropbox.com/developers/reference/content-hash.
+
+    Blocks are hashed straight from `memoryview` slices without copies, and
+    for large inputs in parallel threads (hashlib releases the GIL).
+
+    Parameters
+    ----------
+    data : bytes-like
+        The file content.
+
+    Returns
+    -------
+    str
+        Hex digest matching `FileMetadata.content_hash`.
+    """
+    view = memoryview(data).cast("B")
+
+    def hash_block(start):
+        return hashlib.sha256(view[start:start + BLOCK_SIZE]).digest()
+
+    starts = range(0, len(view), BLOCK_SIZE)
+    if len(view) < PARALLEL_THRESHOLD:
+        digests = map(hash_block, starts)
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            digests = list(pool.map(hash_block, starts))
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
+def file_content_hash(path: str) -> str:
+    """
+    Compute the Dropbox `content_hash` of a local file.
+
+    The file is memory-mapped rather than read into memory.
+
+    Parameters
+    ----------
+    path : str
+        Path of the local file.
+
+    Returns
+    -------
+    str
+        Hex digest matching `FileMetadata.content_hash`.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files can't be memory-mapped
+            return content_hash(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return content_hash(mapped)
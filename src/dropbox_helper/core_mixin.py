@@ -1,6 +1,41 @@
+import contextlib
 import dropbox
+import fnmatch
+import io
 import logging
+import mmap
 import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dropbox.session import DEFAULT_TIMEOUT
+from .content_hash import ContentHashMismatch, content_hash, file_content_hash
+from .disk_cache import DiskCache
+from .download_progress import DownloadProgress
+from .metadata_cache import MetadataCache
+from .object_cache import MISSING, ObjectCache
+from .remote_file import DropboxFile
+from .upload_checkpoint import UploadCheckpoint
+from .upload_stream import UploadStream
+from .transport import RetryingDropbox, RetryPolicy, TokenBucket, is_too_many_write_operations
+
+# Chunks of a concurrent upload session must be multiples of 4 MiB
+UPLOAD_BLOCK_SIZE = 4 * 1024 * 1024
+# Largest payload a single upload request may carry
+MAX_SINGLE_UPLOAD = 150 * 1024 * 1024
+# files_upload_session_finish_batch_v2 accepts at most 1000 entries per call
+FINISH_BATCH_SIZE = 1000
+# Downloads are streamed to their destination in blocks of this size
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+# files_create_folder_batch accepts at most 10000 paths per call
+CREATE_FOLDER_BATCH_SIZE = 10000
+# Temporary links are valid for four hours; refresh them well before that
+TEMPORARY_LINK_TTL = 3 * 60 * 60
+# At most this many temporary links are kept for reuse, least recently used first out
+TEMPORARY_LINK_CACHE_SIZE = 1024
 
 class CoreMixin:
     """
@@ -10,7 +45,12 @@ class CoreMixin:
     create folders, list files, and upload files or logs.
     """
 
-    def __init__(self, dbx_token, dbx_key, dbx_secret, input_path = '/input', output_path = '/output', custom_paths=False):
+    def __init__(self, dbx_token, dbx_key, dbx_secret, input_path = '/input', output_path = '/output', custom_paths=False,
+                 cache_dir=None, cache_size_mb=10240,
+                 upload_chunk_size=32 * 1024 * 1024, upload_workers=4, max_connections=16,
+                 state_dir=None, skip_if_unchanged=False,
+                 max_retries=5, requests_per_second=None, raise_on_error=False, object_cache_mb=None,
+                 metadata_ttl=60):
         """
         Initialize the CoreMixin with Dropbox authentication and paths.
 
@@ -28,15 +68,74 @@ class CoreMixin:
             Base path in Dropbox for output data.
         custom_paths : bool, optional
             Whether to use custom input/output paths, by default False.
+        cache_dir : str or None, optional
+            Local directory for the persistent download cache. If None (default),
+            downloads are not cached.
+        cache_size_mb : float, optional
+            Maximum size of the download cache in megabytes, by default 10240.
+        upload_chunk_size : int, optional
+            Size in bytes of each chunk of a chunked upload, rounded down to a
+            multiple of 4 MiB. Default is 32 MiB.
+        upload_workers : int, optional
+            Number of chunks uploaded concurrently by a chunked upload, by default 4.
+        max_connections : int, optional
+            Size of the HTTP connection pool shared by all requests, by default 16.
+            Should be at least the number of threads used for concurrent transfers.
+        state_dir : str or None, optional
+            Local directory where persistent state such as listing cursors is
+            kept, along with the unpacked files of memory-mapped reads.
+            Defaults to `~/.dropbox_helper`.
+        skip_if_unchanged : bool, optional
+            Default for writes: if True, skip uploads whose content hash matches
+            the file already on Dropbox. By default False.
+        max_retries : int, optional
+            Number of times a request is retried after a rate-limit error, a
+            server error or a dropped connection, with exponential backoff and
+            jitter. By default 5.
+        requests_per_second : float or TokenBucket, optional
+            Client-side rate limit shared by all threads using this helper. Pass
+            a `TokenBucket` to share one limit between several helpers. By
+            default requests are not rate limited.
+        raise_on_error : bool, optional
+            If True, reads and writes raise errors that persist after retries
+            instead of printing them and returning None. By default False.
+        object_cache_mb : float or None, optional
+            Memory budget in megabytes of an in-process cache of decoded
+            objects (DataFrames, arrays, ...), so that files read repeatedly
+            are only downloaded and parsed again after they change. If None
+            (default), decoded objects are not cached.
+        metadata_ttl : float, optional
+            Number of seconds file and folder metadata seen in listings, uploads
+            and folder creation is trusted for existence checks and cache
+            revalidation, by default 60. Use 0 to always ask Dropbox.
         """
-        self.dbx = dropbox.Dropbox(
+        if requests_per_second is None or isinstance(requests_per_second, TokenBucket):
+            rate_limiter = requests_per_second
+        else:
+            rate_limiter = TokenBucket(requests_per_second)
+        self.retry_policy = RetryPolicy(max_retries=max_retries, rate_limiter=rate_limiter)
+        # Shared by the SDK client and the ranged downloads made over temporary links
+        self.http_session = dropbox.create_session(max_connections=max_connections)
+        self.dbx = RetryingDropbox(
             oauth2_refresh_token=dbx_token,
             app_key=dbx_key,
             app_secret=dbx_secret,
+            session=self.http_session,
+            retry_policy=self.retry_policy,
         )
         self.input_path = input_path
         self.output_path = output_path
         self.custom_paths = custom_paths
+        self.cache = DiskCache(cache_dir, cache_size_mb) if cache_dir else None
+        self.object_cache = ObjectCache(object_cache_mb) if object_cache_mb else None
+        self.metadata_cache = MetadataCache(metadata_ttl) if metadata_ttl else None
+        self.upload_chunk_size = upload_chunk_size
+        self.upload_workers = upload_workers
+        self.skip_if_unchanged = skip_if_unchanged
+        self.raise_on_error = raise_on_error
+        self.state_dir = os.path.expanduser(state_dir or os.path.join('~', '.dropbox_helper'))
+        self._temporary_links = OrderedDict()
+        self._temporary_links_lock = threading.Lock()
     
     def _construct_path(self, dbx_path: str, directory: str, filename: str) -> str:
         return os.path.join(dbx_path, directory, filename)
@@ -47,80 +146,915 @@ class CoreMixin:
                    filename: str,
                    downloader: callable,
                    loader: callable,
+                   stream: bool = False,
+                   max_bytes: int = None,
+                   seekable: bool = False,
                    **loader_kwargs):
         """
         Generic downloader + loader wrapper.
+
+        By default the loader receives the full file content as bytes. With
+        `stream=True` it instead receives a binary file-like object reading
+        from the HTTP response, so it can stop early; `max_bytes` then limits
+        the download to the first `max_bytes` bytes of the file. With
+        `seekable=True` as well, the file object supports random access and
+        only the byte ranges the loader reads are downloaded.
+
+        With the object cache enabled, the decoded object is cached per file
+        revision, loader and loader arguments, and a repeated read only costs
+        a metadata lookup to check the revision.
         """
         full_path = self._construct_path(dbx_path, directory, filename)
         try:
-            _, res = downloader(full_path)
-            return loader(res.content, **loader_kwargs)
+            if self.object_cache is not None:
+                rev = self._get_metadata(full_path).rev
+                key = ObjectCache.make_key(full_path, rev, loader, stream=stream, max_bytes=max_bytes,
+                                           seekable=seekable, **loader_kwargs)
+                obj = self.object_cache.get(key)
+                if obj is not MISSING:
+                    return obj
+
+            if stream:
+                with self._open_stream(full_path, max_bytes=max_bytes, seekable=seekable) as f:
+                    obj = loader(f, **loader_kwargs)
+            else:
+                content = self._download_content(full_path, downloader)
+                obj = loader(content, **loader_kwargs)
+
+            if self.object_cache is not None:
+                self.object_cache.put(key, obj)
+            return obj
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error reading '{filename}' from Dropbox: {e}")
+            return None
+
+    def _download_content(self, full_path: str, downloader: callable = None) -> bytearray:
+        """
+        Download a file's bytes, going through the disk cache when it is enabled.
+
+        With a cache, the remote `content_hash` is checked first (from the
+        metadata cache or a cheap `files_get_metadata` call) and the download is skipped if an identical copy
+        is already on local disk; on a miss the file is streamed to the cache
+        with `_download_to_file`. Without a cache the response is read into a
+        preallocated buffer in fixed-size blocks. Either way, a dropped
+        connection resumes with a Range request from the last byte received,
+        and the result is checked against the Dropbox `content_hash`.
+
+        Parameters
+        ----------
+        full_path : str
+            Full Dropbox path of the file.
+        downloader : callable, optional
+            Callable returning `(metadata, response)` for a path, by default
+            `self.dbx.files_download`.
+
+        Returns
+        -------
+        bytearray
+            The file content.
+        """
+        if downloader is None:
+            downloader = self.dbx.files_download
+
+        if self.cache is None:
+            md, res = downloader(full_path)
+            buffer = bytearray(md.size)
+            view = memoryview(buffer)
+
+            def write(pos, block):
+                view[pos:pos + len(block)] = block
+
+            with res:
+                pos = self._copy_blocks(res, 0, md.size, write, raise_errors=False)
+            if pos < md.size:
+                self._stream_range(full_path, pos, md.size, write)
+            self._verify_content_hash(full_path, md, content_hash(buffer))
+            return buffer
+
+        md = self._get_metadata(full_path)
+        local_path = self.cache.get(full_path, md.content_hash)
+        if local_path is None:
+            try:
+                local_path = self._download_to_cache(full_path, md)
+            except ContentHashMismatch:
+                if self.metadata_cache is None:
+                    raise
+                # The file may have changed since its metadata was cached
+                self.metadata_cache.invalidate(full_path)
+                local_path = self._download_to_cache(full_path, self._get_metadata(full_path))
+        with open(local_path, "rb") as f:
+            # Read straight into the returned buffer, without an intermediate bytes copy
+            buffer = bytearray(os.fstat(f.fileno()).st_size)
+            f.readinto(buffer)
+            return buffer
+
+    def _download_to_cache(self, full_path: str, md) -> str:
+        with self.cache.entry_lock(full_path, md.content_hash):
+            # Another thread may have downloaded it while we waited
+            local_path = self.cache.get(full_path, md.content_hash)
+            if local_path is not None:
+                return local_path
+            tmp_path = self.cache.partial_path(full_path, md.content_hash)
+            self._download_to_file(full_path, tmp_path, md=md)
+            return self.cache.commit(full_path, md.content_hash, tmp_path)
+
+    def _materialize(self, full_path: str, extract: callable, md=None) -> str:
+        """
+        Unpack a Dropbox file into a local directory that can be memory-mapped.
+
+        The file is streamed to disk and `extract(local_file, directory)`
+        writes the unpacked files into a fresh directory, which is then
+        atomically renamed into `state_dir/mmap`. The directory is named after
+        the path and `content_hash`, so it is reused as long as the file is
+        unchanged, and processes on the same node map the same files and
+        share one copy in the page cache. Directories of older versions of
+        the file are removed.
+
+        Parameters
+        ----------
+        full_path : str
+            Full Dropbox path of the file.
+        extract : callable
+            Called with the downloaded file and the directory to fill; it may
+            move the downloaded file into the directory.
+        md : dropbox.files.FileMetadata, optional
+            Metadata of the file, if already known.
+
+        Returns
+        -------
+        str
+            Local path of the directory.
+        """
+        if md is None:
+            md = self._get_metadata(full_path)
+        key = DiskCache._path_key(full_path)
+        local_dir = os.path.join(self._mmap_dir, f"{key}.{md.content_hash}")
+        if os.path.isdir(local_dir):
+            return local_dir
+
+        os.makedirs(self._mmap_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f"{key}.", suffix=".tmp", dir=self._mmap_dir)
+        try:
+            source = os.path.join(tmp_dir, ".download")
+            try:
+                self._download_to_file(full_path, source, md=md)
+            except ContentHashMismatch:
+                if self.metadata_cache is None:
+                    raise
+                # The file may have changed since its metadata was cached; retry once
+                self.metadata_cache.invalidate(full_path)
+                md = self._get_metadata(full_path)
+                local_dir = os.path.join(self._mmap_dir, f"{key}.{md.content_hash}")
+                self._download_to_file(full_path, source, md=md)
+            extract(source, tmp_dir)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(source)
+            try:
+                os.rename(tmp_dir, local_dir)
+            except OSError:
+                # Another process unpacked the same version first
+                if not os.path.isdir(local_dir):
+                    raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        for name in os.listdir(self._mmap_dir):
+            entry = os.path.join(self._mmap_dir, name)
+            if name.startswith(f"{key}.") and not name.endswith(".tmp") and entry != local_dir:
+                # Open maps of the old files stay valid on POSIX systems
+                shutil.rmtree(entry, ignore_errors=True)
+        return local_dir
+
+    @property
+    def _mmap_dir(self) -> str:
+        return os.path.join(self.state_dir, "mmap")
+
+    def _read_mapped(self, full_path, filename, md, extract, load):
+        """
+        Unpack a file with `extract` for memory mapping, then open it with `load(local_dir)`.
+        """
+        try:
+            return load(self._materialize(full_path, extract, md=md))
         except Exception as e:
+            if self.raise_on_error:
+                raise
             print(f"Error reading '{filename}' from Dropbox: {e}")
             return None
 
+    def download_to_file(self, dbx_path: str, directory: str, filename: str, local_path: str,
+                         segments: int = 1, verify: bool = True):
+        """
+        Download a Dropbox file straight to local disk.
+
+        The file is streamed to `<local_path>.part` in fixed-size blocks, so
+        memory use doesn't grow with the file size. Dropped connections are
+        resumed with HTTP Range requests from the last byte written, also
+        across calls: an interrupted download of the same file version picks
+        up where it left off. Once complete, the file is checked against the
+        Dropbox `content_hash` and atomically renamed to `local_path`.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Base Dropbox path where the file is located.
+        directory : str
+            Subdirectory within the base path for the file.
+        filename : str
+            Name of the file to download.
+        local_path : str
+            Destination path on local disk. Parent directories are created.
+        segments : int, optional
+            Number of byte ranges of the file downloaded in parallel, by
+            default 1. Several segments help saturate fast links for large files.
+        verify : bool, optional
+            Whether to check the downloaded file against the Dropbox
+            `content_hash`, by default True.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata or None
+            Metadata of the downloaded file, or None if an error occurred.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            return self._download_to_file(full_path, local_path, segments=segments, verify=verify)
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error downloading '{filename}' from Dropbox: {e}")
+            return None
+
+    def _download_to_file(self, full_path: str, local_path: str, segments: int = 1,
+                          verify: bool = True, md=None):
+        """
+        Stream a Dropbox file to a local path without holding it in memory.
+
+        The data is written to `<local_path>.part`, which is then atomically
+        renamed, so readers never see a partial file. Progress is kept in a
+        `<local_path>.part.json` sidecar so that a later call for the same
+        file version resumes instead of starting over.
+
+        A fresh single-segment download is one `files_download` request;
+        segments and resumed downloads use Range requests on a temporary link.
+
+        Parameters
+        ----------
+        full_path : str
+            Full Dropbox path of the file.
+        local_path : str
+            Destination path on local disk. Parent directories are created.
+        segments : int, optional
+            Number of byte ranges downloaded in parallel, by default 1.
+        verify : bool, optional
+            Whether to check the result against the Dropbox `content_hash`.
+        md : dropbox.files.FileMetadata, optional
+            Metadata of the file, if already known.
+
+        Returns
+        -------
+        dropbox.files.FileMetadata
+            Metadata of the downloaded file.
+        """
+        if md is None:
+            md = self.dbx.files_get_metadata(full_path)
+        os.makedirs(os.path.dirname(os.path.abspath(local_path)), exist_ok=True)
+        tmp_path = f"{local_path}.part"
+        progress = DownloadProgress(f"{tmp_path}.json", md, segments, resume=os.path.exists(tmp_path))
+
+        try:
+            with open(tmp_path, "ab") as f:
+                if f.tell() != md.size:
+                    f.truncate(md.size)
+
+            def download_segment(index):
+                pos, end = progress.positions[index], progress.segments[index][1]
+                if pos >= end:
+                    return
+                # Unbuffered, so every block reported to `progress` is already in the file
+                with open(tmp_path, "r+b", buffering=0) as f:
+                    def write(offset, block):
+                        f.seek(offset)
+                        f.write(block)
+                        progress.advance(index, offset + len(block))
+
+                    if pos == 0 and len(progress.segments) == 1:
+                        # The whole file needs no temporary link; ranges only resume a broken response
+                        _, res = self.dbx.files_download(full_path)
+                        with res:
+                            pos = self._copy_blocks(res, 0, end, write, raise_errors=False)
+                    if pos < end:
+                        self._stream_range(full_path, pos, end, write)
+
+            if len(progress.segments) == 1:
+                download_segment(0)
+            else:
+                with ThreadPoolExecutor(max_workers=len(progress.segments)) as pool:
+                    list(pool.map(download_segment, range(len(progress.segments))))
+        except BaseException:
+            progress.save()
+            raise
+
+        if verify:
+            try:
+                self._verify_content_hash(full_path, md, file_content_hash(tmp_path))
+            except ContentHashMismatch:
+                progress.discard()
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, local_path)
+        progress.discard()
+        return md
+
+    def _stream_range(self, full_path: str, start: int, end: int, write: callable):
+        """
+        Stream bytes `start` to `end` (exclusive) of a file to `write(offset, block)`.
+
+        Transient failures, including a response that stops early, are
+        retried with the retry policy's backoff, resuming from the last byte
+        received; the retry budget is reset whenever data gets through.
+        """
+        pos = start
+        failures = 0
+        while pos < end:
+            try:
+                res = self._request_range(full_path, pos, end - 1, stream=True)
+                with res:
+                    if res.status_code == 416:
+                        # The file is shorter than its metadata says
+                        raise ContentHashMismatch(f"'{full_path}' changed on Dropbox during the download")
+                    res.raise_for_status()
+                    if res.status_code != 206 and pos != 0:
+                        raise IOError(f"Range request for '{full_path}' returned HTTP {res.status_code}")
+                    new_pos = self._copy_blocks(res, pos, end, write)
+            except Exception as err:
+                if failures == self.retry_policy.max_retries or not self.retry_policy.is_retryable(err):
+                    raise
+                new_pos = pos
+                delay = self.retry_policy.backoff(failures, err)
+                logging.warning(f"Download of '{full_path}' interrupted at byte {pos} ({err!r}); "
+                                f"resuming in {delay:.1f}s")
+                time.sleep(delay)
+            if new_pos > pos:
+                failures = 0
+            else:
+                failures += 1
+                if failures > self.retry_policy.max_retries:
+                    raise IOError(f"Download of '{full_path}' stalled at byte {pos}")
+            pos = new_pos
+
+    def _copy_blocks(self, res, pos: int, end: int, write: callable, raise_errors: bool = True) -> int:
+        """
+        Copy a streaming response to `write(offset, block)` from offset `pos`.
+
+        Returns the offset reached, which is short of `end` if the response
+        ended early or, with `raise_errors=False`, was interrupted by a
+        transient error.
+        """
+        try:
+            for block in res.iter_content(chunk_size=DOWNLOAD_BLOCK_SIZE):
+                block = block[:end - pos]
+                write(pos, block)
+                pos += len(block)
+                if pos >= end:
+                    break
+        except Exception as err:
+            if raise_errors or not self.retry_policy.is_retryable(err):
+                raise
+            logging.warning(f"Download interrupted at byte {pos} ({err!r}); resuming")
+        return pos
+
+    @staticmethod
+    def _verify_content_hash(full_path: str, md, actual: str):
+        if md.content_hash is not None and actual != md.content_hash:
+            raise ContentHashMismatch(f"Downloaded content of '{full_path}' doesn't match its Dropbox content_hash")
+
+    @contextlib.contextmanager
+    def _open_stream(self, full_path: str, max_bytes: int = None, seekable: bool = False):
+        """
+        Open a streaming binary reader over a Dropbox file.
+
+        A cached copy is used when the disk cache holds the current version;
+        otherwise the file is read straight from the HTTP response without
+        being buffered in memory. Closing the reader early aborts the download.
+
+        Parameters
+        ----------
+        full_path : str
+            Full Dropbox path of the file.
+        max_bytes : int, optional
+            If given, only the first `max_bytes` bytes are requested, using an
+            HTTP Range request on a temporary link.
+        seekable : bool, optional
+            If True, yield a seekable `DropboxFile` that downloads only the
+            byte ranges that are read, by default False.
+
+        Yields
+        ------
+        io.BufferedIOBase
+            Binary file-like object over the file content.
+        """
+        if self.cache is not None:
+            md = self._get_metadata(full_path)
+            local_path = self.cache.get(full_path, md.content_hash)
+            if local_path is not None:
+                with open(local_path, "rb") as f:
+                    yield f
+                return
+
+        if seekable:
+            with DropboxFile(self, full_path) as f:
+                yield f
+            return
+
+        if max_bytes is None:
+            _, res = self.dbx.files_download(full_path)
+        else:
+            def open_range():
+                res = self._request_range(full_path, 0, max_bytes - 1, stream=True)
+                # Raised inside the retried call, so 429 and 5xx responses are retried
+                if res.status_code != 416 and not res.ok:
+                    res.close()
+                    res.raise_for_status()
+                return res
+
+            res = self.retry_policy.call(open_range)
+            if res.status_code == 416:
+                # Range not satisfiable: the file is empty
+                res.close()
+                yield io.BytesIO(b"")
+                return
+
+        with res:
+            res.raw.decode_content = True
+            yield io.BufferedReader(res.raw)
+
+    def _request_range(self, full_path: str, start: int, end: int = None, stream: bool = False):
+        """
+        Issue an HTTP Range request for bytes `start` to `end` (inclusive) of a file.
+
+        Returns the `requests.Response`; with `stream=True` the caller must close it.
+        """
+        headers = {"Range": f"bytes={start}-{'' if end is None else end}"}
+        res = self.http_session.get(self._get_temporary_link(full_path), headers=headers,
+                                    stream=stream, timeout=DEFAULT_TIMEOUT)
+        if res.status_code == 410:
+            # The temporary link expired early; fetch a new one and try again
+            res.close()
+            with self._temporary_links_lock:
+                self._temporary_links.pop(full_path.lower(), None)
+            res = self.http_session.get(self._get_temporary_link(full_path), headers=headers,
+                                        stream=stream, timeout=DEFAULT_TIMEOUT)
+        return res
+
+    def _download_range(self, full_path: str, start: int, end: int) -> bytes:
+        """
+        Download bytes `start` to `end` (inclusive) of a file, retrying transient failures.
+        """
+        def fetch():
+            res = self._request_range(full_path, start, end)
+            res.raise_for_status()
+            return res.content
+
+        return self.retry_policy.call(fetch)
+
+    def _get_temporary_link(self, full_path: str) -> str:
+        """
+        Return a temporary direct-download link for a file, reusing recent ones.
+
+        Temporary links accept HTTP Range headers, which the SDK's
+        `files_download` does not expose. Up to `TEMPORARY_LINK_CACHE_SIZE`
+        links are kept, evicting the least recently used.
+        """
+        key = full_path.lower()
+        with self._temporary_links_lock:
+            link, expires = self._temporary_links.get(key, (None, 0))
+            if time.monotonic() < expires:
+                self._temporary_links.move_to_end(key)
+                return link
+
+        link = self.dbx.files_get_temporary_link(full_path).link
+        with self._temporary_links_lock:
+            self._temporary_links[key] = (link, time.monotonic() + TEMPORARY_LINK_TTL)
+            self._temporary_links.move_to_end(key)
+            while len(self._temporary_links) > TEMPORARY_LINK_CACHE_SIZE:
+                self._temporary_links.popitem(last=False)
+        return link
+
     def _base_write(self,
                     content: bytes,
                     dbx_path: str,
                     directory: str,
                     filename: str,
                     uploader: callable,
-                    print_success: bool = True):
+                    print_success: bool = True,
+                    skip_if_unchanged: bool = None):
+        """
+        Generic uploader wrapper.
+
+        With `skip_if_unchanged` (defaulting to `self.skip_if_unchanged`), the
+        Dropbox `content_hash` of `content` is compared against the remote
+        file's first and the upload is skipped if they match.
+        """
         full_path = self._construct_path(dbx_path, directory, filename)
+        if skip_if_unchanged is None:
+            skip_if_unchanged = self.skip_if_unchanged
         try:
+            if skip_if_unchanged and self._remote_content_hash(full_path) == content_hash(content):
+                if print_success:
+                    print(f"Skipped '{filename}': unchanged at '{full_path}'")
+                return
+
             # Determine if we should chunk based on content size
-            if len(content) >= 150 * 1024 * 1024: # chunk if ≥150 MB
-                self._chunked_upload_to_dropbox(content, full_path)
+            if len(content) >= MAX_SINGLE_UPLOAD: # chunk if ≥150 MB
+                md = self._chunked_upload_to_dropbox(content, full_path)
             else:
-                uploader(content, full_path)
+                md = uploader(content, full_path)
 
+            self._record_write(full_path, md)
             if print_success:
                 print(f"Uploaded '{filename}' to '{full_path}'")
         except Exception as e:
+            if self.raise_on_error:
+                raise
             print(f"Error uploading '{filename}' to Dropbox: {e}")
+
+    def _stream_write(self,
+                      writer: callable,
+                      dbx_path: str,
+                      directory: str,
+                      filename: str,
+                      print_success: bool = True,
+                      print_size: str = None,
+                      skip_if_unchanged: bool = None):
+        """
+        Generic streaming uploader wrapper.
+
+        `writer(f)` serializes straight into an `UploadStream`, so the output
+        is never held in memory as a whole: peak memory is bounded by the
+        upload chunk size and number of workers, not by the file size.
+
+        Output larger than one chunk is spooled to a local temporary file and
+        uploaded from it once written. From 150 MB on, as in `_base_write`,
+        the upload is checkpointed under `state_dir`, so a retried call or a
+        restarted process writing the same output resumes from the last
+        acknowledged chunk.
+
+        With `skip_if_unchanged` (defaulting to `self.skip_if_unchanged`), the
+        Dropbox `content_hash` is computed while writing; nothing is sent if
+        it matches the remote file's.
+
+        Parameters
+        ----------
+        writer : callable
+            Called with a writable binary file object.
+        print_size : str, optional
+            If given, print the size of the written file, labelled with this
+            format name (e.g. 'csv').
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        if skip_if_unchanged is None:
+            skip_if_unchanged = self.skip_if_unchanged
+        try:
+            unchanged_hash = self._remote_content_hash(full_path) if skip_if_unchanged else None
+            with UploadStream(self, full_path, unchanged_hash=unchanged_hash,
+                              resume_size=MAX_SINGLE_UPLOAD) as stream:
+                writer(stream)
+                size = stream.tell()
+
+            if print_size:
+                print(f"Size of the {print_size} file: {size / 1024 ** 2:.2f} MB")
+            if stream.skipped:
+                if print_success:
+                    print(f"Skipped '{filename}': unchanged at '{full_path}'")
+                return
+
+            self._record_write(full_path, stream.metadata)
+            if print_success:
+                print(f"Uploaded '{filename}' to '{full_path}'")
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error uploading '{filename}' to Dropbox: {e}")
+
+    def _upload_content(self, content: bytes, full_path: str):
+        """
+        Upload bytes to `full_path`, overwriting it, and return the file's metadata.
+
+        Unlike `_base_write`, errors are raised, for callers that write
+        several files as one unit.
+        """
+        if len(content) >= MAX_SINGLE_UPLOAD:
+            md = self._chunked_upload_to_dropbox(content, full_path)
+        else:
+            md = self.dbx.files_upload(content, full_path, mode=dropbox.files.WriteMode.overwrite)
+        self._record_write(full_path, md)
+        return md
+
+    def _record_write(self, full_path: str, md):
+        """
+        Update the in-memory caches after `full_path` was overwritten.
+        """
+        if isinstance(md, dropbox.files.FileMetadata):
+            self._cache_metadata(md)
+        elif self.metadata_cache is not None:
+            self.metadata_cache.invalidate(full_path)
+
+        if self.object_cache is not None:
+            self.object_cache.invalidate(full_path)
     
-    def _chunked_upload_to_dropbox(self, content, full_dropbox_path, chunk_size=25 * 1024 * 1024):
+    def _remote_content_hash(self, full_path: str) -> str | None:
+        """
+        Return the `content_hash` of a Dropbox file, or None if it doesn't exist.
+        """
+        try:
+            md = self._get_metadata(full_path)
+        except dropbox.exceptions.ApiError as err:
+            if isinstance(err.error, dropbox.files.GetMetadataError) and err.error.is_path() and \
+               err.error.get_path().is_not_found():
+                return None
+            raise
+        return getattr(md, "content_hash", None)
+
+    def _get_metadata(self, path: str):
+        """
+        Return the metadata of a Dropbox path, from the metadata cache if possible.
+
+        Raises
+        ------
+        dropbox.exceptions.ApiError
+            If the path doesn't exist or can't be looked up.
+        """
+        if self.metadata_cache is not None:
+            md = self.metadata_cache.get(path)
+            if md is not None:
+                return md
+        md = self.dbx.files_get_metadata(path)
+        self._cache_metadata(md)
+        return md
+
+    def _cache_metadata(self, md):
+        """
+        Remember metadata returned by Dropbox, or forget a path reported as deleted.
+        """
+        if self.metadata_cache is None:
+            return
+        if isinstance(md, dropbox.files.DeletedMetadata):
+            self.metadata_cache.invalidate(md.path_lower)
+        elif isinstance(md, (dropbox.files.FileMetadata, dropbox.files.FolderMetadata)):
+            self.metadata_cache.put(md)
+
+    def _chunked_upload_to_dropbox(self, content, full_dropbox_path, chunk_size=None, max_workers=None):
         """
         Upload a large file to Dropbox in chunks.
 
         This helper function handles splitting the file content into chunks
-        and performing a session-based upload to Dropbox, suitable for files
-        larger than the direct upload limit (150MB).
+        and performing a concurrent session-based upload to Dropbox, suitable
+        for files larger than the direct upload limit (150MB). Chunks are
+        sliced with `memoryview` and sent in parallel from a thread pool.
+        Progress is checkpointed under `state_dir`, so calling this again with
+        the same content after a failure resumes the upload where it stopped.
 
         Parameters
         ----------
-        content : bytes
+        content : bytes or memoryview
             The full byte content of the file to upload.
         full_dropbox_path : str
             The complete Dropbox path where the file will be saved (including filename).
         chunk_size : int, optional
-            The size (in bytes) of each upload chunk. Default is 25MB (25 * 1024 * 1024).
+            The size (in bytes) of each upload chunk, rounded down to a multiple
+            of 4 MiB. Defaults to `self.upload_chunk_size`.
+        max_workers : int, optional
+            Number of chunks uploaded concurrently. Defaults to `self.upload_workers`.
 
         Returns
         -------
-        None
-            The file is uploaded to Dropbox upon successful completion.
+        dropbox.files.FileMetadata
+            Metadata of the uploaded file.
         """
-        upload_session_start_result = self.dbx.files_upload_session_start(content[:chunk_size])
-        cursor = dropbox.files.UploadSessionCursor(
-            session_id=upload_session_start_result.session_id, offset=chunk_size
-        )
-        remaining_content = content[chunk_size:]
-
-        while len(remaining_content) > 0:
-            if len(remaining_content) > chunk_size:
-                self.dbx.files_upload_session_append_v2(
-                    remaining_content[:chunk_size], cursor
-                )
-                cursor.offset += chunk_size
-                remaining_content = remaining_content[chunk_size:]
-            else:
-                self.dbx.files_upload_session_finish(
-                    remaining_content,
-                    cursor,
-                    dropbox.files.CommitInfo(path=full_dropbox_path, mode=dropbox.files.WriteMode.overwrite),
-                )
-                remaining_content = b""
+        session_id, total = self._upload_to_session(content, chunk_size, max_workers,
+                                                    full_path=full_dropbox_path)
+        return self._finish_upload_session(session_id, total, full_dropbox_path)
+
+    def _upload_to_session(self, content, chunk_size=None, max_workers=None, full_path=None):
+        """
+        Upload content into a closed upload session without committing it.
+
+        Content that fits in one request is sent with a single
+        `files_upload_session_start` call; larger content is split into chunks
+        sent concurrently.
+
+        If `full_path` is given, a chunked upload is checkpointed to disk (see
+        `UploadCheckpoint`): when an earlier attempt to upload the same content
+        to the same path failed part way, its session is resumed and only the
+        chunks Dropbox hasn't acknowledged are sent. The checkpoint is removed
+        when the session is committed with `_finish_upload_session(s)`.
+
+        Parameters
+        ----------
+        content : bytes or memoryview
+            The full byte content of the file to upload.
+        chunk_size : int, optional
+            The size (in bytes) of each upload chunk. Defaults to `self.upload_chunk_size`.
+        max_workers : int, optional
+            Number of chunks uploaded concurrently. Defaults to `self.upload_workers`.
+        full_path : str, optional
+            Dropbox path the session will be committed to, which enables
+            checkpointing.
+
+        Returns
+        -------
+        session_id : str
+            Id of the closed upload session.
+        total : int
+            Number of bytes uploaded, i.e. the offset to commit the session at.
+        """
+        view = memoryview(content).cast("B")
+        total = len(view)
+        if total < MAX_SINGLE_UPLOAD:
+            session_id = self.dbx.files_upload_session_start(bytes(view), close=True).session_id
+            return session_id, total
+
+        chunk_size = self._upload_chunk_size(chunk_size)
+        max_workers = max_workers or self.upload_workers
+        checkpoint = None
+        if full_path is not None:
+            checkpoint = UploadCheckpoint(self._upload_state_dir, full_path,
+                                          f"{total}:{content_hash(view)}", chunk_size)
+
+        if checkpoint is not None and checkpoint.session_id is not None:
+            try:
+                return self._send_chunks(view, checkpoint.session_id, chunk_size, max_workers, checkpoint)
+            except dropbox.exceptions.ApiError as err:
+                if not self._is_session_gone(err.error):
+                    raise
+                logging.warning(f"Upload session for '{full_path}' expired; restarting the upload")
+
+        session_id = self._start_upload_session()
+        if checkpoint is not None:
+            checkpoint.start(session_id)
+        return self._send_chunks(view, session_id, chunk_size, max_workers, checkpoint)
+
+    def _send_chunks(self, view, session_id, chunk_size, max_workers, checkpoint=None):
+        """
+        Send every chunk of `view` not yet acknowledged in `checkpoint` and close the session.
+        """
+        total = len(view)
+        acknowledged = set(checkpoint.acknowledged) if checkpoint is not None else set()
+
+        def upload_chunk(offset, close=False):
+            if offset in acknowledged:
+                return
+            # The SDK only accepts bytes, so each chunk is copied once, right before it is sent
+            chunk = bytes(view[offset:offset + chunk_size])
+            self._append_upload_chunk(session_id, offset, chunk, close=close)
+            if checkpoint is not None:
+                checkpoint.acknowledge(offset)
+
+        offsets = range(0, total, chunk_size)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(upload_chunk, offsets[:-1]))
+        # Closing the session must come after every other chunk has landed
+        upload_chunk(offsets[-1], close=True)
+
+        return session_id, total
+
+    @property
+    def _upload_state_dir(self) -> str:
+        return os.path.join(self.state_dir, "uploads")
+
+    @staticmethod
+    def _is_session_gone(error) -> bool:
+        """
+        Whether an upload session error means the session no longer exists.
+        """
+        if isinstance(error, dropbox.files.UploadSessionFinishError):
+            if not error.is_lookup_failed():
+                return False
+            error = error.get_lookup_failed()
+        return isinstance(error, dropbox.files.UploadSessionLookupError) and \
+            (error.is_not_found() or error.is_closed())
+
+    def _start_upload_session(self) -> str:
+        """
+        Start an empty concurrent upload session and return its id.
+        """
+        return self.dbx.files_upload_session_start(
+            b"", session_type=dropbox.files.UploadSessionType.concurrent
+        ).session_id
+
+    def _append_upload_chunk(self, session_id: str, offset: int, chunk: bytes, close: bool = False):
+        """
+        Append one chunk at `offset` to a concurrent upload session.
+
+        Every chunk but the closing one must be a multiple of 4 MiB. Chunks are
+        retried on their own, so a transient failure resends only that chunk
+        rather than restarting the whole upload.
+        """
+        cursor = dropbox.files.UploadSessionCursor(session_id=session_id, offset=offset)
+        try:
+            self.dbx.files_upload_session_append_v2(chunk, cursor, close=close)
+        except dropbox.exceptions.ApiError as err:
+            # A retry of an append that did land the first time (but whose response
+            # was lost) is rejected with the offset the session has moved on to
+            error = err.error
+            if isinstance(error, dropbox.files.UploadSessionLookupError) and error.is_incorrect_offset() and \
+               error.get_incorrect_offset().correct_offset >= offset + len(chunk):
+                return
+            raise
+
+    def _finish_upload_session(self, session_id: str, total: int, full_path: str):
+        """
+        Commit a closed upload session of `total` bytes to `full_path`.
+        """
+        cursor = dropbox.files.UploadSessionCursor(session_id=session_id, offset=total)
+        try:
+            md = self.dbx.files_upload_session_finish(
+                b"",
+                cursor,
+                dropbox.files.CommitInfo(path=full_path, mode=dropbox.files.WriteMode.overwrite),
+            )
+        except dropbox.exceptions.ApiError as err:
+            if self._is_session_gone(err.error):
+                # Don't resume into an expired session on the next attempt
+                UploadCheckpoint.remove(self._upload_state_dir, full_path)
+            raise
+        UploadCheckpoint.remove(self._upload_state_dir, full_path)
+        self._cache_metadata(md)
+        return md
+
+    def _finish_upload_sessions(self, entries: list) -> list:
+        """
+        Commit many closed upload sessions with `files_upload_session_finish_batch_v2`.
+
+        Parameters
+        ----------
+        entries : list of dropbox.files.UploadSessionFinishArg
+            The sessions to commit, with their cursors and commit info.
+
+        Returns
+        -------
+        list
+            For each entry, in order, the uploaded file's
+            `dropbox.files.FileMetadata` or the error that prevented the commit.
+
+        Notes
+        -----
+        Entries rejected with `too_many_write_operations` are committed again
+        after a backoff, up to the retry policy's `max_retries` times.
+        """
+        outcomes = [None] * len(entries)
+        pending = list(range(len(entries)))
+        for attempt in range(self.retry_policy.max_retries + 1):
+            contended = []
+            for start in range(0, len(pending), FINISH_BATCH_SIZE):
+                batch = pending[start:start + FINISH_BATCH_SIZE]
+                try:
+                    finished = self.dbx.files_upload_session_finish_batch_v2([entries[i] for i in batch])
+                except Exception as e:
+                    for i in batch:
+                        outcomes[i] = e
+                    continue
+                for i, result in zip(batch, finished.entries):
+                    outcomes[i] = result.get_success() if result.is_success() else result.get_failure()
+                    if result.is_failure() and is_too_many_write_operations(outcomes[i]):
+                        contended.append(i)
+            if not contended or attempt == self.retry_policy.max_retries:
+                break
+            time.sleep(self.retry_policy.backoff(attempt))
+            pending = contended
+
+        for entry, outcome in zip(entries, outcomes):
+            if isinstance(outcome, dropbox.files.FileMetadata) or self._is_session_gone(outcome):
+                UploadCheckpoint.remove(self._upload_state_dir, entry.commit.path)
+            self._cache_metadata(outcome)
+        return outcomes
+
+    def _upload_file_to_session(self, local_path: str, full_path: str = None):
+        """
+        Upload a local file into a closed upload session without reading it into memory.
+
+        The file is memory-mapped and handed to `_upload_to_session`, with
+        `full_path` enabling resumable uploads.
+
+        Returns
+        -------
+        session_id : str
+            Id of the closed upload session.
+        total : int
+            Number of bytes uploaded.
+        """
+        with open(local_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return self._upload_to_session(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._upload_to_session(mapped, full_path=full_path)
+
+    def _upload_chunk_size(self, chunk_size=None):
+        chunk_size = chunk_size or self.upload_chunk_size
+        return max(UPLOAD_BLOCK_SIZE, chunk_size - chunk_size % UPLOAD_BLOCK_SIZE)
 
     def _initialize_paths(self, input_path: str, output_path: str):
         """
@@ -145,9 +1079,7 @@ class CoreMixin:
         raw_input_path = f"{input_path}/raw"
         clean_input_path = f"{input_path}/clean"
 
-        for path in [raw_input_path, clean_input_path, output_path]:
-            if not self.folder_exists(path):
-                self.create_folder(path)
+        self.ensure_folders([raw_input_path, clean_input_path, output_path])
 
         return raw_input_path, clean_input_path, output_path
 
@@ -166,7 +1098,7 @@ class CoreMixin:
             True if the folder exists, False if not.
         """
         try:
-            self.dbx.files_get_metadata(folder_path)
+            self._get_metadata(folder_path)
             return True
         except dropbox.exceptions.ApiError as err:
             if isinstance(err.error, dropbox.files.GetMetadataError) and err.error.is_path() and \
@@ -193,7 +1125,8 @@ class CoreMixin:
             The path of the created folder if return_path is True.
         """
         try:
-            self.dbx.files_create_folder_v2(folder_path)
+            result = self.dbx.files_create_folder_v2(folder_path)
+            self._cache_metadata(result.metadata)
             logging.info(f"Folder '{folder_path}' created successfully.")
         except dropbox.exceptions.ApiError as err:
             if isinstance(err.error, dropbox.files.CreateFolderError) and err.error.is_path() and \
@@ -205,6 +1138,83 @@ class CoreMixin:
         if return_path:
             return folder_path
 
+    def ensure_folders(self, folder_paths):
+        """
+        Make sure several Dropbox folders exist, creating the missing ones in bulk.
+
+        Folders already known to exist from the metadata cache are skipped; the
+        rest are created with `files_create_folder_batch`, which also creates
+        missing parent folders. Folders that already exist are not an error.
+
+        Parameters
+        ----------
+        folder_paths : list of str
+            Paths of the folders in Dropbox.
+
+        Returns
+        -------
+        dict
+            'created': paths of the folders that were created,
+            'existing': paths of the folders that already existed,
+            'failed': mapping of path to the error for folders that could not be created.
+        """
+        summary = {"created": [], "existing": [], "failed": {}}
+        missing = []
+        for path in dict.fromkeys(folder_paths):
+            known = self.metadata_cache.get(path) if self.metadata_cache is not None else None
+            if isinstance(known, dropbox.files.FolderMetadata):
+                summary["existing"].append(path)
+            else:
+                missing.append(path)
+
+        for start in range(0, len(missing), CREATE_FOLDER_BATCH_SIZE):
+            batch = missing[start:start + CREATE_FOLDER_BATCH_SIZE]
+            try:
+                results = self._create_folder_batch(batch)
+            except Exception as e:
+                logging.error(f"Failed to create folders: {e}")
+                summary["failed"].update({path: e for path in batch})
+                continue
+
+            for path, result in zip(batch, results):
+                if result.is_success():
+                    self._cache_metadata(result.get_success().metadata)
+                    summary["created"].append(path)
+                    continue
+                error = result.get_failure()
+                if error.is_path() and error.get_path().is_conflict() and \
+                   error.get_path().get_conflict().is_folder():
+                    summary["existing"].append(path)
+                else:
+                    logging.error(f"Failed to create folder '{path}': {error}")
+                    summary["failed"][path] = error
+        return summary
+
+    def _create_folder_batch(self, paths):
+        """
+        Run `files_create_folder_batch` and wait for it to finish.
+
+        Returns
+        -------
+        list of dropbox.files.CreateFolderBatchResultEntry
+            The outcome for each path, in order.
+        """
+        launch = self.dbx.files_create_folder_batch(paths)
+        if launch.is_complete():
+            return launch.get_complete().entries
+
+        job_id = launch.get_async_job_id()
+        attempt = 0
+        while True:
+            # Poll with a growing delay while Dropbox creates the folders
+            time.sleep(min(0.5 * 2 ** attempt, 5))
+            attempt += 1
+            status = self.dbx.files_create_folder_batch_check(job_id)
+            if status.is_complete():
+                return status.get_complete().entries
+            if status.is_failed():
+                raise RuntimeError(f"Creating folders failed: {status.get_failed()}")
+
     def list_files_in_folder(self, folder_path, recursive=False):
         """
         List file names in a Dropbox folder.
@@ -222,12 +1232,73 @@ class CoreMixin:
             List of file names in the specified folder.
         """
         try:
-            result = self.dbx.files_list_folder(folder_path, recursive=recursive, limit=2000)
-            return [entry.name for entry in result.entries]
+            return [entry.name for entry in self._iter_entries(folder_path, recursive=recursive)]
         except dropbox.exceptions.ApiError as err:
             logging.error(f"Failed to list files in folder '{folder_path}': {err}")
             return []
 
+    def _iter_entries(self, folder_path, recursive=False):
+        """
+        Lazily yield every entry of a Dropbox folder, following all result pages.
+
+        Each page is only requested once the previous one has been consumed.
+        """
+        result = self.dbx.files_list_folder(folder_path, recursive=recursive, limit=2000)
+        while True:
+            for entry in result.entries:
+                # Listings come with full metadata; keep it for later lookups
+                self._cache_metadata(entry)
+                yield entry
+            if not result.has_more:
+                break
+            result = self.dbx.files_list_folder_continue(result.cursor)
+
+    def iter_files(self, folder_path, recursive=False, extensions=None, pattern=None):
+        """
+        Lazily iterate over the files in a Dropbox folder with their metadata.
+
+        Result pages are fetched as the iterator is consumed, so processing can
+        start before the listing of a large folder has finished.
+
+        Parameters
+        ----------
+        folder_path : str
+            Path of the folder in Dropbox.
+        recursive : bool, optional
+            If True, list files recursively, by default False.
+        extensions : str or list of str, optional
+            Only yield files with one of these extensions, e.g. `['.csv', '.parquet']`
+            (case-insensitive).
+        pattern : str, optional
+            Only yield files whose path relative to `folder_path` matches this
+            glob pattern, e.g. `'2024/*.csv'`.
+
+        Yields
+        ------
+        dropbox.files.FileMetadata
+            Metadata of each file, including `path_display`, `size`, `rev`,
+            `content_hash` and `server_modified`.
+
+        Raises
+        ------
+        dropbox.exceptions.ApiError
+            If the folder cannot be listed.
+        """
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        if extensions is not None:
+            extensions = tuple(ext.lower() for ext in extensions)
+
+        prefix_len = len(folder_path.rstrip('/')) + 1
+        for entry in self._iter_entries(folder_path, recursive=recursive):
+            if not isinstance(entry, dropbox.files.FileMetadata):
+                continue
+            if extensions is not None and not entry.name.lower().endswith(extensions):
+                continue
+            if pattern is not None and not fnmatch.fnmatch(entry.path_display[prefix_len:], pattern):
+                continue
+            yield entry
+
     def list_files_with_relative_paths(self, *args, **kwargs):
         """
         List file paths relative to a specified Dropbox folder.
@@ -263,7 +1334,8 @@ class CoreMixin:
             logging.error(f"Error listing relative paths: {err}")
             return []
 
-    def upload_file_directly(self, file_bytes: bytes,dbx_path: str,directory: str,filename: str, print_success=True):
+    def upload_file_directly(self, file_bytes: bytes,dbx_path: str,directory: str,filename: str, print_success=True,
+                             skip_if_unchanged=None):
         """
         Upload raw file bytes directly to Dropbox.
 
@@ -279,6 +1351,9 @@ class CoreMixin:
             Name of the file, e.g., 'data.csv'.
         log_success : bool, optional
             If True, log a success message, by default True.
+        skip_if_unchanged : bool, optional
+            If True, skip the upload when Dropbox already holds identical
+            content. Defaults to the helper's `skip_if_unchanged` setting.
 
         Raises
         ------
@@ -287,7 +1362,7 @@ class CoreMixin:
         """
         def uploader(content: bytes, full_path: str):
             # exactly the same Dropbox call you had before
-            self.dbx.files_upload(
+            return self.dbx.files_upload(
                 content,
                 full_path,
                 mode=dropbox.files.WriteMode.overwrite,
@@ -301,10 +1376,12 @@ class CoreMixin:
             directory=directory,
             filename=filename,
             uploader=uploader,
-            print_success=print_success
+            print_success=print_success,
+            skip_if_unchanged=skip_if_unchanged
         )
 
-    def write_bytes(self, file_bytes, dbx_path: str, directory: str, filename: str, print_success=True):
+    def write_bytes(self, file_bytes, dbx_path: str, directory: str, filename: str, print_success=True,
+                    skip_if_unchanged=None):
         """
         Upload file bytes to Dropbox and optionally print status.
 
@@ -320,9 +1397,12 @@ class CoreMixin:
             Name of the file to save.
         print_success : bool, optional
             If True, print success message, by default True.
+        skip_if_unchanged : bool, optional
+            If True, skip the upload when Dropbox already holds identical
+            content. Defaults to the helper's `skip_if_unchanged` setting.
         """
         def uploader(content: bytes, full_path: str):
-            self.dbx.files_upload(
+            return self.dbx.files_upload(
                 content,
                 full_path,
                 mode=dropbox.files.WriteMode.overwrite
@@ -334,7 +1414,8 @@ class CoreMixin:
             directory=directory,
             filename=filename,
             uploader=uploader,
-            print_success=print_success
+            print_success=print_success,
+            skip_if_unchanged=skip_if_unchanged
         )
     def download_file_directly(self, dbx_path: str, directory: str, filename: str) -> bytes:
         """
@@ -361,9 +1442,10 @@ class CoreMixin:
         """
         full_path = self._construct_path(dbx_path, directory, filename)
         try:
-            metadata, res = self.dbx.files_download(full_path)
-            return res.content
+            return bytes(self._download_content(full_path))
         except Exception as e:
+            if self.raise_on_error:
+                raise
             print(f"Error downloading '{filename}' from Dropbox: {e}")
             return None
         
@@ -2,6 +2,7 @@ import pandas as pd
 import io
 import requests
 import dropbox
+from .compression import CODECS, compressed_writer, detect_compression, infer_compression, open_decompressed, parse_compression
 
 class CSVMixin:
     """
@@ -13,7 +14,7 @@ class CSVMixin:
     """
 
     def read_csv(self, dbx_path: str, directory: str, filename: str,
-                 mb_to_load: int = None, **kwargs):
+                 mb_to_load: int = None, compression="infer", **kwargs):
         """
         Read a CSV file from Dropbox into a pandas DataFrame.
 
@@ -27,20 +28,82 @@ class CSVMixin:
             Name of the CSV file to read (e.g., 'data.csv').
         mb_to_load : int or None, optional
             Maximum number of megabytes to load for a partial download.
-            If None, the entire file is downloaded (default: None).
+            Only the first `mb_to_load` MB are fetched (using an HTTP Range
+            request) and the data is trimmed to the last complete line.
+            If None, the entire file is downloaded (default: None). For a
+            compressed file, the limit applies to the decompressed data and
+            the codec must be known from `compression` or the file extension.
+        compression : str, dict or None, optional
+            Codec the file is compressed with ('gzip', 'zstd' or 'lz4'), None
+            if it isn't, or 'infer' (default) to detect it from the extension
+            ('.gz', '.zst', '.lz4') or the magic bytes at the start of the file.
+            The file is decompressed as it is parsed. Other codecs, such as
+            'bz2', are passed on to pandas.
         **kwargs
             Additional keyword arguments passed to :func:`pandas.read_csv`,
-            such as `sep`, `usecols`, `skiprows`, etc.
+            such as `sep`, `usecols`, `skiprows`, etc. If `nrows` is given,
+            the download is streamed and stops once enough rows are parsed.
 
         Returns
         -------
         pandas.DataFrame or None
             DataFrame containing the CSV data, or None if an error occurred.
         """
-        # loader: convert raw bytes into DataFrame
-        # loader: turn raw bytes into a DataFrame
-        def loader(content: bytes, **kwargs):
-            return pd.read_csv(io.BytesIO(content), **kwargs)
+        compression = self._csv_compression(compression, kwargs)
+        if isinstance(compression, dict):
+            compression = compression.get("method")
+        if compression == "infer":
+            compression = infer_compression(filename) or "infer"
+
+        if mb_to_load is not None:
+            max_bytes = int(mb_to_load * 1024 * 1024)
+            # A compressed file can't be cut at a byte offset, so it is streamed instead
+            compressed = compression in CODECS
+
+            # loader: parse the head of the file, dropping the trailing partial line.
+            # The limit and codec are loader arguments, so they are part of the object cache key.
+            def partial_loader(f, limit, codec, **kwargs):
+                if codec in CODECS:
+                    f = open_decompressed(f, codec)
+                elif codec == "infer" and detect_compression(f.peek(4)[:4]):
+                    raise ValueError("File is compressed; pass `compression` to read part of it")
+                # One extra byte tells us whether the file continues past the limit
+                content = f.read(limit + 1)
+                if len(content) > limit:
+                    end = content.rfind(b"\n", 0, limit)
+                    if end < 0:
+                        raise ValueError(f"No complete line in the first {limit} bytes; increase `mb_to_load`")
+                    content = content[:end + 1]
+                return pd.read_csv(io.BytesIO(content), **kwargs)
+
+            return self._base_read(
+                dbx_path=dbx_path,
+                directory=directory,
+                filename=filename,
+                downloader=None,
+                loader=partial_loader,
+                stream=True,
+                max_bytes=None if compressed else max_bytes + 1,
+                limit=max_bytes,
+                codec=compression,
+                **kwargs
+            )
+
+        if kwargs.get("nrows") is not None:
+            # loader: pandas pulls from the response stream only until nrows are parsed
+            def streaming_loader(f, codec=None, **kwargs):
+                return pd.read_csv(open_decompressed(f, codec), **kwargs)
+
+            return self._base_read(
+                dbx_path=dbx_path,
+                directory=directory,
+                filename=filename,
+                downloader=None,
+                loader=streaming_loader,
+                stream=True,
+                codec=compression,
+                **kwargs
+            )
 
         # downloader: full download via Dropbox SDK
         def downloader(full_path: str):
@@ -51,13 +114,55 @@ class CSVMixin:
             directory=directory,
             filename=filename,
             downloader=downloader,
-            loader=loader,
+            loader=self._load_csv,
+            codec=compression,
             **kwargs
         )
 
+    def iter_csv(self, dbx_path: str, directory: str, filename: str,
+                 chunksize: int = 100_000, compression="infer", **kwargs):
+        """
+        Stream a CSV file from Dropbox and yield it as DataFrame chunks.
+
+        The download is parsed incrementally as it arrives, so files larger
+        than the available memory can be processed chunk by chunk.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Base Dropbox path where the file is stored.
+        directory : str or None
+            Subdirectory within the base path. If None, file is at base path.
+        filename : str
+            Name of the CSV file to read (e.g., 'data.csv').
+        chunksize : int, optional
+            Number of rows per yielded DataFrame (default: 100000).
+        compression : str, dict or None, optional
+            Codec of the file, as in `read_csv`; detected by default.
+        **kwargs
+            Additional keyword arguments passed to :func:`pandas.read_csv`.
+
+        Yields
+        ------
+        pandas.DataFrame
+            Consecutive chunks of the CSV data.
+
+        Raises
+        ------
+        Exception
+            Errors are raised rather than printed, since a partially consumed
+            iterator cannot signal failure by returning None.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        compression = self._csv_compression(compression, kwargs)
+        with self._open_stream(full_path) as f:
+            f = open_decompressed(f, compression, filename)
+            with pd.read_csv(f, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+
     def write_csv(self, df: pd.DataFrame, dbx_path: str, directory: str,
                   filename: str, print_success: bool = True,
-                  print_size: bool = True, **kwargs):
+                  print_size: bool = True, compression="infer", **kwargs):
         """
         Write a pandas DataFrame to a CSV file and upload it to Dropbox.
 
@@ -74,7 +179,14 @@ class CSVMixin:
         print_success : bool, optional
             Whether to print a success message upon completion (default: True).
         print_size : bool, optional
-            Whether to print the file size before uploading (default: True).
+            Whether to print the file size once written (default: True).
+        compression : str, dict or None, optional
+            Codec to compress the file with as it is uploaded: 'gzip', 'zstd'
+            or 'lz4', None for no compression, or 'infer' (default) to pick it
+            from the extension of `filename` ('.gz', '.zst', '.lz4'). A dict
+            sets options too, e.g. ``{'method': 'zstd', 'level': 10, 'threads': -1}``
+            for multithreaded zstd. Other codecs, such as 'bz2', are passed on
+            to pandas.
         **kwargs
             Additional keyword arguments passed to :meth:`pandas.DataFrame.to_csv`,
             such as `index`, `header`, `sep`, etc.
@@ -84,25 +196,56 @@ class CSVMixin:
         None
             The DataFrame is uploaded; success or failure is printed or logged.
         """
-        # 1) Bake the CSV into bytes
-        buf = io.StringIO()
-        df.to_csv(buf, **kwargs)
-        data = buf.getvalue().encode("utf-8")
-
-        # 2) Use your existing _base_write for a direct upload
-        def uploader(content: bytes, full_path: str):
-            self.dbx.files_upload(
-                content,
-                full_path,
-                mode=dropbox.files.WriteMode.overwrite,
-                autorename=False,
-            )
+        method, options = parse_compression(self._csv_compression(compression, kwargs), filename)
 
-        self._base_write(
-            content=data,
+        # Encode (and compress) straight into the upload, without building the whole CSV in memory
+        def writer(f):
+            with compressed_writer(f, method, **options) as out:
+                self._serialize_csv(df, out, **kwargs)
+
+        self._stream_write(
+            writer=writer,
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
-            uploader=uploader,
-            print_success=True,
+            print_success=print_success,
+            print_size="csv" if print_size else None,
         )
+
+    @staticmethod
+    def _csv_compression(compression, kwargs: dict):
+        """
+        Return `compression` if handled here, or move it to the pandas `kwargs`.
+        """
+        method = compression.get("method") if isinstance(compression, dict) else compression
+        if method in (None, "infer") or method in CODECS:
+            return compression
+        # Codecs pandas supports itself on binary handles, e.g. 'bz2' or 'zip'
+        kwargs["compression"] = compression
+        return None
+
+    @staticmethod
+    def _serialize_csv(df: pd.DataFrame, f, **kwargs):
+        """
+        Write a DataFrame as CSV (UTF-8 by default) to a binary file object.
+        """
+        df.to_csv(f, **kwargs)
+
+    @classmethod
+    def _dump_csv(cls, df: pd.DataFrame, **kwargs) -> bytes:
+        """
+        Serialize a DataFrame to UTF-8 encoded CSV bytes.
+        """
+        buf = io.BytesIO()
+        cls._serialize_csv(df, buf, **kwargs)
+        return buf.getvalue()
+
+    @staticmethod
+    def _load_csv(content: bytes, codec="infer", **kwargs) -> pd.DataFrame:
+        """
+        Parse CSV bytes into a DataFrame, decompressing them with `codec` if needed.
+        """
+        if kwargs.get("compression") is not None:
+            # pandas decompresses this one itself
+            codec = None
+        return pd.read_csv(open_decompressed(io.BytesIO(content), codec), **kwargs)
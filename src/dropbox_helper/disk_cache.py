@@ -0,0 +1,189 @@
+import hashlib
+import logging
+import os
+import threading
+
+# Files in the cache directory that are still being written, not cache entries
+PARTIAL_SUFFIXES = (".tmp", ".part", ".part.json")
+
+class DiskCache:
+    """
+    Persistent on-disk cache of downloaded Dropbox files.
+
+    Entries are keyed by Dropbox path and `content_hash`, so a file that
+    changed on Dropbox is never served from a stale copy. The total size of
+    the cache is capped and the least recently used entries are evicted
+    first.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Local directory where cached files are stored. Created if missing.
+    max_size_mb : float, optional
+        Maximum total size of the cache in megabytes, by default 10240 (10 GB).
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 10240):
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._entry_locks = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _path_key(dbx_path: str) -> str:
+        # Dropbox paths are case-insensitive
+        return hashlib.sha256(dbx_path.lower().encode("utf-8")).hexdigest()
+
+    def _entry_path(self, dbx_path: str, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{self._path_key(dbx_path)}.{content_hash}")
+
+    def get(self, dbx_path: str, content_hash: str) -> str | None:
+        """
+        Look up a cached file.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Full Dropbox path of the file.
+        content_hash : str
+            Dropbox `content_hash` of the current remote version.
+
+        Returns
+        -------
+        str or None
+            Local path of the cached copy, or None on a cache miss.
+        """
+        local_path = self._entry_path(dbx_path, content_hash)
+        try:
+            # Touch the entry so it becomes the most recently used one
+            os.utime(local_path)
+        except FileNotFoundError:
+            return None
+        return local_path
+
+    def put(self, dbx_path: str, content_hash: str, content: bytes) -> str:
+        """
+        Store file content in the cache, replacing older versions of the same path.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Full Dropbox path of the file.
+        content_hash : str
+            Dropbox `content_hash` of the downloaded version.
+        content : bytes
+            File content to store.
+
+        Returns
+        -------
+        str
+            Local path of the cached copy.
+        """
+        local_path = self._entry_path(dbx_path, content_hash)
+        tmp_path = f"{local_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        return self.commit(dbx_path, content_hash, tmp_path)
+
+    def partial_path(self, dbx_path: str, content_hash: str) -> str:
+        """
+        Return a temporary path in `cache_dir` to download a file to before `commit`.
+
+        The path is stable for a given file version, so an interrupted download
+        can be resumed, and it is never mistaken for a cache entry.
+        """
+        return f"{self._entry_path(dbx_path, content_hash)}.tmp"
+
+    def entry_lock(self, dbx_path: str, content_hash: str) -> threading.Lock:
+        """
+        Return the lock serializing downloads of one file version in this process.
+
+        Downloads to `partial_path` must hold it, since concurrent readers of
+        the same file would otherwise write to and rename the same partial file.
+        """
+        with self._lock:
+            return self._entry_locks.setdefault(self._entry_path(dbx_path, content_hash), threading.Lock())
+
+    def commit(self, dbx_path: str, content_hash: str, tmp_path: str) -> str:
+        """
+        Move a fully written temporary file into the cache.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Full Dropbox path of the file.
+        content_hash : str
+            Dropbox `content_hash` of the downloaded version.
+        tmp_path : str
+            Local path of the temporary file, which must live in `cache_dir`.
+
+        Returns
+        -------
+        str
+            Local path of the cached copy.
+        """
+        local_path = self._entry_path(dbx_path, content_hash)
+        with self._lock:
+            os.replace(tmp_path, local_path)
+            self._entry_locks.pop(local_path, None)
+            self._remove_stale_versions(dbx_path, keep=local_path)
+            # The new entry is kept even if it alone exceeds the budget; the caller is about to read it
+            self._evict(keep=local_path)
+        return local_path
+
+    def invalidate(self, dbx_path: str):
+        """
+        Remove every cached version of a Dropbox path.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Full Dropbox path of the file.
+        """
+        with self._lock:
+            self._remove_stale_versions(dbx_path, keep=None)
+
+    def clear(self):
+        """
+        Remove every entry from the cache.
+        """
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                self._remove(os.path.join(self.cache_dir, name))
+
+    def _remove_stale_versions(self, dbx_path: str, keep: str | None):
+        prefix = self._path_key(dbx_path) + "."
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            if name.startswith(prefix) and not name.endswith(PARTIAL_SUFFIXES) and entry != keep:
+                self._remove(entry)
+
+    def _evict(self, keep: str = None):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(PARTIAL_SUFFIXES):
+                continue
+            entry = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(entry)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        # The kept entry counts towards the budget but is never removed
+        entries = [item for item in entries if item[2] != keep]
+        # Oldest first
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            self._remove(entry)
+            total -= size
+
+    @staticmethod
+    def _remove(entry: str):
+        try:
+            os.remove(entry)
+        except OSError as err:
+            logging.warning(f"Could not remove cache entry '{entry}': {err}")
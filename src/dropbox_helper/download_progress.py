@@ -0,0 +1,94 @@
+import contextlib
+import json
+import os
+import threading
+
+# How many bytes a segment advances between two saves of the progress file
+SAVE_INTERVAL = 64 * 1024 * 1024
+
+class DownloadProgress:
+    """
+    Progress of a download to disk, split into byte-range segments.
+
+    The segments and how far each one got are saved to a small JSON file next
+    to the partial download, so that an interrupted download of the same file
+    version resumes from there. Saved progress is ignored if the remote file
+    changed, in which case the download starts over.
+
+    Parameters
+    ----------
+    path : str
+        Local path of the progress file.
+    md : dropbox.files.FileMetadata
+        Metadata of the file being downloaded.
+    segments : int
+        Number of segments to split a new download into.
+    resume : bool, optional
+        Whether to pick up saved progress, by default True. Pass False when
+        the partial download itself is gone.
+
+    Attributes
+    ----------
+    segments : list of (int, int)
+        Start (inclusive) and end (exclusive) offsets of each segment.
+    positions : list of int
+        Offset up to which each segment has been written.
+    """
+
+    def __init__(self, path: str, md, segments: int = 1, resume: bool = True):
+        self.path = path
+        self.content_hash = md.content_hash
+        self.size = md.size
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+        try:
+            with open(path) as f:
+                state = json.load(f) if resume else {}
+        except (FileNotFoundError, ValueError):
+            state = {}
+        if state.get("content_hash") == self.content_hash and state.get("size") == self.size:
+            self.segments = [tuple(segment) for segment in state["segments"]]
+            self.positions = state["positions"]
+            return
+
+        segments = max(1, min(segments, self.size // (1024 * 1024) or 1))
+        bounds = [self.size * i // segments for i in range(segments + 1)]
+        self.segments = list(zip(bounds[:-1], bounds[1:]))
+        self.positions = bounds[:-1]
+
+    def advance(self, index: int, position: int):
+        """
+        Record that segment `index` has been written up to `position`.
+        """
+        with self._lock:
+            self._unsaved += position - self.positions[index]
+            self.positions[index] = position
+            if self._unsaved >= SAVE_INTERVAL:
+                self._save()
+
+    def save(self):
+        """
+        Write the current progress to disk.
+        """
+        with self._lock:
+            self._save()
+
+    def discard(self):
+        """
+        Delete the progress file.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "content_hash": self.content_hash,
+                "size": self.size,
+                "segments": self.segments,
+                "positions": self.positions,
+            }, f)
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
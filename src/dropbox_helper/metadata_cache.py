@@ -0,0 +1,64 @@
+import threading
+import time
+
+class MetadataCache:
+    """
+    In-memory cache of Dropbox file and folder metadata with a time to live.
+
+    The helper fills it from everything that returns metadata anyway
+    (listings, uploads, folder creation and `files_get_metadata` calls), so
+    existence checks and cache revalidation can be answered from memory.
+    Entries older than `ttl` seconds are ignored, which bounds how long a
+    change made by another process can go unnoticed. Only existing paths are
+    cached; a lookup of a missing path always goes to Dropbox.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Number of seconds an entry stays valid, by default 60.
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        # Dropbox paths are case-insensitive
+        return path.rstrip("/").lower()
+
+    def get(self, path: str):
+        """
+        Return the cached metadata of `path`, or None if absent or expired.
+        """
+        key = self._key(path)
+        with self._lock:
+            md, expires = self._entries.get(key, (None, 0))
+            if time.monotonic() >= expires:
+                self._entries.pop(key, None)
+                return None
+            return md
+
+    def put(self, md):
+        """
+        Cache a `dropbox.files.Metadata` object under its path.
+        """
+        if getattr(md, "path_lower", None) is None:
+            return
+        with self._lock:
+            self._entries[self._key(md.path_lower)] = (md, time.monotonic() + self.ttl)
+
+    def invalidate(self, path: str):
+        """
+        Forget the metadata of `path`.
+        """
+        with self._lock:
+            self._entries.pop(self._key(path), None)
+
+    def clear(self):
+        """
+        Forget every entry.
+        """
+        with self._lock:
+            self._entries.clear()
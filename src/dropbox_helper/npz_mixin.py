@@ -1,17 +1,42 @@
 import io
+import json
+import os
+import shutil
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from scipy.sparse import load_npz, save_npz
+import numpy as np
 import scipy
 import dropbox
 
+# Name of the manifest listing the shards of a sharded matrix
+SHARD_MANIFEST = "manifest.json"
+# With shard_rows='auto', rows are grouped into shards of about this many raw bytes
+SHARD_TARGET_BYTES = 64 * 1024 * 1024
+# Name of a dense array unpacked for memory mapping
+NPY_MEMBER = "array.npy"
+
 class NPZMixin:
     """
-    Mixin to handle reading and writing sparse matrices (.npz files) to Dropbox.
+    Mixin to handle reading and writing sparse matrices (.npz files) and
+    dense arrays (.npy files) to Dropbox.
     
     Provides methods for serializing sparse matrices and transferring them
     to and from Dropbox using the CoreMixin's base read/write infrastructure.
+
+    Matrices too large for a single file can be stored sharded: `filename`
+    is then a Dropbox folder holding one `.npz` file per block of rows and a
+    `manifest.json` describing them, and `read_npz` can fetch a subset of
+    rows without downloading the other shards.
+
+    With `mmap_mode`, files are unpacked once into uncompressed `.npy` files
+    under `state_dir` and memory-mapped, so worker processes on one node
+    share a single copy in the page cache instead of each loading their own.
     """
 
-    def write_npz(self, matrix: scipy.sparse.csr_matrix, dbx_path: str, directory: str, filename: str, print_success: bool = True, **kwargs):
+    def write_npz(self, matrix: scipy.sparse.csr_matrix, dbx_path: str, directory: str, filename: str, print_success: bool = True,
+                  shard_rows=None, max_workers: int = None, **kwargs):
         """
         Serialize and upload a sparse matrix as a `.npz` file to Dropbox.
 
@@ -27,6 +52,16 @@ class NPZMixin:
             The name of the `.npz` file to create (e.g., "matrix.npz").
         print_success : bool, optional
             If True, print a success message upon completion. Default is True.
+        shard_rows : int or 'auto', optional
+            If given, store the matrix sharded into blocks of `shard_rows`
+            rows ('auto' picks blocks of about 64 MB of raw data). Shards are
+            compressed and uploaded in parallel, and the manifest is written
+            last, so readers never see a partially written matrix.
+            If None (default), a single `.npz` file is written; to go back
+            from a sharded matrix to a single file, delete the folder first.
+        max_workers : int, optional
+            Number of shards compressed and uploaded concurrently. Defaults to
+            the number of CPU cores.
         **kwargs
             Additional keyword arguments passed to `scipy.sparse.save_npz`.
 
@@ -34,26 +69,21 @@ class NPZMixin:
         -------
         None
         """
-        buffer = io.BytesIO()
-        save_npz(buffer, matrix, **kwargs)
-        buffer.seek(0)
+        if shard_rows is not None:
+            return self._write_sharded_npz(matrix, dbx_path, directory, filename, shard_rows,
+                                           max_workers, print_success, **kwargs)
 
-        # self.dbx.files_upload(buffer.getvalue(), full_dropbox_path, mode=dropbox.files.WriteMode.overwrite)
-
-        self._base_write(
-            content=buffer.getvalue(),
+        # zipfile writes the archive sequentially, so it can go straight into the upload
+        self._stream_write(
+            writer=lambda f: save_npz(f, matrix, **kwargs),
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
-            uploader=lambda content, full_path: self.dbx.files_upload(
-                content,
-                full_path,
-                mode=dropbox.files.WriteMode.overwrite
-            ),
             print_success=print_success
         )
 
-    def read_npz(self, dbx_path: str, directory: str, filename: str):
+    def read_npz(self, dbx_path: str, directory: str, filename: str, rows: slice = None, max_workers: int = None,
+                 mmap_mode: str = None):
         """
         Download and deserialize a `.npz` file from Dropbox into a sparse matrix.
 
@@ -65,20 +95,304 @@ class NPZMixin:
             Subdirectory within the base path where the file is stored.
         filename : str
             The name of the `.npz` file to download (e.g., "matrix.npz").
+        rows : slice, optional
+            Rows to return. For a sharded matrix only the shards holding these
+            rows are downloaded; a single-file matrix is downloaded whole and
+            sliced.
+        max_workers : int, optional
+            Number of shards downloaded concurrently. Defaults to the number
+            of CPU cores.
+        mmap_mode : {'r', 'r+', 'c'}, optional
+            If given, the file is streamed to local disk, its arrays are
+            stored uncompressed under `state_dir` (once per file version) and
+            the returned matrix's `data`, `indices` and `indptr` are
+            memory-mapped with this mode, as in `numpy.load`. Not supported
+            for sharded matrices. Selecting `rows` copies them into memory.
 
         Returns
         -------
         scipy.sparse.spmatrix or None
             The loaded sparse matrix, or None if an error occurs.
         """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            md = self._get_metadata(full_path)
+            if mmap_mode is not None and isinstance(md, dropbox.files.FolderMetadata):
+                raise ValueError("mmap_mode is not supported for sharded matrices; read them by rows instead")
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error reading '{filename}' from Dropbox: {e}")
+            return None
+
+        if isinstance(md, dropbox.files.FolderMetadata):
+            return self._read_sharded_npz(full_path, filename, rows, max_workers)
+
+        if mmap_mode is not None:
+            matrix = self._read_mapped(full_path, filename, md, self._extract_npz,
+                                       lambda local_dir: self._map_sparse_matrix(local_dir, mmap_mode))
+        else:
+            matrix = self._base_read(
+                dbx_path=dbx_path,
+                directory=directory,
+                filename=filename,
+                downloader=self.dbx.files_download,
+                loader=self._load_sparse_matrix_from_bytes
+            )
+        if matrix is not None and rows is not None:
+            matrix = matrix[rows]
+        return matrix
+
+    def write_npy(self, array: np.ndarray, dbx_path: str, directory: str, filename: str, print_success: bool = True):
+        """
+        Serialize and upload a dense array as a `.npy` file to Dropbox.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            The array to save. Object arrays are not supported.
+        dbx_path : str
+            Base path in Dropbox where the file will be uploaded.
+        directory : str
+            Subdirectory within the base path where the file will be stored.
+        filename : str
+            The name of the `.npy` file to create (e.g., "embeddings.npy").
+        print_success : bool, optional
+            If True, print a success message upon completion. Default is True.
+
+        Returns
+        -------
+        None
+        """
+        # The .npy format is a small header followed by the raw array data, streamed into the upload
+        self._stream_write(
+            writer=lambda f: self._serialize_npy(array, f),
+            dbx_path=dbx_path,
+            directory=directory,
+            filename=filename,
+            print_success=print_success
+        )
+
+    def read_npy(self, dbx_path: str, directory: str, filename: str, mmap_mode: str = None):
+        """
+        Download a `.npy` file from Dropbox into a dense array.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Base path in Dropbox where the file is located.
+        directory : str
+            Subdirectory within the base path where the file is stored.
+        filename : str
+            The name of the `.npy` file to download (e.g., "embeddings.npy").
+        mmap_mode : {'r', 'r+', 'c'}, optional
+            If given, the file is streamed to local disk under `state_dir`
+            (once per file version) and returned as a `numpy.memmap` opened
+            with this mode, as in `numpy.load`.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            The loaded array, or None if an error occurs.
+        """
+        if mmap_mode is not None:
+            full_path = self._construct_path(dbx_path, directory, filename)
+            return self._read_mapped(
+                full_path, filename, None,
+                lambda source, local_dir: os.replace(source, os.path.join(local_dir, NPY_MEMBER)),
+                lambda local_dir: np.load(os.path.join(local_dir, NPY_MEMBER), mmap_mode=mmap_mode,
+                                          allow_pickle=False)
+            )
+
         return self._base_read(
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
             downloader=self.dbx.files_download,
-            loader=self._load_sparse_matrix_from_bytes
+            loader=self._load_npy
         )
 
+    def _write_sharded_npz(self, matrix, dbx_path, directory, filename, shard_rows, max_workers,
+                           print_success, **kwargs):
+        """
+        Upload `matrix` as row-block shards plus a manifest under the folder `filename`.
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        try:
+            matrix = matrix.tocsr()
+            n_rows = matrix.shape[0]
+            if shard_rows == "auto":
+                raw_bytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+                shard_rows = max(1, n_rows * SHARD_TARGET_BYTES // max(raw_bytes, 1))
+            bounds = list(range(0, n_rows, shard_rows)) + [n_rows] if n_rows else [0, 0]
+
+            self._replace_with_folder(full_path)
+            # Unique names, so the previous manifest keeps pointing at complete shards
+            prefix = uuid.uuid4().hex[:12]
+
+            def upload_shard(index):
+                start, stop = bounds[index], bounds[index + 1]
+                buffer = io.BytesIO()
+                # zlib releases the GIL, so shards compress on all cores at once
+                save_npz(buffer, matrix[start:stop], **kwargs)
+                name = f"{prefix}-{index:05d}.npz"
+                md = self._upload_content(buffer.getvalue(), f"{full_path}/{name}")
+                return {"file": name, "start": start, "stop": stop,
+                        "nnz": int(matrix.indptr[stop] - matrix.indptr[start]), "size": md.size}
+
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+                shards = list(pool.map(upload_shard, range(len(bounds) - 1)))
+
+            manifest = {
+                "format": "csr",
+                "version": 1,
+                "shape": list(matrix.shape),
+                "dtype": matrix.dtype.str,
+                "nnz": int(matrix.nnz),
+                "shards": shards,
+            }
+            self._upload_content(json.dumps(manifest, indent=1).encode("utf-8"),
+                                 f"{full_path}/{SHARD_MANIFEST}")
+            self._delete_stale_shards(full_path, {shard["file"] for shard in shards})
+            if print_success:
+                print(f"Uploaded '{filename}' to '{full_path}' in {len(shards)} shards")
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error uploading '{filename}' to Dropbox: {e}")
+
+    def _read_sharded_npz(self, full_path, filename, rows, max_workers):
+        """
+        Load the rows `rows` of a sharded matrix, downloading only the shards holding them.
+        """
+        try:
+            manifest = json.loads(bytes(self._download_content(f"{full_path}/{SHARD_MANIFEST}")))
+            start, stop, step = (rows or slice(None)).indices(manifest["shape"][0])
+            if step < 0:
+                # Fetch the covered rows in order, then walk them backwards
+                start, stop = stop + 1, start + 1
+            shards = [shard for shard in manifest["shards"]
+                      if shard["start"] < stop and shard["stop"] > start and start < stop]
+
+            def load_shard(shard):
+                content = self._download_content(f"{full_path}/{shard['file']}")
+                block = self._load_sparse_matrix_from_bytes(content)
+                return block[max(start - shard["start"], 0):stop - shard["start"]]
+
+            with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+                blocks = list(pool.map(load_shard, shards))
+
+            if not blocks:
+                return scipy.sparse.csr_matrix((0, manifest["shape"][1]), dtype=manifest["dtype"])
+            matrix = scipy.sparse.vstack(blocks, format="csr")
+            return matrix if step == 1 else matrix[::step]
+        except Exception as e:
+            if self.raise_on_error:
+                raise
+            print(f"Error reading '{filename}' from Dropbox: {e}")
+            return None
+
+    def _replace_with_folder(self, full_path: str):
+        """
+        Make room for shards at `full_path`, deleting a single-file matrix stored there.
+        """
+        try:
+            md = self.dbx.files_get_metadata(full_path)
+        except dropbox.exceptions.ApiError:
+            return
+        if isinstance(md, dropbox.files.FileMetadata):
+            self.dbx.files_delete_v2(full_path)
+            if self.metadata_cache is not None:
+                self.metadata_cache.invalidate(full_path)
+
+    def _delete_stale_shards(self, full_path: str, keep: set):
+        """
+        Delete the shards of earlier versions, which the new manifest no longer refers to.
+        """
+        stale = [entry.path_lower for entry in self._iter_entries(full_path)
+                 if isinstance(entry, dropbox.files.FileMetadata)
+                 and entry.name not in keep and entry.name != SHARD_MANIFEST]
+        if not stale:
+            return
+        # Best effort: the deletion job finishes in the background
+        self.dbx.files_delete_batch([dropbox.files.DeleteArg(path) for path in stale])
+        if self.metadata_cache is not None:
+            for path in stale:
+                self.metadata_cache.invalidate(path)
+
+    @staticmethod
+    def _dump_npz(matrix: scipy.sparse.csr_matrix, **kwargs) -> bytes:
+        """
+        Serialize a sparse matrix to `.npz` bytes.
+        """
+        buffer = io.BytesIO()
+        save_npz(buffer, matrix, **kwargs)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _extract_npz(npz_path: str, local_dir: str):
+        """
+        Decompress the `.npy` members of an `.npz` file into `local_dir`, one block at a time.
+        """
+        with zipfile.ZipFile(npz_path) as archive:
+            for name in archive.namelist():
+                with archive.open(name) as src, open(os.path.join(local_dir, os.path.basename(name)), "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    @staticmethod
+    def _map_sparse_matrix(local_dir: str, mmap_mode: str):
+        """
+        Build a sparse matrix over memory-mapped arrays unpacked by `_extract_npz`.
+
+        Mirrors `scipy.sparse.load_npz`, but only loads the small `format` and
+        `shape` members into memory.
+        """
+        def member(name, mmap=True):
+            return np.load(os.path.join(local_dir, f"{name}.npy"), mmap_mode=mmap_mode if mmap else None,
+                           allow_pickle=False)
+
+        if not os.path.exists(os.path.join(local_dir, "format.npy")):
+            raise ValueError("The file does not contain a sparse array or matrix.")
+        sparse_format = member("format", mmap=False).item()
+        if not isinstance(sparse_format, str):
+            sparse_format = sparse_format.decode("ascii")
+        is_array = os.path.exists(os.path.join(local_dir, "_is_array.npy")) and member("_is_array", mmap=False).item()
+        cls = getattr(scipy.sparse, f"{sparse_format}_{'array' if is_array else 'matrix'}")
+        shape = tuple(int(n) for n in member("shape", mmap=False))
+
+        if sparse_format in ("csr", "csc", "bsr"):
+            return cls((member("data"), member("indices"), member("indptr")), shape=shape, copy=False)
+        if sparse_format == "coo":
+            if os.path.exists(os.path.join(local_dir, "coords.npy")):
+                return cls((member("data"), member("coords")), shape=shape, copy=False)
+            return cls((member("data"), (member("row"), member("col"))), shape=shape, copy=False)
+        if sparse_format == "dia":
+            return cls((member("data"), member("offsets")), shape=shape, copy=False)
+        raise NotImplementedError(f"Memory mapping is not implemented for sparse format '{sparse_format}'.")
+
+    @staticmethod
+    def _serialize_npy(array: np.ndarray, f):
+        """
+        Write a dense array in `.npy` format to a binary file object.
+        """
+        np.save(f, np.asanyarray(array), allow_pickle=False)
+
+    @classmethod
+    def _dump_npy(cls, array: np.ndarray) -> bytes:
+        """
+        Serialize a dense array to `.npy` bytes.
+        """
+        buffer = io.BytesIO()
+        cls._serialize_npy(array, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _load_npy(content: bytes) -> np.ndarray:
+        """
+        Deserialize a dense array from `.npy` bytes.
+        """
+        return np.load(io.BytesIO(content), allow_pickle=False)
+
     @staticmethod
     def _load_sparse_matrix_from_bytes(file_bytes: bytes):
         """
@@ -97,4 +411,3 @@ class NPZMixin:
         buffer = io.BytesIO(file_bytes)
         buffer.seek(0)
         return load_npz(buffer)
-
@@ -0,0 +1,117 @@
+import sys
+import threading
+from collections import OrderedDict
+
+# Returned by ObjectCache.get on a miss, since None is a valid cached object
+MISSING = object()
+
+class ObjectCache:
+    """
+    In-memory LRU cache of decoded objects, bounded by an approximate byte budget.
+
+    Entries are keyed by Dropbox path, file revision and how the file was
+    decoded (loader and its arguments), so a lookup for a file that changed on
+    Dropbox is a miss and the stale entry is replaced when the new one is
+    stored. Sizes are estimated with `DataFrame.memory_usage(deep=True)`,
+    array `nbytes` and the like; objects larger than the whole budget are not
+    cached.
+
+    Cached objects are shared between all callers that read the same file and
+    should be treated as read-only.
+
+    Parameters
+    ----------
+    max_size_mb : float, optional
+        Approximate maximum total size of the cached objects in megabytes, by
+        default 1024.
+    """
+
+    def __init__(self, max_size_mb: float = 1024):
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(full_path: str, rev: str, loader: callable, **loader_kwargs) -> tuple:
+        """
+        Build the cache key of a file version decoded by `loader` with `loader_kwargs`.
+        """
+        loader_name = f"{getattr(loader, '__module__', '')}.{getattr(loader, '__qualname__', repr(loader))}"
+        # repr, since argument values such as column lists aren't hashable
+        return full_path.lower(), rev, loader_name, repr(sorted(loader_kwargs.items()))
+
+    def get(self, key: tuple):
+        """
+        Return the cached object for `key`, or `MISSING` on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, obj):
+        """
+        Cache `obj` under `key`, replacing other versions of the same file.
+        """
+        size = estimate_size(obj)
+        with self._lock:
+            self._remove_where(lambda k: k[0] == key[0] and k[1] != key[1])
+            if size > self.max_size:
+                return
+            if key in self._entries:
+                self.size -= self._entries.pop(key)[1]
+            self._entries[key] = (obj, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def invalidate(self, full_path: str):
+        """
+        Drop every cached object decoded from a Dropbox path.
+        """
+        path = full_path.lower()
+        with self._lock:
+            self._remove_where(lambda k: k[0] == path)
+
+    def clear(self):
+        """
+        Drop every cached object.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove_where(self, predicate: callable):
+        for key in [k for k in self._entries if predicate(k)]:
+            self.size -= self._entries.pop(key)[1]
+
+
+def estimate_size(obj) -> int:
+    """
+    Approximate the memory footprint of an object in bytes.
+
+    Understands pandas objects, numpy arrays, scipy sparse matrices, bytes and
+    the containers holding them; anything else falls back to `sys.getsizeof`.
+    """
+    if hasattr(obj, "memory_usage") and hasattr(obj, "ndim"):
+        # pandas DataFrame (one value per column) or Series (a scalar)
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(obj, "tocsr") and hasattr(obj, "nnz"):
+        # scipy sparse: sum the arrays backing the matrix
+        return sum(getattr(obj, name).nbytes for name in ("data", "indices", "indptr", "row", "col", "offsets")
+                   if hasattr(getattr(obj, name, None), "nbytes"))
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_size(item) for item in obj)
+    return sys.getsizeof(obj)
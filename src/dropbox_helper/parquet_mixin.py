@@ -1,8 +1,11 @@
     
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import io
 import os
-import dropbox
+from .upload_stream import UploadStream
+
 class ParquetMixin:
     """
     Mixin providing parquet read/write capabilities with Dropbox integration.
@@ -28,23 +31,38 @@ class ParquetMixin:
             Engine to use for loading parquet file. Default is 'pyarrow'.
         **kwargs
             Additional keyword arguments passed to `pandas.read_parquet`.
+            If `columns` or `filters` are given, the file is read through
+            HTTP Range requests and only the footer and the needed column
+            chunks / row groups are downloaded.
 
         Returns
         -------
         pandas.DataFrame or None
             The DataFrame loaded from the parquet file, or None if an error occurs.
         """
+        if kwargs.get("columns") is not None or kwargs.get("filters") is not None:
+            # loader: let pyarrow seek around the remote file and pull only what it needs
+            def ranged_loader(f, **loader_kwargs):
+                return pd.read_parquet(f, **loader_kwargs)
 
-        def loader(content: bytes, **loader_kwargs):
-            buffer = io.BytesIO(content)
-            return pd.read_parquet(buffer, **loader_kwargs)
+            return self._base_read(
+                dbx_path=dbx_path,
+                directory=directory,
+                filename=filename,
+                downloader=None,
+                loader=ranged_loader,
+                stream=True,
+                seekable=True,
+                engine=engine,
+                **kwargs
+            )
 
         return self._base_read(
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
             downloader=self.dbx.files_download,
-            loader=loader,
+            loader=self._load_parquet,
             engine=engine,
             **kwargs
         )
@@ -66,35 +84,160 @@ class ParquetMixin:
         print_success : bool, optional
             Whether to print a success message upon successful upload.
         print_size : bool, optional
-            Whether to print the file size before upload.
+            Whether to print the file size once written.
         **kwargs
             Additional keyword arguments to pass to `to_parquet`.
         """
 
-        # Serialize DataFrame to parquet bytes in memory
-        buffer = io.BytesIO()
-        df.to_parquet(buffer, engine=engine, **kwargs)
-        buffer.seek(0)
-        parquet_content = buffer.getvalue()
-
-        size_in_mb = len(parquet_content) / (1024 ** 2)
-        if print_size:
-            print(f"Size of the parquet file: {size_in_mb:.2f} MB")
-
-        # Define uploader callable to inject into _base_write
-        def uploader(content: bytes, full_path: str):
-            self.dbx.files_upload(
-                content,
-                full_path,
-                mode=dropbox.files.WriteMode.overwrite
-            )
-
-        # Use CoreMixin's _base_write
-        self._base_write(
-            content=parquet_content,
+        # Serialize the DataFrame straight into the upload, chunk by chunk
+        self._stream_write(
+            writer=lambda f: self._serialize_parquet(df, f, engine=engine, **kwargs),
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
-            uploader=uploader,
-            print_success=print_success
+            print_success=print_success,
+            print_size="parquet" if print_size else None,
         )
+
+    def open_parquet_writer(self, dbx_path: str, directory: str, filename: str, schema=None, print_success=True, **kwargs):
+        """
+        Open a streaming parquet writer that uploads row groups as they are written.
+
+        Each call to `write` adds row groups to the file and the encoded bytes
+        are pushed into a Dropbox upload session as buffers fill, so outputs
+        larger than the available memory can be written. Use as a context
+        manager; the file is committed on exit, or discarded if the block raises.
+        Unlike `write_parquet`, the upload can't be resumed after a failure.
+
+        Parameters
+        ----------
+        dbx_path : str
+            The base Dropbox path where the file will be saved.
+        directory : str
+            The directory within the base path where the file will be saved.
+        filename : str
+            The name of the file (e.g., 'my_dataframe.parquet').
+        schema : pyarrow.Schema, optional
+            Schema of the file. If None, it is taken from the first batch
+            written, and closing the writer before any batch was written
+            uploads nothing and raises ValueError.
+        print_success : bool, optional
+            Whether to print a success message once the file is committed.
+        **kwargs
+            Additional keyword arguments passed to `pyarrow.parquet.ParquetWriter`,
+            e.g. `compression`.
+
+        Returns
+        -------
+        DropboxParquetWriter
+            The streaming writer.
+
+        Examples
+        --------
+        >>> with dbx_helper.open_parquet_writer(dbx_helper.output_path, 'panel', 'big.parquet') as writer:
+        ...     for chunk in chunks:
+        ...         writer.write(chunk)
+        """
+        full_path = self._construct_path(dbx_path, directory, filename)
+        return DropboxParquetWriter(UploadStream(self, full_path), schema=schema,
+                                    print_success=print_success, **kwargs)
+
+    @staticmethod
+    def _serialize_parquet(df: pd.DataFrame, f, engine='pyarrow', **kwargs):
+        """
+        Write a DataFrame as parquet to a binary file object.
+        """
+        df.to_parquet(f, engine=engine, **kwargs)
+
+    @classmethod
+    def _dump_parquet(cls, df: pd.DataFrame, engine='pyarrow', **kwargs) -> bytes:
+        """
+        Serialize a DataFrame to parquet bytes.
+        """
+        buffer = io.BytesIO()
+        cls._serialize_parquet(df, buffer, engine=engine, **kwargs)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _load_parquet(content: bytes, **kwargs) -> pd.DataFrame:
+        """
+        Parse parquet bytes into a DataFrame.
+        """
+        return pd.read_parquet(io.BytesIO(content), **kwargs)
+
+
+class DropboxParquetWriter:
+    """
+    Incremental parquet writer backed by a Dropbox upload stream.
+
+    Created by `ParquetMixin.open_parquet_writer`.
+    """
+
+    def __init__(self, stream: UploadStream, schema=None, print_success=True, **kwargs):
+        self._stream = stream
+        self._schema = schema
+        self._print_success = print_success
+        self._kwargs = kwargs
+        self._writer = None
+
+    def write(self, data):
+        """
+        Write a batch of rows as one or more row groups.
+
+        Unlike `write_parquet`, the index of a DataFrame is not written, so
+        that every batch has the same columns; call `reset_index()` first to
+        keep a meaningful index as a column.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame, pyarrow.Table or pyarrow.RecordBatch
+            The rows to append.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, schema=self._schema, preserve_index=False)
+        elif isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
+
+        if self._writer is None:
+            if self._schema is None:
+                self._schema = data.schema
+            self._writer = pq.ParquetWriter(self._stream, self._schema, **self._kwargs)
+        self._writer.write_table(data)
+
+    def close(self):
+        """
+        Write the parquet footer and commit the file to Dropbox.
+
+        Raises
+        ------
+        ValueError
+            If nothing was written and no schema was given, so no valid
+            parquet file can be produced. The upload is aborted.
+        """
+        if self._writer is None and self._schema is None:
+            self.abort()
+            raise ValueError(f"No rows or schema were written to '{self._stream.full_path}'; nothing was uploaded")
+        if self._writer is None:
+            # No rows were written; still produce a valid, empty file
+            self._writer = pq.ParquetWriter(self._stream, self._schema, **self._kwargs)
+        self._writer.close()
+        self._stream.close()
+        if self._print_success:
+            print(f"Uploaded '{os.path.basename(self._stream.full_path)}' to '{self._stream.full_path}'")
+
+    def abort(self):
+        """
+        Discard the file without committing anything to Dropbox.
+        """
+        self._stream.abort()
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
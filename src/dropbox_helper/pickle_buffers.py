@@ -0,0 +1,111 @@
+import pickle
+import struct
+
+# Marks the end of a pickle followed by out-of-band buffers; never the last bytes of a plain pickle
+MAGIC = b"\nDBXOOB\x05"
+# Out-of-band buffers start at multiples of this offset, so arrays over them are aligned
+ALIGNMENT = 64
+# Smaller buffers stay inside the pickle stream
+MIN_OUT_OF_BAND_SIZE = 1024 * 1024
+# Buffers are handed to the file object in slices of this size, so compressors work incrementally
+WRITE_BLOCK_SIZE = 4 * 1024 * 1024
+# Offset and size of each buffer, followed by the trailer: pickle stream length and number of buffers
+INDEX_ENTRY = struct.Struct("<QQ")
+TRAILER = struct.Struct("<QQ")
+
+class _CountingWriter:
+    """
+    Pass writes through to a file object, counting the bytes written.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.written = 0
+
+    def write(self, b):
+        self.f.write(b)
+        n = memoryview(b).nbytes
+        self.written += n
+        return n
+
+def dump(obj, f, min_size: int = MIN_OUT_OF_BAND_SIZE):
+    """
+    Pickle `obj` with protocol 5, writing large buffers out-of-band.
+
+    Contiguous buffers of at least `min_size` bytes, such as the data of
+    NumPy arrays and pandas columns, are not copied into the pickle stream:
+    they are written as-is after it, each aligned to 64 bytes, followed by
+    an index of their offsets and sizes. Nothing is buffered in memory
+    besides the pickle stream itself. If no buffer qualifies, the output is
+    a plain pickle.
+
+    Parameters
+    ----------
+    obj : object
+        The object to pickle.
+    f : file object
+        Writable binary file object receiving the data.
+    min_size : int, optional
+        Size in bytes from which buffers are written out-of-band, by default 1 MiB.
+    """
+    buffers = []
+
+    def buffer_callback(buffer):
+        try:
+            raw = buffer.raw()
+        except BufferError:
+            # Not contiguous, pickled in-band
+            return True
+        if raw.nbytes < min_size:
+            return True
+        buffers.append(raw)
+        return False
+
+    counter = _CountingWriter(f)
+    pickle.dump(obj, counter, protocol=5, buffer_callback=buffer_callback)
+    if not buffers:
+        return
+
+    pos = counter.written
+    index = []
+    for raw in buffers:
+        padding = -pos % ALIGNMENT
+        f.write(bytes(padding))
+        pos += padding
+        index.append((pos, raw.nbytes))
+        for start in range(0, raw.nbytes, WRITE_BLOCK_SIZE):
+            f.write(raw[start:start + WRITE_BLOCK_SIZE])
+        pos += raw.nbytes
+    f.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in index))
+    f.write(TRAILER.pack(counter.written, len(index)))
+    f.write(MAGIC)
+
+def loads(data):
+    """
+    Unpickle data written by `dump`, or a plain pickle.
+
+    Out-of-band buffers are passed to `pickle.loads` as views of `data`, so
+    arrays are reconstructed without copying: they share memory with `data`
+    and are writable only if `data` is, e.g. a `bytearray` or a writable
+    `mmap`.
+
+    Parameters
+    ----------
+    data : bytes-like object
+        The whole file content.
+
+    Returns
+    -------
+    object
+        The unpickled object.
+    """
+    view = memoryview(data)
+    tail = len(MAGIC) + TRAILER.size
+    if len(view) < tail or view[-len(MAGIC):] != MAGIC:
+        return pickle.loads(view)
+
+    pickle_size, count = TRAILER.unpack(view[-tail:-len(MAGIC)])
+    index_start = len(view) - tail - count * INDEX_ENTRY.size
+    buffers = [view[offset:offset + size]
+               for offset, size in INDEX_ENTRY.iter_unpack(view[index_start:-tail])]
+    return pickle.loads(view[:pickle_size], buffers=buffers)
@@ -1,6 +1,15 @@
 import io
+import mmap
+import os
 import pickle
-import dropbox
+import shutil
+from . import pickle_buffers
+from .compression import compressed_writer, detect_compression, infer_compression, open_decompressed, parse_compression
+
+# Name of a pickle unpacked for memory mapping
+PICKLE_MEMBER = "object.pkl"
+# mmap access matching each numpy `mmap_mode`
+MMAP_ACCESS = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
 
 class PickleMixin:
     """
@@ -11,17 +20,25 @@ class PickleMixin:
 
     Methods
     -------
-    read_pickle(dbx_path, directory, filename)
+    read_pickle(dbx_path, directory, filename, compression='infer', mmap_mode=None)
         Downloads and deserializes a pickle file from Dropbox into a Python object.
 
-    write_pickle(obj, dbx_path, directory, filename, print_success=True, print_size=True)
+    write_pickle(obj, dbx_path, directory, filename, print_success=True, print_size=True, compression='infer', out_of_band=False)
         Serializes a Python object into pickle format and uploads it to Dropbox.
+
+    Pickles are written with protocol 5. With ``out_of_band=True``, large
+    buffers such as NumPy array data are stored out-of-band after the pickle
+    stream (see `pickle_buffers`), so that they are uploaded without being
+    copied and unpickled as views of the downloaded or memory-mapped file.
+    Such files can only be read back with `read_pickle`.
     """
 
     def read_pickle(self,
                     dbx_path: str,
                     directory: str,
-                    filename: str) -> object | None:
+                    filename: str,
+                    compression="infer",
+                    mmap_mode: str = None) -> object | None:
         """
         Download and deserialize a pickle file from Dropbox.
 
@@ -33,25 +50,43 @@ class PickleMixin:
             Subdirectory within the base path containing the file.
         filename : str
             Name of the pickle file (e.g., 'model.pkl').
+        compression : str or None, optional
+            Codec the file is compressed with ('gzip', 'zstd' or 'lz4'), None
+            if it isn't, or 'infer' (default) to detect it from the extension
+            ('.gz', '.zst', '.lz4') or the magic bytes at the start of the file.
+        mmap_mode : {'r', 'r+', 'c'}, optional
+            If given, the file is streamed to local disk and stored
+            decompressed under `state_dir` (once per file version), then
+            memory-mapped with this mode, as in `numpy.load`. Arrays stored
+            out-of-band are views of the mapped file, so processes on one
+            node share a single copy in the page cache.
 
         Returns
         -------
         object or None
             The deserialized Python object if successful, otherwise None.
         """
-        # loader: how to turn raw bytes into a Python object
-        def loader(content: bytes):
-            return pickle.loads(content)
-
         # simple full‐download; metadata ignored
         downloader = self.dbx.files_download
+        if compression == "infer":
+            # by extension, else by magic bytes once downloaded
+            compression = infer_compression(filename) or "infer"
+
+        if mmap_mode is not None:
+            full_path = self._construct_path(dbx_path, directory, filename)
+            return self._read_mapped(
+                full_path, filename, None,
+                lambda source, local_dir: self._extract_pickle(source, local_dir, compression),
+                lambda local_dir: self._map_pickle(local_dir, mmap_mode)
+            )
 
         return self._base_read(
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
             downloader=downloader,
-            loader=loader
+            loader=self._load_pickle,
+            codec=compression
         )
 
 
@@ -61,7 +96,9 @@ class PickleMixin:
                      directory: str,
                      filename: str,
                      print_success: bool = True,
-                     print_size: bool = True):
+                     print_size: bool = True,
+                     compression="infer",
+                     out_of_band: bool = False):
         """
         Serialize a Python object and upload it to Dropbox as a pickle file.
 
@@ -78,31 +115,92 @@ class PickleMixin:
         print_success : bool, default=True
             Whether to print a success message after upload.
         print_size : bool, default=True
-            Whether to print the size of the serialized file before upload.
+            Whether to print the size of the serialized file once written.
+        compression : str, dict or None, default='infer'
+            Codec to compress the file with as it is uploaded: 'gzip', 'zstd'
+            or 'lz4', None for no compression, or 'infer' to pick it from the
+            extension of `filename` ('.gz', '.zst', '.lz4'). A dict sets
+            options too, e.g. ``{'method': 'zstd', 'level': 10, 'threads': -1}``.
+        out_of_band : bool, default=False
+            Whether buffers of 1 MiB or more are stored out-of-band after the
+            pickle stream, unpickled without copies by `read_pickle`. Such a
+            file is not a plain pickle: `pickle.load` and `pandas.read_pickle`
+            cannot read it. Objects without such buffers are written as plain
+            pickles either way.
 
         Returns
         -------
         None
         """
-        # turn object → bytes
-        buf = io.BytesIO()
-        pickle.dump(obj, buf)
-        content = buf.getvalue()
-
-        if print_size:
-            size_mb = len(content) / 1024**2
-            print(f"Size of the pickle file: {size_mb:.2f} MB")
-
-        # uploader: direct upload call
-        uploader = lambda b, p: self.dbx.files_upload(
-            b, p, mode=dropbox.files.WriteMode.overwrite
-        )
-
-        self._base_write(
-            content=content,
+        method, options = parse_compression(compression, filename)
+
+        # pickle (and compress) straight into the upload; large buffers are written through as-is
+        def writer(f):
+            with compressed_writer(f, method, **options) as out:
+                if out_of_band:
+                    pickle_buffers.dump(obj, out)
+                else:
+                    pickle.dump(obj, out, protocol=5)
+
+        self._stream_write(
+            writer=writer,
             dbx_path=dbx_path,
             directory=directory,
             filename=filename,
-            uploader=uploader,
-            print_success=print_success
-        )
\ No newline at end of file
+            print_success=print_success,
+            print_size="pickle" if print_size else None,
+        )
+
+    @staticmethod
+    def _dump_pickle(obj: object, out_of_band: bool = False) -> bytes:
+        """
+        Serialize a Python object to pickle bytes with protocol 5, storing large buffers out-of-band if requested.
+        """
+        if not out_of_band:
+            return pickle.dumps(obj, protocol=5)
+        buffer = io.BytesIO()
+        pickle_buffers.dump(obj, buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _load_pickle(content: bytes, codec="infer") -> object:
+        """
+        Deserialize a Python object from pickle bytes, decompressing them with `codec` if needed.
+
+        Out-of-band buffers are unpickled as views of `content`, or of the
+        decompressed data.
+        """
+        if isinstance(codec, dict):
+            codec = codec.get("method")
+        if codec == "infer":
+            codec = detect_compression(bytes(content[:4]))
+        if codec is not None:
+            buffer = io.BytesIO()
+            shutil.copyfileobj(open_decompressed(io.BytesIO(content), codec), buffer, 1024 * 1024)
+            # A writable view of the decompressed data, without copying it again
+            content = buffer.getbuffer()
+        return pickle_buffers.loads(content)
+
+    @staticmethod
+    def _extract_pickle(source: str, local_dir: str, codec="infer"):
+        """
+        Move a downloaded pickle into `local_dir`, decompressing it with `codec` if needed.
+        """
+        target = os.path.join(local_dir, PICKLE_MEMBER)
+        with open(source, "rb") as src:
+            f = open_decompressed(src, codec)
+            if f is not src:
+                with open(target, "wb") as dst:
+                    shutil.copyfileobj(f, dst, 1024 * 1024)
+                return
+        os.replace(source, target)
+
+    @staticmethod
+    def _map_pickle(local_dir: str, mmap_mode: str) -> object:
+        """
+        Unpickle a file unpacked by `_extract_pickle` from a memory map of it.
+        """
+        with open(os.path.join(local_dir, PICKLE_MEMBER), "r+b" if mmap_mode == "r+" else "rb") as f:
+            # The map stays open as long as objects unpickled from it reference it
+            mapped = mmap.mmap(f.fileno(), 0, access=MMAP_ACCESS[mmap_mode])
+        return pickle_buffers.loads(mapped)
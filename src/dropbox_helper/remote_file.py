@@ -0,0 +1,123 @@
+import io
+from collections import OrderedDict
+
+class DropboxFile(io.RawIOBase):
+    """
+    Read-only, seekable file object backed by HTTP Range requests on Dropbox.
+
+    Only the byte ranges that are actually read are downloaded, which lets
+    readers such as pyarrow fetch a parquet footer and the column chunks they
+    need instead of the whole file. Small reads are served from a small LRU
+    cache of aligned blocks, so that neighbouring small reads (e.g. footer
+    and metadata) don't each cost a request; larger reads are fetched as is.
+
+    Parameters
+    ----------
+    helper : CoreMixin
+        Helper used to issue the ranged requests.
+    full_path : str
+        Full Dropbox path of the file.
+    size : int, optional
+        Size of the file in bytes. Looked up with `files_get_metadata` if None.
+    block_size : int, optional
+        Size in bytes of the cached blocks, by default 64 KiB. Reads of at
+        least this size bypass the cache.
+    max_blocks : int, optional
+        Maximum number of blocks kept in the cache, by default 64.
+
+    Attributes
+    ----------
+    bytes_fetched : int
+        Total number of bytes downloaded so far.
+    """
+
+    def __init__(self, helper, full_path: str, size: int = None,
+                 block_size: int = 64 * 1024, max_blocks: int = 64):
+        super().__init__()
+        self._helper = helper
+        self.name = full_path
+        if size is None:
+            size = helper.dbx.files_get_metadata(full_path).size
+        self.size = size
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.bytes_fetched = 0
+        self._pos = 0
+        self._blocks = OrderedDict()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, b):
+        view = memoryview(b).cast("B")
+        start = self._pos
+        end = min(start + len(view), self.size)
+        if start >= end:
+            return 0
+
+        if end - start >= self.block_size:
+            # Large reads go straight through instead of flushing the cache
+            view[:end - start] = self._fetch(start, end)
+        else:
+            self._load_blocks(start, end)
+            pos = start
+            while pos < end:
+                index = pos // self.block_size
+                self._blocks.move_to_end(index)
+                block = self._blocks[index]
+                offset = pos - index * self.block_size
+                n = min(len(block) - offset, end - pos)
+                view[pos - start:pos - start + n] = block[offset:offset + n]
+                pos += n
+
+        self._pos = end
+        return end - start
+
+    def _load_blocks(self, start, end):
+        first = start // self.block_size
+        last = (end - 1) // self.block_size
+        missing = [i for i in range(first, last + 1) if i not in self._blocks]
+        if not missing:
+            return
+
+        # One request for the whole run of missing blocks
+        range_start = missing[0] * self.block_size
+        range_end = min((missing[-1] + 1) * self.block_size, self.size)
+        data = self._fetch(range_start, range_end)
+        for i in range(missing[0], missing[-1] + 1):
+            offset = (i - missing[0]) * self.block_size
+            self._blocks[i] = data[offset:offset + self.block_size]
+            self._blocks.move_to_end(i)
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+
+    def _fetch(self, start, end):
+        data = self._helper._download_range(self.name, start, end - 1)
+        if len(data) != end - start:
+            raise IOError(f"Expected {end - start} bytes from '{self.name}', got {len(data)}")
+        self.bytes_fetched += len(data)
+        return data
+
+    def close(self):
+        self._blocks.clear()
+        super().close()
@@ -1,8 +1,19 @@
 import os
 import tempfile
+import zipfile
 import geopandas as gpd
 import dropbox
 import io
+from concurrent.futures import ThreadPoolExecutor
+
+# Shapefile components, in the order they are listed; .prj and .cpg are optional
+SHP_EXTENSIONS = [".shp", ".shx", ".dbf", ".prj", ".cpg"]
+OPTIONAL_SHP_EXTENSIONS = [".prj", ".cpg", ".qix"]
+# Spatial index written by GDAL with SPATIAL_INDEX=YES, only fetched for bbox reads
+SHP_INDEX_EXTENSION = ".qix"
+# Single-object geo formats understood by read_geo / write_geo
+GEOPARQUET_EXTENSIONS = (".parquet", ".geoparquet")
+ZIPPED_SHP_EXTENSIONS = (".shp.zip", ".shz")
 
 class ShapefileMixin:
     """
@@ -13,21 +24,40 @@ class ShapefileMixin:
 
     Methods
     -------
-    read_shp(dbx_path, directory, filename, **kwargs)
+    read_shp(dbx_path, directory, filename, bbox=None, columns=None, where=None, use_arrow=False, **kwargs)
         Download and load a shapefile (with its components) from Dropbox into a GeoDataFrame.
 
     write_shp(gdf, dbx_path, directory, filename)
         Save a GeoDataFrame to a shapefile and upload its components to Dropbox.
+
+    read_geo(dbx_path, directory, filename, bbox=None, columns=None, **kwargs)
+        Load a GeoParquet file, a zipped shapefile or a shapefile into a GeoDataFrame.
+
+    write_geo(gdf, dbx_path, directory, filename, **kwargs)
+        Save a GeoDataFrame as a single GeoParquet file or zipped shapefile.
     """
 
     def read_shp(self,
                 dbx_path: str,
-                directory: str, 
+                directory: str,
                 filename: str,
+                bbox: tuple = None,
+                columns: list = None,
+                where: str = None,
+                use_arrow: bool = False,
                 **kwargs) -> gpd.GeoDataFrame | None:
         """
         Download and load a shapefile (with all its components) from Dropbox into a GeoDataFrame.
 
+        The components are downloaded concurrently and read from memory: they
+        are packed into an uncompressed in-memory zip that GDAL opens through
+        `/vsimem/`, so nothing is written to a temporary directory.
+
+        Filters are pushed down into GDAL, so features outside `bbox`, rows not
+        matching `where` and unselected columns are skipped rather than
+        decoded into the GeoDataFrame. If the shapefile has a `.qix` spatial
+        index (see `write_shp`), it is downloaded along for `bbox` reads.
+
         Parameters
         ----------
         dbx_path : str
@@ -36,6 +66,18 @@ class ShapefileMixin:
             Subdirectory within the base path containing the shapefile components.
         filename : str
             Name of the main shapefile (.shp extension required).
+        bbox : tuple of float, optional
+            (minx, miny, maxx, maxy) in the layer's CRS; only features
+            intersecting it are read.
+        columns : list of str, optional
+            Attribute columns to read; the geometry is always included.
+        where : str, optional
+            SQL WHERE clause on the attributes, e.g. ``"ISO_A3 = 'KEN'"``.
+            With `columns`, the attributes it uses must be among them, since
+            GDAL skips unselected fields before filtering.
+        use_arrow : bool, optional
+            Read through Arrow with pyogrio, which is considerably faster for
+            large layers, by default False.
         **kwargs : dict, optional
             Additional keyword arguments passed to `geopandas.read_file`.
 
@@ -44,32 +86,29 @@ class ShapefileMixin:
         geopandas.GeoDataFrame or None
             The loaded GeoDataFrame if successful; otherwise, None.
         """
-        # Needed shapefile extensions
-        SHP_EXTENSIONS = [".shp", ".shx", ".dbf", ".prj", ".cpg"]
-
         try:
-            # Create a temporary directory
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Download all components
-                for ext in SHP_EXTENSIONS:
-                    full_path = os.path.join(dbx_path, directory, filename.replace(".shp", ext))
-                    try:
-                        md, res = self.dbx.files_download(full_path)
-                        local_fp = os.path.join(tmpdir, os.path.basename(full_path))
-                        with open(local_fp, "wb") as f:
-                            f.write(res.content)
-                    except dropbox.exceptions.ApiError as e:
-                        # Allow missing .prj or .cpg files
-                        if ext in [".prj", ".cpg"]:
-                            continue
-                        else:
-                            raise e
-
-                # Now read the .shp file from local temp directory
-                shp_path = os.path.join(tmpdir, filename)
-                return gpd.read_file(shp_path, **kwargs)
+            stem = filename[:-len(".shp")] if filename.endswith(".shp") else filename
+            extensions = SHP_EXTENSIONS + [SHP_INDEX_EXTENSION] if bbox is not None else SHP_EXTENSIONS
+
+            def download(ext):
+                full_path = self._construct_path(dbx_path, directory, stem + ext)
+                try:
+                    return self._download_content(full_path)
+                except dropbox.exceptions.ApiError:
+                    # Allow missing .prj or .cpg files
+                    if ext in OPTIONAL_SHP_EXTENSIONS:
+                        return None
+                    raise
+
+            with ThreadPoolExecutor(max_workers=len(extensions)) as pool:
+                components = dict(zip(extensions, pool.map(download, extensions)))
+
+            return gpd.read_file(self._zip_shapefile(stem, components), bbox=bbox, columns=columns,
+                                 **self._ogr_filters(where, use_arrow), **kwargs)
 
         except Exception as e:
+            if self.raise_on_error:
+                raise
             print(f"Failed to read shapefile: {e}")
             return None
 
@@ -78,7 +117,8 @@ class ShapefileMixin:
                   gdf: gpd.GeoDataFrame,
                   dbx_path: str,
                   directory: str,
-                  filename: str) -> None:
+                  filename: str,
+                  **kwargs) -> None:
         """
         Save a GeoDataFrame to a shapefile and upload all component files to Dropbox.
 
@@ -92,27 +132,250 @@ class ShapefileMixin:
             Subdirectory within the base path where files will be saved.
         filename : str
             Base filename (without extension) for the shapefile (e.g., 'my_shapefile').
+        **kwargs : dict, optional
+            Additional keyword arguments passed to `GeoDataFrame.to_file`, e.g.
+            ``SPATIAL_INDEX='YES'`` to also write a `.qix` spatial index that
+            speeds up `bbox` reads.
 
         Returns
         -------
         None
-            The method uploads components individually; upload success is printed.
+            The method uploads components concurrently; upload success is printed.
         """
-        exts = ['.shp', '.shx', '.dbf', '.prj', '.cpg']
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gdf.to_file(os.path.join(tmpdir, filename + '.shp'), driver='ESRI Shapefile')
-            for ext in exts:
-                local = os.path.join(tmpdir, filename + ext)
-                if not os.path.exists(local):
-                    continue
-                content = open(local, 'rb').read()
-                self._base_write(
-                    content=content,
+        components = self._dump_shapefile(gdf, filename, **kwargs)
+
+        def upload(item):
+            ext, content = item
+            self._base_write(
+                content=content,
+                dbx_path=dbx_path,
+                directory=directory,
+                filename=filename + ext,
+                uploader=lambda b, p: self.dbx.files_upload(
+                    b, p, mode=dropbox.files.WriteMode.overwrite
+                ),
+                print_success=True
+            )
+
+        with ThreadPoolExecutor(max_workers=len(components)) as pool:
+            list(pool.map(upload, components.items()))
+
+    def read_geo(self,
+                 dbx_path: str,
+                 directory: str,
+                 filename: str,
+                 bbox: tuple = None,
+                 columns: list = None,
+                 **kwargs) -> gpd.GeoDataFrame | None:
+        """
+        Load geographic data stored on Dropbox into a GeoDataFrame.
+
+        The format is picked from the extension of `filename`: GeoParquet
+        ('.parquet', '.geoparquet') and zipped shapefiles ('.shp.zip', '.shz')
+        are single objects fetched with one download; '.shp' is read with
+        `read_shp`.
+
+        With `bbox` or `columns`, a GeoParquet file is read through HTTP Range
+        requests: only the footer, the selected columns and the row groups
+        whose bbox covering column (see `write_geo`) intersects `bbox` are
+        downloaded.
+
+        Parameters
+        ----------
+        dbx_path : str
+            Base Dropbox path where the file is located.
+        directory : str
+            Subdirectory within the base path containing the file.
+        filename : str
+            Name of the file, including its extension.
+        bbox : tuple of float, optional
+            (minx, miny, maxx, maxy); only features intersecting it are read.
+        columns : list of str, optional
+            Columns to read. For GeoParquet, include the geometry column.
+        **kwargs : dict, optional
+            Additional keyword arguments passed to `geopandas.read_parquet`
+            for GeoParquet, or to `read_shp` / `geopandas.read_file` otherwise
+            (e.g. `where` and `use_arrow`).
+
+        Returns
+        -------
+        geopandas.GeoDataFrame or None
+            The loaded GeoDataFrame if successful; otherwise, None.
+        """
+        name = filename.lower()
+        if name.endswith(".shp"):
+            return self.read_shp(dbx_path, directory, filename, bbox=bbox, columns=columns, **kwargs)
+        if name.endswith(GEOPARQUET_EXTENSIONS):
+            if bbox is not None or columns is not None:
+                # loader: let pyarrow seek around the remote file and pull only what it needs
+                def ranged_loader(f, **loader_kwargs):
+                    return gpd.read_parquet(f, **loader_kwargs)
+
+                return self._base_read(
                     dbx_path=dbx_path,
                     directory=directory,
-                    filename=filename + ext,
-                    uploader=lambda b, p: self.dbx.files_upload(
-                        b, p, mode=dropbox.files.WriteMode.overwrite
-                    ),
-                    print_success=True
+                    filename=filename,
+                    downloader=None,
+                    loader=ranged_loader,
+                    stream=True,
+                    seekable=True,
+                    bbox=bbox,
+                    columns=columns,
+                    **kwargs
                 )
+            loader = self._load_geoparquet
+        elif name.endswith(ZIPPED_SHP_EXTENSIONS):
+            loader = self._load_geo_file
+            kwargs.update(self._ogr_filters(kwargs.pop("where", None), kwargs.pop("use_arrow", False)))
+            if bbox is not None or columns is not None:
+                kwargs.update(bbox=bbox, columns=columns)
+        else:
+            raise ValueError(f"Unsupported geo format for '{filename}'; expected .parquet, .shp.zip or .shp")
+
+        return self._base_read(
+            dbx_path=dbx_path,
+            directory=directory,
+            filename=filename,
+            downloader=self.dbx.files_download,
+            loader=loader,
+            **kwargs
+        )
+
+    def write_geo(self,
+                  gdf: gpd.GeoDataFrame,
+                  dbx_path: str,
+                  directory: str,
+                  filename: str,
+                  print_success: bool = True,
+                  **kwargs) -> None:
+        """
+        Save a GeoDataFrame to Dropbox as a single object.
+
+        The format is picked from the extension of `filename`: GeoParquet
+        ('.parquet', '.geoparquet') is serialized straight into the upload,
+        and a shapefile is packed into one zip ('.shp.zip', '.shz') that GDAL
+        and `read_geo` open directly. '.shp' falls back to `write_shp`.
+
+        GeoParquet is written with a bbox covering column by default, which
+        lets `read_geo(bbox=...)` skip row groups. Pruning works best when
+        nearby features are stored together, e.g. after sorting by
+        `gdf.hilbert_distance()`, and with a `row_group_size` well below the
+        number of rows.
+
+        Parameters
+        ----------
+        gdf : geopandas.GeoDataFrame
+            The GeoDataFrame to save.
+        dbx_path : str
+            Base Dropbox path where the file will be saved.
+        directory : str
+            Subdirectory within the base path where the file will be saved.
+        filename : str
+            Name of the file, including its extension (e.g., 'countries.parquet').
+        print_success : bool, optional
+            Whether to print a success message upon completion (default: True).
+        **kwargs : dict, optional
+            Additional keyword arguments passed to `GeoDataFrame.to_parquet`
+            for GeoParquet, or to `GeoDataFrame.to_file` for shapefiles.
+
+        Returns
+        -------
+        None
+        """
+        name = filename.lower()
+        if name.endswith(".shp"):
+            return self.write_shp(gdf, dbx_path, directory, filename[:-len(".shp")], **kwargs)
+        if name.endswith(GEOPARQUET_EXTENSIONS):
+            kwargs.setdefault("write_covering_bbox", True)
+            writer = lambda f: gdf.to_parquet(f, **kwargs)
+        elif name.endswith(ZIPPED_SHP_EXTENSIONS):
+            extension = next(ext for ext in ZIPPED_SHP_EXTENSIONS if name.endswith(ext))
+            stem = os.path.basename(filename)[:-len(extension)]
+            writer = lambda f: self._zip_shapefile(stem, self._dump_shapefile(gdf, stem, **kwargs),
+                                                   out=f, compression=zipfile.ZIP_DEFLATED)
+        else:
+            raise ValueError(f"Unsupported geo format for '{filename}'; expected .parquet, .shp.zip or .shp")
+
+        self._stream_write(
+            writer=writer,
+            dbx_path=dbx_path,
+            directory=directory,
+            filename=filename,
+            print_success=print_success
+        )
+
+    @staticmethod
+    def _ogr_filters(where: str = None, use_arrow: bool = False) -> dict:
+        """
+        Keyword arguments for the pyogrio-only filters that are set.
+        """
+        filters = {}
+        if where is not None:
+            filters["where"] = where
+        if use_arrow:
+            filters["use_arrow"] = True
+        return filters
+
+    @staticmethod
+    def _dump_shapefile(gdf: gpd.GeoDataFrame, stem: str, **kwargs) -> dict:
+        """
+        Serialize a GeoDataFrame to shapefile components.
+
+        GDAL can only write a multi-file format to a file system, so the
+        shapefile is written to a temporary directory once and its components
+        are read back into memory.
+
+        Returns
+        -------
+        dict
+            Component extension (e.g. '.shp') to its bytes.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            gdf.to_file(os.path.join(tmpdir, stem + ".shp"), driver="ESRI Shapefile", **kwargs)
+            components = {}
+            for ext in SHP_EXTENSIONS + [SHP_INDEX_EXTENSION]:
+                local = os.path.join(tmpdir, stem + ext)
+                if os.path.exists(local):
+                    with open(local, "rb") as f:
+                        components[ext] = f.read()
+            return components
+
+    @staticmethod
+    def _zip_shapefile(stem: str, components: dict, out=None, compression=zipfile.ZIP_STORED):
+        """
+        Pack shapefile components into a zip archive.
+
+        Parameters
+        ----------
+        stem : str
+            Name of the shapefile without extension.
+        components : dict
+            Component extension to its bytes; None entries are skipped.
+        out : file object, optional
+            Writable binary file object to write the archive to. If None, an
+            in-memory buffer is used and returned, rewound.
+        compression : int, optional
+            Zip compression method; by default the components are stored as-is.
+        """
+        buffer = io.BytesIO() if out is None else out
+        with zipfile.ZipFile(buffer, "w", compression) as archive:
+            for ext, content in components.items():
+                if content is not None:
+                    archive.writestr(stem + ext, content)
+        if out is None:
+            buffer.seek(0)
+            return buffer
+
+    @staticmethod
+    def _load_geoparquet(content: bytes, **kwargs) -> gpd.GeoDataFrame:
+        """
+        Parse GeoParquet bytes into a GeoDataFrame.
+        """
+        return gpd.read_parquet(io.BytesIO(content), **kwargs)
+
+    @staticmethod
+    def _load_geo_file(content: bytes, **kwargs) -> gpd.GeoDataFrame:
+        """
+        Parse a single-file geo format, such as a zipped shapefile, into a GeoDataFrame.
+        """
+        return gpd.read_file(io.BytesIO(content), **kwargs)
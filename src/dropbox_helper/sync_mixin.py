@@ -0,0 +1,315 @@
+import dropbox
+import fnmatch
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from .content_hash import file_content_hash
+
+class SyncMixin:
+    """
+    Mixin providing incremental synchronization with Dropbox folders.
+
+    Change tracking is built on Dropbox listing cursors, which are persisted
+    under `self.state_dir` so they survive across processes.
+    """
+
+    def _cursor_state_path(self, folder_path: str, recursive: bool) -> str:
+        key = hashlib.sha256(f"{folder_path.lower()}:{recursive}".encode("utf-8")).hexdigest()
+        return os.path.join(self.state_dir, "cursors", f"{key}.json")
+
+    def changes_since(self, folder_path: str, recursive: bool = True, include_existing: bool = True) -> dict:
+        """
+        Return the files added, modified or deleted in a folder since the last call.
+
+        Later calls only send the stored cursor to `files_list_folder_continue`,
+        so polling a large, mostly unchanged tree costs a single small request.
+        The cursor and an index of known file revisions are stored locally;
+        Dropbox reports new and overwritten files alike, and the index is what
+        tells 'added' from 'modified'. It is only rewritten when something changed.
+
+        By default the first call makes a baseline listing of the whole tree
+        (`files_list_folder` plus one `files_list_folder_continue` per 2000
+        entries), reports every existing file as added and indexes it. With
+        `include_existing=False` it instead only fetches
+        `files_list_folder_get_latest_cursor` and returns no changes, which
+        costs one request regardless of the tree size; since no earlier
+        revision of the existing files is then known, a pre-existing file is
+        reported as added the first time it changes, and a deleted folder is
+        reported by its own path when none of its files are indexed. If the cursor is reset
+        by Dropbox, the folder is listed again and diffed against the index.
+
+        Parameters
+        ----------
+        folder_path : str
+            Path of the folder in Dropbox.
+        recursive : bool, optional
+            If True (default), track changes in subfolders too.
+        include_existing : bool, optional
+            Whether the first call lists and reports the files already in the
+            folder (default) or starts from the latest cursor.
+
+        Returns
+        -------
+        dict
+            With keys 'added' and 'modified' (lists of `dropbox.files.FileMetadata`)
+            and 'deleted' (list of deleted paths).
+        """
+        state_path = self._cursor_state_path(folder_path, recursive)
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {"cursor": None, "files": {}}
+
+        # Index of known files: lowercase path -> [display path, rev]
+        known = state["files"]
+        changes = {"added": [], "modified": [], "deleted": []}
+        if state["cursor"] is None and not include_existing:
+            cursor = self.dbx.files_list_folder_get_latest_cursor(folder_path, recursive=recursive).cursor
+            self._save_cursor_state(state_path, folder_path, cursor, known)
+            return changes
+
+        try:
+            entries, cursor = self._list_changes(folder_path, recursive, state["cursor"])
+            full_listing = state["cursor"] is None
+        except dropbox.exceptions.ApiError as err:
+            if not (isinstance(err.error, dropbox.files.ListFolderContinueError) and err.error.is_reset()):
+                raise
+            # The cursor was invalidated on the server; relist and diff against the index
+            entries, cursor = self._list_changes(folder_path, recursive, None)
+            full_listing = True
+
+        seen = set()
+        for entry in entries:
+            if isinstance(entry, dropbox.files.FileMetadata):
+                seen.add(entry.path_lower)
+                previous = known.get(entry.path_lower)
+                if previous is None:
+                    changes["added"].append(entry)
+                elif previous[1] != entry.rev:
+                    changes["modified"].append(entry)
+                known[entry.path_lower] = [entry.path_display, entry.rev]
+            elif isinstance(entry, dropbox.files.DeletedMetadata):
+                # A deleted folder takes every file below it with it
+                prefix = entry.path_lower + "/"
+                removed = [p for p in known if p == entry.path_lower or p.startswith(prefix)]
+                for path in removed:
+                    changes["deleted"].append(known.pop(path)[0])
+                if not removed:
+                    # Not indexed, e.g. a file that predates a start from the latest cursor
+                    changes["deleted"].append(entry.path_display)
+
+        if full_listing:
+            for path in [p for p in known if p not in seen]:
+                changes["deleted"].append(known.pop(path)[0])
+
+        if entries or full_listing:
+            self._save_cursor_state(state_path, folder_path, cursor, known)
+        return changes
+
+    @staticmethod
+    def _save_cursor_state(state_path: str, folder_path: str, cursor: str, known: dict):
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"folder": folder_path, "cursor": cursor, "files": known}, f)
+        os.replace(tmp_path, state_path)
+
+    def _list_changes(self, folder_path: str, recursive: bool, cursor: str | None):
+        """
+        Collect all entries from a full listing (no cursor) or since `cursor`.
+
+        Returns the entries and the cursor to resume from next time.
+        """
+        if cursor is None:
+            result = self.dbx.files_list_folder(folder_path, recursive=recursive, limit=2000)
+        else:
+            result = self.dbx.files_list_folder_continue(cursor)
+        entries = list(result.entries)
+        while result.has_more:
+            result = self.dbx.files_list_folder_continue(result.cursor)
+            entries.extend(result.entries)
+        for entry in entries:
+            self._cache_metadata(entry)
+        return entries, result.cursor
+
+    def sync_down(self, dbx_folder: str, local_dir: str, max_workers: int = 8,
+                  extensions=None, pattern=None, print_success: bool = True) -> dict:
+        """
+        Mirror a Dropbox folder tree to a local directory, downloading only what changed.
+
+        Local files are compared against the Dropbox `content_hash` of each
+        remote file (sizes are compared first, so most unchanged files are not
+        even hashed). Changed or missing files are downloaded concurrently and
+        streamed straight to disk, each written atomically.
+
+        Parameters
+        ----------
+        dbx_folder : str
+            Path of the folder in Dropbox to mirror, recursively.
+        local_dir : str
+            Local directory to mirror into. Created if missing.
+        max_workers : int, optional
+            Maximum number of concurrent downloads, by default 8.
+        extensions : str or list of str, optional
+            Only sync files with these extensions (see `iter_files`).
+        pattern : str, optional
+            Only sync files whose relative path matches this glob (see `iter_files`).
+        print_success : bool, optional
+            Whether to print a summary when done, by default True.
+
+        Returns
+        -------
+        dict
+            With keys 'downloaded' and 'unchanged' (lists of paths relative to
+            `dbx_folder`) and 'failed' (mapping of relative path to error).
+        """
+        prefix_len = len(dbx_folder.rstrip('/')) + 1
+
+        def sync_one(entry):
+            relative_path = entry.path_display[prefix_len:]
+            local_path = os.path.join(local_dir, *relative_path.split('/'))
+            if self._is_local_copy_current(local_path, entry):
+                return relative_path, False
+            self._download_to_file(entry.path_display, local_path, md=entry)
+            return relative_path, True
+
+        def try_sync_one(entry):
+            try:
+                return sync_one(entry)
+            except Exception as e:
+                return entry.path_display[prefix_len:], e
+
+        summary = {"downloaded": [], "unchanged": [], "failed": {}}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Downloads start while the listing is still being paged through
+            futures = [
+                pool.submit(try_sync_one, entry)
+                for entry in self.iter_files(dbx_folder, recursive=True, extensions=extensions, pattern=pattern)
+            ]
+            for future in futures:
+                relative_path, outcome = future.result()
+                if isinstance(outcome, Exception):
+                    print(f"Error downloading '{relative_path}' from Dropbox: {outcome}")
+                    summary["failed"][relative_path] = outcome
+                elif outcome:
+                    summary["downloaded"].append(relative_path)
+                else:
+                    summary["unchanged"].append(relative_path)
+
+        if print_success:
+            print(f"Synced '{dbx_folder}' to '{local_dir}': {len(summary['downloaded'])} downloaded, "
+                  f"{len(summary['unchanged'])} unchanged, {len(summary['failed'])} failed")
+        return summary
+
+    @staticmethod
+    def _is_local_copy_current(local_path: str, entry: dropbox.files.FileMetadata) -> bool:
+        try:
+            if os.path.getsize(local_path) != entry.size:
+                return False
+        except FileNotFoundError:
+            return False
+        return file_content_hash(local_path) == entry.content_hash
+
+    def sync_up(self, local_dir: str, dbx_folder: str, max_workers: int = 8,
+                extensions=None, pattern=None, print_success: bool = True) -> dict:
+        """
+        Mirror a local directory tree to a Dropbox folder, uploading only what changed.
+
+        The remote folder is listed once and each local file's Dropbox
+        `content_hash` is compared against the listed metadata, so identical
+        files are never re-uploaded. Changed files are uploaded concurrently
+        (memory-mapped, not read into memory) and committed together with
+        `files_upload_session_finish_batch_v2`.
+
+        Parameters
+        ----------
+        local_dir : str
+            Local directory to upload, recursively.
+        dbx_folder : str
+            Path of the destination folder in Dropbox. Created if missing.
+        max_workers : int, optional
+            Maximum number of files hashed and uploaded at the same time, by default 8.
+        extensions : str or list of str, optional
+            Only sync files with these extensions, e.g. `['.parquet']`.
+        pattern : str, optional
+            Only sync files whose path relative to `local_dir` matches this glob.
+        print_success : bool, optional
+            Whether to print a summary when done, by default True.
+
+        Returns
+        -------
+        dict
+            With keys 'uploaded' and 'unchanged' (lists of paths relative to
+            `local_dir`) and 'failed' (mapping of relative path to error).
+        """
+        dbx_folder = dbx_folder.rstrip('/')
+        try:
+            remote = {entry.path_lower: entry for entry in self.iter_files(dbx_folder, recursive=True)}
+        except dropbox.exceptions.ApiError as err:
+            if not (isinstance(err.error, dropbox.files.ListFolderError) and err.error.is_path() and
+                    err.error.get_path().is_not_found()):
+                raise
+            remote = {}
+
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        if extensions is not None:
+            extensions = tuple(ext.lower() for ext in extensions)
+
+        relative_paths = []
+        for root, _, filenames in os.walk(local_dir):
+            for filename in filenames:
+                relative_path = os.path.relpath(os.path.join(root, filename), local_dir).replace(os.sep, '/')
+                if extensions is not None and not filename.lower().endswith(extensions):
+                    continue
+                if pattern is not None and not fnmatch.fnmatch(relative_path, pattern):
+                    continue
+                relative_paths.append(relative_path)
+
+        def sync_one(relative_path):
+            local_path = os.path.join(local_dir, *relative_path.split('/'))
+            full_path = f"{dbx_folder}/{relative_path}"
+            entry = remote.get(full_path.lower())
+            if entry is not None and entry.size == os.path.getsize(local_path) and \
+               entry.content_hash == file_content_hash(local_path):
+                return None
+            session_id, total = self._upload_file_to_session(local_path, full_path)
+            return dropbox.files.UploadSessionFinishArg(
+                cursor=dropbox.files.UploadSessionCursor(session_id=session_id, offset=total),
+                commit=dropbox.files.CommitInfo(path=full_path, mode=dropbox.files.WriteMode.overwrite),
+            )
+
+        def try_sync_one(relative_path):
+            try:
+                return sync_one(relative_path)
+            except Exception as e:
+                return e
+
+        summary = {"uploaded": [], "unchanged": [], "failed": {}}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = list(pool.map(try_sync_one, relative_paths))
+
+        to_commit = []
+        for relative_path, outcome in zip(relative_paths, outcomes):
+            if outcome is None:
+                summary["unchanged"].append(relative_path)
+            elif isinstance(outcome, Exception):
+                summary["failed"][relative_path] = outcome
+            else:
+                to_commit.append((relative_path, outcome))
+
+        committed = self._finish_upload_sessions([entry for _, entry in to_commit])
+        for (relative_path, _), outcome in zip(to_commit, committed):
+            if isinstance(outcome, dropbox.files.FileMetadata):
+                summary["uploaded"].append(relative_path)
+            else:
+                summary["failed"][relative_path] = outcome
+
+        for relative_path, error in summary["failed"].items():
+            print(f"Error uploading '{relative_path}' to Dropbox: {error}")
+        if print_success:
+            print(f"Synced '{local_dir}' to '{dbx_folder}': {len(summary['uploaded'])} uploaded, "
+                  f"{len(summary['unchanged'])} unchanged, {len(summary['failed'])} failed")
+        return summary
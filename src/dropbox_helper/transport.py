@@ -0,0 +1,175 @@
+import logging
+import random
+import threading
+import time
+import dropbox
+import requests
+from dropbox import files
+from dropbox.exceptions import ApiError, InternalServerError, RateLimitError
+
+# Backoff used for a RateLimitError that doesn't say how long to wait
+DEFAULT_RATE_LIMIT_BACKOFF = 5.0
+
+class TokenBucket:
+    """
+    Thread-safe client-side rate limiter.
+
+    Tokens are added at a steady `rate` per second up to `capacity`, and every
+    request takes one, so all threads sharing the bucket together stay under
+    the rate instead of each running into Dropbox's rate limits. When Dropbox
+    answers with a rate-limit error, `pause` holds back every thread for the
+    requested backoff rather than only the one that was throttled.
+
+    Parameters
+    ----------
+    rate : float
+        Sustained number of requests per second.
+    capacity : float, optional
+        Maximum burst size. Defaults to `rate` (one second worth of requests).
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        """
+        Block until `tokens` tokens are available and take them.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        Hold back every caller of `acquire` for the next `seconds` seconds.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class RetryPolicy:
+    """
+    Retries transient Dropbox failures with exponential backoff and jitter.
+
+    Rate-limit errors (HTTP 429 and `too_many_write_operations`), server errors
+    and dropped connections are retried; any other error is raised at once.
+    Rate-limit errors wait for the backoff Dropbox asks for, other errors wait
+    a random time up to `base_delay * 2 ** attempt` ("full jitter"), so that
+    many threads failing together don't retry in lockstep.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        Number of retries after the first attempt, by default 5.
+    base_delay : float, optional
+        Backoff cap in seconds of the first retry, by default 1.
+    max_delay : float, optional
+        Upper bound in seconds of any single backoff, by default 60.
+    rate_limiter : TokenBucket, optional
+        Bucket each attempt takes a token from. It is paused on rate-limit
+        errors so every thread sharing it backs off together.
+    """
+
+    def __init__(self, max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0,
+                 rate_limiter: TokenBucket = None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limiter = rate_limiter
+
+    @staticmethod
+    def is_rate_limit(err: Exception) -> bool:
+        return isinstance(err, RateLimitError) or (
+            isinstance(err, ApiError) and is_too_many_write_operations(err.error)
+        )
+
+    def is_retryable(self, err: Exception) -> bool:
+        if self.is_rate_limit(err) or isinstance(err, InternalServerError):
+            return True
+        if isinstance(err, requests.HTTPError):
+            return err.response is not None and (err.response.status_code == 429 or err.response.status_code >= 500)
+        return isinstance(err, (requests.ConnectionError, requests.Timeout,
+                                requests.exceptions.ChunkedEncodingError))
+
+    def backoff(self, attempt: int, err: Exception = None) -> float:
+        """
+        Return how long to wait before retry number `attempt` (starting at 0).
+        """
+        if err is not None and self.is_rate_limit(err):
+            backoff = getattr(err, "backoff", None)
+            delay = float(backoff) if backoff is not None else DEFAULT_RATE_LIMIT_BACKOFF
+            # A little jitter keeps throttled threads from returning all at once
+            return min(self.max_delay, delay) + random.uniform(0, 1)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, func: callable, *args, **kwargs):
+        """
+        Call `func(*args, **kwargs)`, retrying it on transient failures.
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as err:
+                if attempt == self.max_retries or not self.is_retryable(err):
+                    raise
+                delay = self.backoff(attempt, err)
+                if self.rate_limiter is not None and self.is_rate_limit(err):
+                    self.rate_limiter.pause(delay)
+                logging.warning(f"Dropbox request failed ({err!r}); retry {attempt + 1} in {delay:.1f}s")
+                time.sleep(delay)
+
+
+class RetryingDropbox(dropbox.Dropbox):
+    """
+    `dropbox.Dropbox` client that sends every route call through a `RetryPolicy`.
+
+    The SDK's own retries are turned off so the policy is the only one deciding
+    when and how long to wait; it still refreshes expired access tokens itself.
+    """
+
+    def __init__(self, *args, retry_policy: RetryPolicy = None, **kwargs):
+        kwargs.setdefault("max_retries_on_error", 0)
+        kwargs.setdefault("max_retries_on_rate_limit", 0)
+        super().__init__(*args, **kwargs)
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def request(self, route, namespace, request_arg, request_binary, timeout=None):
+        return self.retry_policy.call(super().request, route, namespace, request_arg,
+                                      request_binary, timeout=timeout)
+
+
+def is_too_many_write_operations(error) -> bool:
+    """
+    Whether a route error is `WriteError.too_many_write_operations`, which
+    several routes nest under their `path` (and `reason`) members.
+    """
+    while error is not None:
+        if isinstance(error, files.WriteError):
+            return error.is_too_many_write_operations()
+        if isinstance(error, files.UploadWriteFailed):
+            error = error.reason
+        elif hasattr(error, "is_path") and error.is_path():
+            error = error.get_path()
+        else:
+            return False
+    return False
@@ -0,0 +1,114 @@
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Upload sessions expire after 7 days; stop trusting checkpoints a day before that
+CHECKPOINT_TTL = 6 * 24 * 60 * 60
+
+class UploadCheckpoint:
+    """
+    On-disk record of a chunked upload in progress.
+
+    The checkpoint remembers the upload session, the fingerprint of the content
+    being uploaded and which chunks Dropbox has acknowledged, so that a retried
+    write or a restarted process sends only the missing chunks to the same
+    session instead of starting over. There is one checkpoint per destination
+    path; it is ignored if the content, the chunk size or the age no longer
+    match, and removed once the upload is committed.
+
+    Parameters
+    ----------
+    state_dir : str
+        Directory holding the checkpoint files.
+    full_path : str
+        Full Dropbox path the upload is committed to.
+    fingerprint : str
+        Identifies the content, e.g. its size and Dropbox `content_hash`.
+    chunk_size : int
+        Size in bytes of the upload chunks.
+
+    Attributes
+    ----------
+    session_id : str or None
+        Id of the upload session to resume, or None if there is none.
+    acknowledged : set of int
+        Offsets of the chunks already received by the session.
+    """
+
+    def __init__(self, state_dir: str, full_path: str, fingerprint: str, chunk_size: int):
+        self.path = self.checkpoint_path(state_dir, full_path)
+        self.full_path = full_path
+        self.fingerprint = fingerprint
+        self.chunk_size = chunk_size
+        self.session_id = None
+        self.created = time.time()
+        self.acknowledged = set()
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if state.get("fingerprint") == fingerprint and state.get("chunk_size") == chunk_size and \
+           time.time() - state.get("created", 0) < CHECKPOINT_TTL:
+            self.session_id = state["session_id"]
+            self.created = state["created"]
+            self.acknowledged = set(state["acknowledged"])
+
+    @staticmethod
+    def checkpoint_path(state_dir: str, full_path: str) -> str:
+        key = hashlib.sha256(full_path.lower().encode("utf-8")).hexdigest()
+        return os.path.join(state_dir, f"{key}.json")
+
+    def start(self, session_id: str):
+        """
+        Record a newly started session, forgetting any previous one.
+        """
+        with self._lock:
+            self.session_id = session_id
+            self.created = time.time()
+            self.acknowledged = set()
+            self._save()
+
+    def acknowledge(self, offset: int):
+        """
+        Record that the chunk at `offset` was received by the session.
+        """
+        with self._lock:
+            self.acknowledged.add(offset)
+            self._save()
+
+    def discard(self):
+        """
+        Forget the session, e.g. because it expired on Dropbox.
+        """
+        with self._lock:
+            self.session_id = None
+            self.acknowledged = set()
+            self.remove(os.path.dirname(self.path), self.full_path)
+
+    @classmethod
+    def remove(cls, state_dir: str, full_path: str):
+        """
+        Delete the checkpoint of an upload to `full_path`, if any.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(cls.checkpoint_path(state_dir, full_path))
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "path": self.full_path,
+                "session_id": self.session_id,
+                "fingerprint": self.fingerprint,
+                "chunk_size": self.chunk_size,
+                "created": self.created,
+                "acknowledged": sorted(self.acknowledged),
+            }, f)
+        os.replace(tmp_path, self.path)
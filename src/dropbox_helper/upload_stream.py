@@ -0,0 +1,234 @@
+import dropbox
+import hashlib
+import io
+import mmap
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from .content_hash import BLOCK_SIZE
+
+class UploadStream(io.RawIOBase):
+    """
+    Writable binary file object that uploads to Dropbox as it is written.
+
+    Data is collected into a buffer of `chunk_size` bytes; each full buffer
+    is appended to a concurrent upload session from a small thread pool while
+    writing continues, so peak memory is bounded by about
+    `chunk_size * (max_workers + 1)` regardless of the total size. Outputs
+    that never fill the first buffer are sent with a single `files_upload`.
+
+    The upload is committed by `close()`. Used as a context manager, the
+    upload is aborted instead if the block raises. If `unchanged_hash` or
+    `resume_size` is given, full buffers are spooled to a local temporary
+    file instead of being sent, and uploaded from it on close. Streamed
+    uploads cannot replay their data, so only spooled ones are resumable.
+
+    Parameters
+    ----------
+    helper : CoreMixin
+        Helper whose Dropbox client performs the upload.
+    full_path : str
+        Full Dropbox path of the file to write.
+    chunk_size : int, optional
+        Buffer size in bytes, rounded down to a multiple of 4 MiB.
+        Defaults to `helper.upload_chunk_size`.
+    max_workers : int, optional
+        Maximum number of chunks in flight. Defaults to `helper.upload_workers`.
+    unchanged_hash : str, optional
+        `content_hash` of the file currently on Dropbox. The hash of the
+        written data is computed on the fly; if it matches, nothing is sent.
+    resume_size : int, optional
+        Spooled output of at least this many bytes is uploaded in a
+        checkpointed session (see `UploadCheckpoint`), so that writing the
+        same data to the same path again after a failure, e.g. from a
+        restarted process, resumes from the chunks already acknowledged.
+
+    Attributes
+    ----------
+    metadata : dropbox.files.FileMetadata or None
+        Metadata of the uploaded file, set once the stream is closed.
+    skipped : bool
+        Whether the commit was skipped because the data was unchanged.
+    """
+
+    def __init__(self, helper, full_path: str, chunk_size: int = None, max_workers: int = None,
+                 unchanged_hash: str = None, resume_size: int = None):
+        super().__init__()
+        self._helper = helper
+        self.full_path = full_path
+        self.chunk_size = helper._upload_chunk_size(chunk_size)
+        self.max_workers = max_workers or helper.upload_workers
+        self.metadata = None
+        self.skipped = False
+        self._unchanged_hash = unchanged_hash
+        self._resume_size = resume_size
+        self._spooling = unchanged_hash is not None or resume_size is not None
+        self._block_digests = []
+        self._buffer = bytearray()
+        self._offset = 0
+        self._spool = None
+        self._spooled = 0
+        self._session_id = None
+        self._pool = None
+        self._pending = []
+        self._aborted = False
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._offset + self._spooled + len(self._buffer)
+
+    def write(self, b):
+        if self._aborted:
+            # Writers still flushing after an abort are silently discarded
+            return memoryview(b).nbytes
+        if self.closed:
+            raise ValueError("write to closed UploadStream")
+        view = memoryview(b).cast("B")
+        n = len(view)
+        while view:
+            # A full buffer is only sent once more data arrives, so that the
+            # last chunk is always available to close the session with
+            if len(self._buffer) == self.chunk_size:
+                if self._spooling:
+                    self._spool_chunk()
+                else:
+                    self._send_chunk()
+            space = self.chunk_size - len(self._buffer)
+            self._buffer += view[:space]
+            view = view[space:]
+        return n
+
+    def _send_chunk(self, close=False):
+        if self._session_id is None:
+            self._session_id = self._helper._start_upload_session()
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        # Bound the memory held by chunks in flight
+        while len(self._pending) >= self.max_workers:
+            self._pending.pop(0).result()
+
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        future = self._pool.submit(self._helper._append_upload_chunk,
+                                   self._session_id, self._offset, chunk, close)
+        self._offset += len(chunk)
+        self._pending.append(future)
+
+    def _spool_chunk(self):
+        # Held back until the output is complete, so that unchanged data is never
+        # sent and large data can be uploaded resumably. Full buffers are whole 4 MiB blocks.
+        if self._unchanged_hash is not None:
+            self._hash_blocks(self._buffer)
+        if self._spool is None:
+            self._spool = tempfile.TemporaryFile()
+        self._spool.write(self._buffer)
+        self._spooled += len(self._buffer)
+        self._buffer.clear()
+
+    def _upload_spool(self):
+        # Send the spooled data, then the data still in the buffer, as if just written
+        self._spooling = False
+        tail = bytes(self._buffer)
+        self._buffer.clear()
+        spool, self._spool = self._spool, None
+        self._spooled = 0
+        with spool:
+            spool.seek(0)
+            while chunk := spool.read(self.chunk_size):
+                self.write(chunk)
+        self.write(tail)
+
+    def _upload_spool_resumable(self):
+        # Upload the spool as a whole, memory-mapped, so that the session can be checkpointed
+        self._spool.write(self._buffer)
+        self._buffer.clear()
+        self._spool.flush()
+        # Closed only on success: after a failure, the traceback still holds views of the map
+        mapped = mmap.mmap(self._spool.fileno(), 0, access=mmap.ACCESS_READ)
+        session_id, total = self._helper._upload_to_session(
+            mapped, self.chunk_size, self.max_workers, full_path=self.full_path
+        )
+        mapped.close()
+        self.metadata = self._helper._finish_upload_session(session_id, total, self.full_path)
+
+    def _hash_blocks(self, data):
+        view = memoryview(data)
+        for start in range(0, len(view), BLOCK_SIZE):
+            self._block_digests.append(hashlib.sha256(view[start:start + BLOCK_SIZE]).digest())
+
+    def _is_unchanged(self) -> bool:
+        if self._unchanged_hash is None:
+            return False
+        self._hash_blocks(self._buffer)
+        digests = b"".join(self._block_digests)
+        self._block_digests.clear()
+        unchanged_hash, self._unchanged_hash = self._unchanged_hash, None
+        return hashlib.sha256(digests).hexdigest() == unchanged_hash
+
+    def close(self):
+        """
+        Flush the remaining data and commit the upload.
+        """
+        if self.closed:
+            return
+        try:
+            if not self._aborted:
+                self._commit()
+        finally:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+            super().close()
+
+    def _commit(self):
+        if self._is_unchanged():
+            self._buffer.clear()
+            self.skipped = True
+            return
+        if self._spool is not None:
+            if self._resume_size is not None and self.tell() >= self._resume_size:
+                self._upload_spool_resumable()
+                return
+            self._upload_spool()
+
+        if self._session_id is None:
+            self.metadata = self._helper.dbx.files_upload(
+                bytes(self._buffer),
+                self.full_path,
+                mode=dropbox.files.WriteMode.overwrite,
+            )
+            self._helper._cache_metadata(self.metadata)
+            self._buffer.clear()
+            return
+
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+        # Closing the session must come after every other chunk has landed
+        self._send_chunk(close=True)
+        self._pending.pop().result()
+        self.metadata = self._helper._finish_upload_session(
+            self._session_id, self._offset, self.full_path
+        )
+
+    def abort(self):
+        """
+        Discard the upload without committing anything to Dropbox.
+        """
+        self._aborted = True
+        self._buffer.clear()
+        self.close()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def __del__(self):
+        # Never commit a half-written file from the garbage collector
+        if not self.closed:
+            self.abort()
@@ -0,0 +1,47 @@
+import pytest
+import asyncio
+import os
+import dropbox
+from tests.utils import generate_random_dataframe
+from tests.test_init import dropbox_test_folder
+
+pytest.importorskip("httpx")
+from dropbox_helper import get_async_dbx_helper
+
+@pytest.mark.usefixtures("dropbox_test_folder")
+class TestAsyncDropboxHelper:
+    fnames = [f'async_{i}.csv' for i in range(10)]
+
+    @pytest.mark.order(20)
+    def test_async_write_and_read(self):
+        async def roundtrip():
+            async with get_async_dbx_helper(max_concurrency=8) as helper:
+                dfs = [generate_random_dataframe(size_mb=.01, seed=i) for i in range(len(self.fnames))]
+                mds = await asyncio.gather(*(
+                    helper.write_csv(df, self.output_path, self.dir, fname, index=False)
+                    for df, fname in zip(dfs, self.fnames)
+                ))
+                assert all(isinstance(md, dropbox.files.FileMetadata) for md in mds), "Some uploads failed!"
+
+                files = await helper.list_files_in_folder(os.path.join(self.output_path, self.dir))
+                for fname in self.fnames:
+                    assert fname in files, f"{fname} not found in Dropbox folder!"
+
+                loaded = await asyncio.gather(*(
+                    helper.read_csv(self.output_path, self.dir, fname) for fname in self.fnames
+                ))
+                for df, expected in zip(loaded, dfs):
+                    assert df.shape == expected.shape, "Async read returned the wrong data!"
+
+        asyncio.run(roundtrip())
+
+    @pytest.mark.order(20)
+    def test_async_folders(self):
+        async def folders():
+            async with get_async_dbx_helper() as helper:
+                folder = os.path.join(self.output_path, self.dir, 'async_sub')
+                assert not await helper.folder_exists(folder)
+                await helper.create_folder(folder)
+                assert await helper.folder_exists(folder), "Folder was not created!"
+
+        asyncio.run(folders())
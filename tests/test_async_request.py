@@ -0,0 +1,59 @@
+import asyncio
+import json
+import pytest
+from dropbox import files
+from dropbox.exceptions import AuthError
+
+httpx = pytest.importorskip("httpx")
+from dropbox_helper import async_helper
+from dropbox_helper.async_helper import AsyncDropboxHelper
+
+FILE_METADATA = {"name": "a.bin", "path_lower": "/a.bin", "path_display": "/a.bin", "id": "id:a",
+                 "client_modified": "2024-01-01T00:00:00Z", "server_modified": "2024-01-01T00:00:00Z",
+                 "rev": "0123456789", "size": 1}
+
+
+def _helper(handler, max_retries):
+    def route(request):
+        if request.url.path == "/oauth2/token":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 14400})
+        return handler(request)
+
+    helper = AsyncDropboxHelper("refresh", "key", "secret", max_retries=max_retries)
+    helper.client = httpx.AsyncClient(transport=httpx.MockTransport(route))
+    helper.retry_policy.backoff = lambda *args: 0
+    return helper
+
+
+def test_unauthorized_on_last_attempt_raises_auth_error():
+    helper = _helper(lambda request: httpx.Response(401, text="expired_access_token"), max_retries=0)
+    with pytest.raises(AuthError):
+        asyncio.run(helper._request(files.get_metadata, files.GetMetadataArg(path="/a.bin")))
+
+
+def test_lost_append_response_is_not_fatal(monkeypatch):
+    monkeypatch.setattr(async_helper, "MAX_SINGLE_UPLOAD", 0)
+    chunk_size = 4 * 1024 * 1024
+    attempts = []
+
+    def handler(request):
+        name = request.url.path.rsplit("/", 1)[-1]
+        if name == "start":
+            return httpx.Response(200, json={"session_id": "session"})
+        if name == "append_v2":
+            offset = json.loads(request.headers["Dropbox-API-Arg"])["cursor"]["offset"]
+            attempts.append(offset)
+            if offset == 0 and attempts.count(0) == 1:
+                # The chunk landed, but the response was lost
+                return httpx.Response(503, text="unavailable")
+            if offset == 0:
+                return httpx.Response(409, json={"error_summary": "incorrect_offset/", "error": {
+                    ".tag": "incorrect_offset", "correct_offset": chunk_size}})
+            return httpx.Response(200, text="null")
+        return httpx.Response(200, json=FILE_METADATA)
+
+    helper = _helper(handler, max_retries=2)
+    helper.upload_chunk_size = chunk_size
+    md = asyncio.run(helper._upload(bytes(chunk_size + 10), "/a.bin"))
+    assert md.name == "a.bin"
+    assert attempts.count(0) == 2
@@ -0,0 +1,57 @@
+import pytest
+from tests.utils import generate_random_dataframe
+import os
+import pandas as pd
+import dropbox
+from tests.test_init import dropbox_test_folder
+
+@pytest.mark.usefixtures("dropbox_test_folder")
+class TestBatchMixin:
+    fnames = [f'region_{i}.csv' for i in range(5)]
+
+    @pytest.mark.order(17)
+    def test_read_many(self):
+        for i, fname in enumerate(self.fnames):
+            df = generate_random_dataframe(size_mb=.01, seed=i)
+            self.dbx_helper.write_csv(df, self.output_path, self.dir, fname, index=False)
+
+        dfs = self.dbx_helper.read_many(self.output_path, self.dir, self.fnames, max_workers=4)
+        assert len(dfs) == len(self.fnames), "Wrong number of results!"
+        for i, df in enumerate(dfs):
+            expected = generate_random_dataframe(size_mb=.01, seed=i)
+            # Every file has the same shape, so compare contents to catch reordering
+            pd.testing.assert_frame_equal(df, expected, obj=self.fnames[i])
+
+        combined = self.dbx_helper.read_many(self.output_path, self.dir, self.fnames, concat=True)
+        assert isinstance(combined, pd.DataFrame), "Concatenated result is not a DataFrame."
+        assert len(combined) == sum(len(df) for df in dfs), "Concatenated DataFrame is missing rows!"
+
+        # Nothing to concatenate when every file fails
+        assert self.dbx_helper.read_many(self.output_path, self.dir, ['missing_0.csv', 'missing_1.csv'],
+                                         concat=True) is None
+
+    @pytest.mark.order(18)
+    def test_write_many(self):
+        objs = {f'country_{i}.pkl': generate_random_dataframe(size_mb=.01, seed=i) for i in range(5)}
+        results = self.dbx_helper.write_many(objs, self.output_path, self.dir)
+        assert list(results) == list(objs), "Results are not reported per file in order!"
+        assert all(isinstance(md, dropbox.files.FileMetadata) for md in results.values()), "Some uploads failed!"
+
+        files = self.dbx_helper.list_files_in_folder(
+            os.path.join(self.dbx_helper.output_path, self.dir)
+        )
+        for fname in objs:
+            assert fname in files, f"{fname} not found in Dropbox folder!"
+
+    @pytest.mark.order(18)
+    def test_iter_files(self):
+        folder = os.path.join(self.dbx_helper.output_path, self.dir)
+        entries = list(self.dbx_helper.iter_files(folder, extensions='.csv'))
+
+        assert sorted(entry.name for entry in entries) == sorted(self.fnames), "Extension filter returned the wrong files!"
+        for entry in entries:
+            assert isinstance(entry, dropbox.files.FileMetadata), "Listing did not yield file metadata!"
+            assert entry.size > 0 and entry.content_hash, "Entry is missing size or content hash!"
+
+        matched = [entry.name for entry in self.dbx_helper.iter_files(folder, pattern='country_*')]
+        assert len(matched) == 5, "Glob filter returned the wrong files!"
@@ -0,0 +1,43 @@
+import io
+import pytest
+from dropbox_helper.compression import (CODECS, compressed_writer, detect_compression, infer_compression,
+                                        open_decompressed, parse_compression)
+
+DATA = b"a,b\n" + b"".join(b"%d,text value\n" % i for i in range(10000))
+
+
+@pytest.mark.parametrize("method, module", [("gzip", "gzip"), ("zstd", "zstandard"), ("lz4", "lz4")])
+def test_round_trip(method, module):
+    pytest.importorskip(module)
+    buffer = io.BytesIO()
+    with compressed_writer(buffer, method, level=1) as f:
+        f.write(DATA)
+    assert not buffer.closed, "Underlying file object was closed!"
+    compressed = buffer.getvalue()
+    assert len(compressed) < len(DATA) / 2
+    assert detect_compression(compressed[:4]) == method
+
+    # Detected from the magic bytes, and by name
+    assert open_decompressed(io.BytesIO(compressed)).read() == DATA
+    assert open_decompressed(io.BytesIO(compressed), filename=f"data.csv{CODECS[method]}").read() == DATA
+    assert open_decompressed(io.BytesIO(compressed), method).read() == DATA
+
+    # Identical data compresses to identical bytes
+    again = io.BytesIO()
+    with compressed_writer(again, method, level=1) as f:
+        f.write(DATA)
+    assert again.getvalue() == compressed
+
+
+def test_uncompressed_passthrough():
+    assert open_decompressed(io.BytesIO(DATA)).read() == DATA
+    assert detect_compression(DATA[:4]) is None
+
+
+def test_parse_compression():
+    assert parse_compression("infer", "out.csv.zst") == ("zstd", {})
+    assert parse_compression("infer", "out.csv") == (None, {})
+    assert parse_compression({"method": "gzip", "level": 9}) == ("gzip", {"level": 9})
+    assert infer_compression("MODEL.PKL.GZ") == "gzip"
+    with pytest.raises(ValueError):
+        parse_compression("snappy")
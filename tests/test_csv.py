@@ -52,3 +52,48 @@ class TestCSVMixin:
         df = self.dbx_helper.read_csv(self.output_path, self.dir, self.large_name)
         assert isinstance(df, pd.DataFrame), "Downloaded csv is not a DataFrame."
         assert not df.empty, "Downloaded DataFrame is empty!"
+
+    @pytest.mark.order(7)
+    def test_partial_csv_download(self):
+        full = self.dbx_helper.read_csv(self.output_path, self.dir, self.small_name)
+
+        # Only the first ~5 KB of the ~10 KB file are fetched
+        partial = self.dbx_helper.read_csv(self.output_path, self.dir, self.small_name, mb_to_load=0.005)
+        assert isinstance(partial, pd.DataFrame), "Partially downloaded csv is not a DataFrame."
+        assert 0 < len(partial) < len(full), "Partial download did not return a subset of rows!"
+        assert list(partial.columns) == list(full.columns), "Column mismatch in partial download!"
+
+        head = self.dbx_helper.read_csv(self.output_path, self.dir, self.small_name, nrows=5)
+        assert len(head) == 5, "nrows streaming read returned the wrong number of rows!"
+
+        # A limit shorter than the first line can't yield any rows
+        self.dbx_helper.raise_on_error = True
+        try:
+            with pytest.raises(ValueError, match="No complete line"):
+                self.dbx_helper.read_csv(self.output_path, self.dir, self.small_name, mb_to_load=1e-6)
+        finally:
+            self.dbx_helper.raise_on_error = False
+
+    @pytest.mark.order(8)
+    def test_iter_csv(self):
+        full = self.dbx_helper.read_csv(self.output_path, self.dir, self.small_name)
+        chunks = list(self.dbx_helper.iter_csv(self.output_path, self.dir, self.small_name, chunksize=50))
+
+        assert len(chunks) > 1, "File was not split into several chunks!"
+        assert all(len(chunk) <= 50 for chunk in chunks), "Chunk larger than chunksize!"
+        assert sum(len(chunk) for chunk in chunks) == len(full), "Chunks don't add up to the full file!"
+
+    @pytest.mark.order(9)
+    def test_unchanged_csv_skipped(self):
+        df = generate_random_dataframe(size_mb=.01, seed=0)
+        self.dbx_helper.write_csv(df, self.output_path, self.dir, 'unchanged.csv', index=False)
+        full_path = self.dbx_helper._construct_path(self.output_path, self.dir, 'unchanged.csv')
+        rev = self.dbx_helper.dbx.files_get_metadata(full_path).rev
+
+        # The streamed output hashes the same, so no new revision is committed
+        self.dbx_helper.skip_if_unchanged = True
+        try:
+            self.dbx_helper.write_csv(df, self.output_path, self.dir, 'unchanged.csv', index=False)
+        finally:
+            self.dbx_helper.skip_if_unchanged = False
+        assert self.dbx_helper.dbx.files_get_metadata(full_path).rev == rev, "Unchanged file was re-uploaded!"
@@ -0,0 +1,60 @@
+import os
+from dropbox_helper.disk_cache import DiskCache
+
+
+class TestDiskCache:
+
+    def test_put_and_get(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put('/output/a.csv', 'hash1', b'a,b\n1,2\n')
+
+        local_path = cache.get('/output/a.csv', 'hash1')
+        assert local_path is not None, "Cached file not found!"
+        with open(local_path, 'rb') as f:
+            assert f.read() == b'a,b\n1,2\n'
+
+        # Dropbox paths are case-insensitive
+        assert cache.get('/Output/A.csv', 'hash1') == local_path
+
+    def test_changed_content_hash_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put('/output/a.csv', 'hash1', b'old')
+        assert cache.get('/output/a.csv', 'hash2') is None
+
+        # Storing a new version replaces the old one
+        cache.put('/output/a.csv', 'hash2', b'new')
+        assert cache.get('/output/a.csv', 'hash1') is None
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = DiskCache(tmp_path, max_size_mb=2.5 / 1024)  # 2.5 KB
+        cache.put('/a', 'h', b'a' * 1024)
+        cache.put('/b', 'h', b'b' * 1024)
+        os.utime(cache.get('/a', 'h'), (0, 0))
+        os.utime(cache.get('/b', 'h'), (1, 1))
+        cache.put('/c', 'h', b'c' * 1024)
+
+        assert cache.get('/a', 'h') is None, "Least recently used entry was not evicted!"
+        assert cache.get('/b', 'h') is not None
+        assert cache.get('/c', 'h') is not None
+
+    def test_entry_larger_than_budget_is_kept(self, tmp_path):
+        cache = DiskCache(tmp_path, max_size_mb=1 / 1024)  # 1 KB
+        cache.put('/a', 'h', b'a' * 512)
+        local_path = cache.put('/b', 'h', b'b' * 4096)
+
+        assert os.path.exists(local_path), "Just committed entry was evicted!"
+        assert cache.get('/a', 'h') is None, "Older entry was not evicted to make room!"
+        # Evicted in turn once a newer entry is committed
+        cache.put('/c', 'h', b'c' * 16)
+        assert cache.get('/b', 'h') is None
+
+    def test_entry_lock(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        lock = cache.entry_lock('/a', 'h')
+        assert cache.entry_lock('/A', 'h') is lock, "Readers of one file version don't share a lock!"
+        assert cache.entry_lock('/a', 'h2') is not lock
+
+        # Released once the entry is committed
+        cache.put('/a', 'h', b'a')
+        assert cache.entry_lock('/a', 'h') is not lock
@@ -86,3 +86,27 @@ class TestHelloWorld:
         assert file_content is not None, "Downloaded file content is None!"
         decoded_content = file_content.decode('utf-8')
         assert decoded_content == self.content, f"File content mismatch: expected '{self.content}', got '{decoded_content}'"
+
+    @pytest.mark.order(2)
+    def test_download_to_file(self, tmp_path):
+        """Test streaming a file to local disk, verified against its content hash."""
+        local_path = tmp_path / 'downloads' / self.filename
+        md = self.dbx_helper.download_to_file(
+            self.output_path, self.dir, self.filename, str(local_path), segments=2
+        )
+
+        assert md is not None, "Download failed!"
+        assert local_path.read_text() == self.content, "Downloaded file content mismatch!"
+        assert not (tmp_path / 'downloads' / f'{self.filename}.part').exists(), "Partial file left behind!"
+
+    @pytest.mark.order(3)
+    def test_ensure_folders(self):
+        """Test creating several folders in one batch, tolerating existing ones."""
+        base = os.path.join(self.output_path, self.dir)
+        paths = [f"{base}/batch/a", f"{base}/batch/b/c", base]
+        summary = self.dbx_helper.ensure_folders(paths)
+
+        assert not summary['failed'], f"Folder creation failed: {summary['failed']}"
+        assert sorted(summary['created']) == sorted(paths[:2]), "Missing folders were not created!"
+        assert summary['existing'] == [base], "Existing folder not reported!"
+        assert all(self.dbx_helper.folder_exists(path) for path in paths)
@@ -0,0 +1,30 @@
+import time
+import dropbox
+from dropbox_helper.metadata_cache import MetadataCache
+
+
+def folder(path):
+    return dropbox.files.FolderMetadata(name=path.rsplit('/', 1)[-1], path_lower=path.lower(),
+                                        path_display=path, id='id:' + path)
+
+
+class TestMetadataCache:
+
+    def test_get_put_invalidate(self):
+        cache = MetadataCache()
+        md = folder('/Output/Results')
+        cache.put(md)
+
+        # Dropbox paths are case-insensitive and may carry a trailing slash
+        assert cache.get('/output/RESULTS/') is md
+        assert cache.get('/output') is None
+
+        cache.invalidate('/Output/Results')
+        assert cache.get('/output/results') is None
+
+    def test_expiry(self):
+        cache = MetadataCache(ttl=0.05)
+        cache.put(folder('/output'))
+        assert cache.get('/output') is not None
+        time.sleep(0.1)
+        assert cache.get('/output') is None, "Expired entry returned!"
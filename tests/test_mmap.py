@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import scipy.sparse
+from dropbox_helper.npz_mixin import NPZMixin
+
+
+def _unpack(tmp_path, matrix):
+    npz_path = tmp_path / "matrix.npz"
+    scipy.sparse.save_npz(npz_path, matrix)
+    local_dir = tmp_path / "unpacked"
+    local_dir.mkdir()
+    NPZMixin._extract_npz(str(npz_path), str(local_dir))
+    return local_dir
+
+
+def _is_mapped(array):
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc", "coo", "dia"])
+def test_map_sparse_matrix(tmp_path, fmt):
+    if fmt == "dia":
+        matrix = scipy.sparse.diags([1.0, 2.0], [0, 3], shape=(200, 30), format="dia")
+    else:
+        matrix = scipy.sparse.random(200, 30, density=0.1, format=fmt, random_state=0)
+    local_dir = _unpack(tmp_path, matrix)
+    assert sorted(p.name for p in local_dir.iterdir())[0].endswith(".npy")
+
+    mapped = NPZMixin._map_sparse_matrix(str(local_dir), "r")
+    assert mapped.format == fmt
+    assert abs(mapped - matrix).sum() == 0
+    assert _is_mapped(mapped.data)
+
+
+def test_map_csr_arrays(tmp_path):
+    matrix = scipy.sparse.csr_array(scipy.sparse.random(100, 10, density=0.2, random_state=0))
+    mapped = NPZMixin._map_sparse_matrix(str(_unpack(tmp_path, matrix)), "c")
+    assert isinstance(mapped, scipy.sparse.csr_array)
+    assert all(_is_mapped(a) for a in (mapped.data, mapped.indices, mapped.indptr))
+    # Copy-on-write: changes stay in this process
+    mapped.data[0] = -1
+    assert mapped.data[0] == -1
+
+
+def test_npy_round_trip():
+    array = np.asfortranarray(np.random.default_rng(0).random((20, 5)))
+    loaded = NPZMixin._load_npy(NPZMixin._dump_npy(array))
+    assert np.array_equal(loaded, array) and loaded.flags.f_contiguous
+    with pytest.raises(ValueError):
+        NPZMixin._dump_npy(np.array([object()]))
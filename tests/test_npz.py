@@ -38,3 +38,31 @@ class TestNPZMixin:
         # Validate it is a sparse matrix and non-empty
         assert issparse(matrix), "Downloaded object is not a sparse matrix!"
         assert matrix.shape[0] > 0 and matrix.shape[1] > 0, "Downloaded matrix is empty or has invalid shape!"
+
+    @pytest.mark.order(12)
+    def test_sharded_npz(self):
+        matrix = sparse_random(1000, 50, density=0.05, format='csr', dtype=np.float32, random_state=0)
+        self.dbx_helper.write_npz(matrix, self.output_path, self.dir, 'sharded.npz', shard_rows=100)
+
+        full = self.dbx_helper.read_npz(self.output_path, self.dir, 'sharded.npz')
+        assert (full != matrix).nnz == 0, "Sharded matrix differs from the original!"
+
+        # Only the shards covering rows 250-420 are needed
+        subset = self.dbx_helper.read_npz(self.output_path, self.dir, 'sharded.npz', rows=slice(250, 420))
+        assert subset.shape == (170, 50), "Row subset has the wrong shape!"
+        assert (subset != matrix[250:420]).nnz == 0, "Row subset differs from the original!"
+
+    @pytest.mark.order(12)
+    def test_memory_mapped_reads(self):
+        matrix = sparse_random(500, 40, density=0.05, format='csr', dtype=np.float32, random_state=1)
+        self.dbx_helper.write_npz(matrix, self.output_path, self.dir, 'mapped.npz')
+        mapped = self.dbx_helper.read_npz(self.output_path, self.dir, 'mapped.npz', mmap_mode='r')
+        assert (mapped != matrix).nnz == 0, "Memory-mapped matrix differs from the original!"
+        assert not mapped.data.flags.writeable, "Matrix data is not memory-mapped read-only!"
+
+        array = np.arange(1200, dtype=np.float64).reshape(30, 40)
+        self.dbx_helper.write_npy(array, self.output_path, self.dir, 'dense.npy')
+        assert np.array_equal(self.dbx_helper.read_npy(self.output_path, self.dir, 'dense.npy'), array)
+        mapped = self.dbx_helper.read_npy(self.output_path, self.dir, 'dense.npy', mmap_mode='r')
+        assert isinstance(mapped, np.memmap), "Array is not memory-mapped!"
+        assert np.array_equal(mapped, array), "Memory-mapped array differs from the original!"
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse
+from dropbox_helper.object_cache import MISSING, ObjectCache, estimate_size
+
+
+def loader(content, **kwargs):
+    return content
+
+
+class TestObjectCache:
+
+    def test_hit_and_rev_change(self):
+        cache = ObjectCache()
+        key = ObjectCache.make_key('/Output/a.csv', 'rev1', loader, sep=',')
+        df = pd.DataFrame({'a': [1, 2, 3]})
+        cache.put(key, df)
+
+        # Dropbox paths are case-insensitive
+        assert cache.get(ObjectCache.make_key('/output/A.csv', 'rev1', loader, sep=',')) is df
+        assert cache.get(ObjectCache.make_key('/output/a.csv', 'rev1', loader, sep=';')) is MISSING
+        assert cache.get(ObjectCache.make_key('/output/a.csv', 'rev2', loader, sep=',')) is MISSING
+
+        # Storing a new revision replaces the old one
+        cache.put(ObjectCache.make_key('/output/a.csv', 'rev2', loader, sep=','), df)
+        assert cache.get(key) is MISSING
+        assert len(cache) == 1
+
+    def test_byte_budget(self):
+        cache = ObjectCache(max_size_mb=2.5)
+        for i in range(3):
+            cache.put(ObjectCache.make_key(f'/output/{i}.npy', 'rev', loader), np.zeros(1024 * 1024, dtype=np.uint8))
+        assert cache.size <= 2.5 * 1024 * 1024
+        assert cache.get(ObjectCache.make_key('/output/0.npy', 'rev', loader)) is MISSING, "LRU entry not evicted!"
+        assert cache.get(ObjectCache.make_key('/output/2.npy', 'rev', loader)) is not MISSING
+
+        # Objects larger than the budget are not cached at all
+        cache.put(ObjectCache.make_key('/output/big.npy', 'rev', loader), np.zeros(3 * 1024 * 1024, dtype=np.uint8))
+        assert cache.get(ObjectCache.make_key('/output/big.npy', 'rev', loader)) is MISSING
+
+    def test_invalidate(self):
+        cache = ObjectCache()
+        cache.put(ObjectCache.make_key('/output/a.csv', 'rev1', loader), 'a')
+        cache.put(ObjectCache.make_key('/output/b.csv', 'rev1', loader), 'b')
+        cache.invalidate('/output/A.csv')
+        assert len(cache) == 1
+
+    def test_estimate_size(self):
+        df = pd.DataFrame({'a': np.arange(1000, dtype=np.int64)})
+        assert estimate_size(df) >= 8000
+        assert estimate_size(np.zeros(100)) == 800
+        matrix = scipy.sparse.random(100, 100, density=0.1, format='csr')
+        assert estimate_size(matrix) >= matrix.data.nbytes + matrix.indices.nbytes
+        assert estimate_size({'df': df}) > estimate_size(df)
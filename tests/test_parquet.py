@@ -28,4 +28,30 @@ class TestParquetMixin:
 
         df = self.dbx_helper.read_parquet( self.output_path, self.dir, self.fname)
         assert isinstance(df, pd.DataFrame), "Downloaded parquet is not a DataFrame."
-        assert not df.empty, "Downloaded DataFrame is empty!"
\ No newline at end of file
+        assert not df.empty, "Downloaded DataFrame is empty!"
+
+    @pytest.mark.order(16)
+    def test_parquet_column_download(self):
+        df = self.dbx_helper.read_parquet(self.output_path, self.dir, self.fname, columns=['col_1', 'col_3'])
+        assert isinstance(df, pd.DataFrame), "Downloaded parquet is not a DataFrame."
+        assert list(df.columns) == ['col_1', 'col_3'], "Column selection was not applied!"
+        assert not df.empty, "Downloaded DataFrame is empty!"
+
+    @pytest.mark.order(16)
+    def test_streaming_parquet_upload(self):
+        fname = 'streamed_parquet.parquet'
+        parts = [generate_random_dataframe(size_mb=.01, seed=i) for i in range(3)]
+        with self.dbx_helper.open_parquet_writer(self.output_path, self.dir, fname) as writer:
+            for part in parts:
+                writer.write(part)
+
+        df = self.dbx_helper.read_parquet(self.output_path, self.dir, fname)
+        assert isinstance(df, pd.DataFrame), "Downloaded parquet is not a DataFrame."
+        assert len(df) == sum(len(part) for part in parts), "Row count mismatch after streaming upload!"
+
+        # Without rows or a schema there is no valid file to commit
+        with pytest.raises(ValueError):
+            with self.dbx_helper.open_parquet_writer(self.output_path, self.dir, 'empty.parquet'):
+                pass
+        files = self.dbx_helper.list_files_in_folder(os.path.join(self.dbx_helper.output_path, self.dir))
+        assert 'empty.parquet' not in files, "Empty parquet file was committed!"
@@ -1,6 +1,7 @@
 import pytest
 from tests.utils import generate_random_dataframe
 import os
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 from tests.test_init import dropbox_test_folder
@@ -39,3 +40,14 @@ class TestPickleMixin:
         # if you want strict equality, you could save and reuse the original object instead of regenerating
         pdt.assert_index_equal(obj.columns, original_df.columns)
         assert obj.shape == original_df.shape, "Downloaded DataFrame shape mismatch!"
+
+    @pytest.mark.order(8)
+    def test_out_of_band_pickle(self):
+        obj = {'weights': np.random.default_rng(0).random(500_000), 'name': 'model'}
+        for fname in ('model.pkl', 'model.pkl.zst'):
+            self.dbx_helper.write_pickle(obj, self.output_path, self.dir, fname, out_of_band=True)
+            loaded = self.dbx_helper.read_pickle(self.output_path, self.dir, fname)
+            assert np.array_equal(loaded['weights'], obj['weights']), "Out-of-band array differs!"
+            mapped = self.dbx_helper.read_pickle(self.output_path, self.dir, fname, mmap_mode='r')
+            assert np.array_equal(mapped['weights'], obj['weights']), "Memory-mapped array differs!"
+            assert not mapped['weights'].flags.writeable, "Array is not a read-only view of the mapped file!"
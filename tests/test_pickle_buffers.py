@@ -0,0 +1,57 @@
+import gzip
+import io
+import pickle
+import numpy as np
+import pandas as pd
+from dropbox_helper import pickle_buffers
+from dropbox_helper.pickle_mixin import PickleMixin
+
+
+def _dump(obj, **kwargs):
+    buffer = io.BytesIO()
+    pickle_buffers.dump(obj, buffer, **kwargs)
+    return buffer.getvalue()
+
+
+def test_large_buffers_out_of_band():
+    array = np.random.default_rng(0).random(300_000)
+    obj = {"array": array, "df": pd.DataFrame({"a": array}), "small": np.arange(5), "strided": array[::3]}
+    data = bytearray(_dump(obj))
+    assert data.endswith(pickle_buffers.MAGIC)
+
+    loaded = pickle_buffers.loads(data)
+    assert np.array_equal(loaded["array"], array)
+    assert loaded["df"].equals(obj["df"])
+    assert np.array_equal(loaded["strided"], obj["strided"])
+    # Views of the input, aligned
+    assert np.shares_memory(loaded["array"], np.frombuffer(data, dtype=np.uint8))
+    assert loaded["array"].ctypes.data % 16 == 0
+    assert loaded["array"].flags.writeable
+
+
+def test_plain_pickle_without_large_buffers():
+    obj = {"small": np.arange(10), "text": "value"}
+    data = _dump(obj)
+    assert pickle.loads(data)["text"] == "value"
+    assert np.array_equal(pickle_buffers.loads(data)["small"], obj["small"])
+    # Buffers below the threshold stay in-band
+    assert not _dump(np.zeros(1000), min_size=10_000).endswith(pickle_buffers.MAGIC)
+    assert _dump(np.zeros(1000), min_size=1000).endswith(pickle_buffers.MAGIC)
+
+
+def test_load_pickle_compressed_and_plain():
+    array = np.arange(200_000, dtype=np.float64)
+    assert np.array_equal(PickleMixin._load_pickle(bytearray(_dump(array))), array)
+    assert np.array_equal(PickleMixin._load_pickle(PickleMixin._dump_pickle(array)), array)
+
+    loaded = PickleMixin._load_pickle(gzip.compress(_dump(array)))
+    assert np.array_equal(loaded, array) and loaded.flags.writeable
+
+
+def test_dump_pickle_plain_by_default():
+    array = np.arange(200_000, dtype=np.float64)
+    # The default stays readable by plain pickle
+    assert np.array_equal(pickle.loads(PickleMixin._dump_pickle(array)), array)
+    data = PickleMixin._dump_pickle(array, out_of_band=True)
+    assert data.endswith(pickle_buffers.MAGIC)
+    assert np.array_equal(PickleMixin._load_pickle(data), array)
@@ -1,6 +1,7 @@
 import pytest
 import os
 import geopandas as gpd
+from shapely.geometry import box
 from tests.test_init import dropbox_test_folder
 from tests.utils import generate_random_gdf
 
@@ -45,3 +46,36 @@ class TestShapefileMixin:
             "Column mismatch between uploaded and downloaded shapefile."
         assert downloaded.geometry.geom_type.equals(original.geometry.geom_type), \
             "Geometry types differ."
+
+    @pytest.mark.order(10)
+    @pytest.mark.parametrize("name", ['small_geo.parquet', 'small_geo.shp.zip'])
+    def test_geo_round_trip(self, name):
+        gdf = generate_random_gdf(size=10)
+        self.dbx_helper.write_geo(gdf, self.output_path, self.dir, name)
+
+        downloaded = self.dbx_helper.read_geo(self.output_path, self.dir, name)
+        assert isinstance(downloaded, gpd.GeoDataFrame), "Downloaded object is not a GeoDataFrame."
+        assert list(downloaded.columns) == list(gdf.columns), "Column mismatch after round trip."
+        assert len(downloaded) == len(gdf), "Row count mismatch after round trip."
+        assert downloaded.crs == gdf.crs, "CRS lost in round trip."
+
+    @pytest.mark.order(11)
+    def test_shapefile_filtered_read(self):
+        full = self.dbx_helper.read_shp(self.output_path, self.dir, self.fname + '.shp')
+        minx, miny, maxx, maxy = full.total_bounds
+        bbox = (minx, miny, (minx + maxx) / 2, maxy)
+
+        filtered = self.dbx_helper.read_shp(self.output_path, self.dir, self.fname + '.shp',
+                                            bbox=bbox, columns=[full.columns[0]])
+        assert list(filtered.columns) == [full.columns[0], 'geometry'], "Column selection not applied!"
+        assert len(filtered) == full.intersects(box(*bbox)).sum(), "bbox filter not applied!"
+
+    @pytest.mark.order(11)
+    def test_geoparquet_filtered_read(self):
+        gdf = generate_random_gdf(size=100)
+        self.dbx_helper.write_geo(gdf, self.output_path, self.dir, 'filtered.parquet', row_group_size=10)
+        minx, miny, maxx, maxy = gdf.total_bounds
+        bbox = (minx, miny, (minx + maxx) / 2, maxy)
+
+        filtered = self.dbx_helper.read_geo(self.output_path, self.dir, 'filtered.parquet', bbox=bbox)
+        assert len(filtered) == gdf.intersects(box(*bbox)).sum(), "bbox filter not applied!"
@@ -0,0 +1,66 @@
+import pytest
+import os
+from tests.test_init import dropbox_test_folder
+
+@pytest.mark.usefixtures("dropbox_test_folder")
+class TestSyncMixin:
+
+    @pytest.mark.order(19)
+    def test_changes_since(self):
+        folder = os.path.join(self.dbx_helper.output_path, self.dir)
+        self.dbx_helper.write_bytes(b'first', self.output_path, self.dir, 'a.txt')
+
+        changes = self.dbx_helper.changes_since(folder)
+        assert [md.name for md in changes['added']] == ['a.txt'], "Initial listing should report existing files as added!"
+
+        changes = self.dbx_helper.changes_since(folder)
+        assert not any(changes.values()), "No changes expected between consecutive calls!"
+
+        self.dbx_helper.write_bytes(b'second', self.output_path, self.dir, 'a.txt')
+        self.dbx_helper.write_bytes(b'new', self.output_path, self.dir, 'b.txt')
+        changes = self.dbx_helper.changes_since(folder)
+        assert [md.name for md in changes['added']] == ['b.txt'], "New file not reported as added!"
+        assert [md.name for md in changes['modified']] == ['a.txt'], "Overwritten file not reported as modified!"
+
+    @pytest.mark.order(19)
+    def test_sync_down(self, tmp_path):
+        folder = os.path.join(self.dbx_helper.output_path, self.dir)
+
+        summary = self.dbx_helper.sync_down(folder, tmp_path)
+        assert sorted(summary['downloaded']) == ['a.txt', 'b.txt'], "Not every file was downloaded!"
+        assert (tmp_path / 'a.txt').read_bytes() == b'second', "Local copy doesn't match Dropbox!"
+
+        summary = self.dbx_helper.sync_down(folder, tmp_path)
+        assert summary['downloaded'] == [], "Unchanged files were downloaded again!"
+        assert sorted(summary['unchanged']) == ['a.txt', 'b.txt']
+
+    @pytest.mark.order(19)
+    def test_sync_up(self, tmp_path):
+        folder = os.path.join(self.dbx_helper.output_path, self.dir, 'synced')
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'x.txt').write_bytes(b'x')
+        (tmp_path / 'sub' / 'y.txt').write_bytes(b'y')
+
+        summary = self.dbx_helper.sync_up(tmp_path, folder)
+        assert sorted(summary['uploaded']) == ['sub/y.txt', 'x.txt'], "Not every file was uploaded!"
+
+        (tmp_path / 'x.txt').write_bytes(b'changed')
+        summary = self.dbx_helper.sync_up(tmp_path, folder)
+        assert summary['uploaded'] == ['x.txt'], "Only the changed file should be uploaded!"
+        assert summary['unchanged'] == ['sub/y.txt']
+
+    @pytest.mark.order(19)
+    def test_changes_since_latest_cursor(self):
+        folder = os.path.join(self.dbx_helper.output_path, self.dir)
+        # Tracked separately from the recursive feed above; runs last, after the sync tests
+        changes = self.dbx_helper.changes_since(folder, recursive=False, include_existing=False)
+        assert not any(changes.values()), "Starting from the latest cursor should report nothing!"
+
+        self.dbx_helper.write_bytes(b'later', self.output_path, self.dir, 'c.txt')
+        changes = self.dbx_helper.changes_since(folder, recursive=False, include_existing=False)
+        assert [md.name for md in changes['added']] == ['c.txt'], "New file not reported as added!"
+
+        # Deleting a file from before the first call is reported without an indexed revision
+        self.dbx_helper.dbx.files_delete_v2(os.path.join(folder, 'b.txt'))
+        changes = self.dbx_helper.changes_since(folder, recursive=False, include_existing=False)
+        assert [os.path.basename(p) for p in changes['deleted']] == ['b.txt'], "Deleted file not reported!"
@@ -0,0 +1,75 @@
+import time
+import pytest
+import requests
+from dropbox import files
+from dropbox.exceptions import ApiError, RateLimitError
+from dropbox_helper.transport import RetryPolicy, TokenBucket, is_too_many_write_operations
+
+
+class TestRetryPolicy:
+
+    def test_retries_transient_errors(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise requests.ConnectionError("connection reset")
+            return 'ok'
+
+        policy = RetryPolicy(max_retries=3, base_delay=0.01)
+        assert policy.call(flaky) == 'ok'
+        assert len(calls) == 3, "Transient errors were not retried!"
+
+    def test_gives_up_after_max_retries(self):
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            raise RateLimitError('rid', backoff=0)
+
+        policy = RetryPolicy(max_retries=2)
+        with pytest.raises(RateLimitError):
+            policy.call(throttled)
+        assert len(calls) == 3
+
+    def test_does_not_retry_other_errors(self):
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise ValueError("bad argument")
+
+        with pytest.raises(ValueError):
+            RetryPolicy(max_retries=3).call(broken)
+        assert len(calls) == 1, "Non-transient errors should not be retried!"
+
+    def test_honors_rate_limit_backoff(self):
+        policy = RetryPolicy()
+        delay = policy.backoff(0, RateLimitError('rid', backoff=7))
+        assert 7 <= delay <= 8
+
+    def test_too_many_write_operations_is_a_rate_limit(self):
+        write_error = files.WriteError.too_many_write_operations
+        upload_error = files.UploadError.path(files.UploadWriteFailed(reason=write_error, upload_session_id='s'))
+        assert is_too_many_write_operations(upload_error)
+        assert RetryPolicy.is_rate_limit(ApiError('rid', upload_error, None, None))
+        assert not is_too_many_write_operations(files.LookupError.not_found)
+
+
+class TestTokenBucket:
+
+    def test_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        # The first token is free, the next ten take 1/50 s each
+        assert time.monotonic() - start >= 0.19
+
+    def test_pause_holds_back_callers(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.pause(0.1)
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.09
@@ -0,0 +1,41 @@
+import json
+import os
+from dropbox_helper.upload_checkpoint import CHECKPOINT_TTL, UploadCheckpoint
+
+
+class TestUploadCheckpoint:
+
+    def test_resume_same_content(self, tmp_path):
+        checkpoint = UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 4)
+        assert checkpoint.session_id is None
+        checkpoint.start('session-1')
+        checkpoint.acknowledge(0)
+        checkpoint.acknowledge(8)
+
+        # Dropbox paths are case-insensitive
+        resumed = UploadCheckpoint(tmp_path, '/Output/BIG.bin', 'size:hash', 4)
+        assert resumed.session_id == 'session-1', "Checkpoint was not picked up!"
+        assert resumed.acknowledged == {0, 8}
+
+    def test_changed_content_starts_over(self, tmp_path):
+        UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 4).start('session-1')
+        assert UploadCheckpoint(tmp_path, '/output/big.bin', 'size:other', 4).session_id is None
+        assert UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 8).session_id is None
+
+    def test_expired_checkpoint_is_ignored(self, tmp_path):
+        checkpoint = UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 4)
+        checkpoint.start('session-1')
+        with open(checkpoint.path) as f:
+            state = json.load(f)
+        state['created'] -= CHECKPOINT_TTL + 1
+        with open(checkpoint.path, 'w') as f:
+            json.dump(state, f)
+
+        assert UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 4).session_id is None
+
+    def test_remove(self, tmp_path):
+        UploadCheckpoint(tmp_path, '/output/big.bin', 'size:hash', 4).start('session-1')
+        UploadCheckpoint.remove(tmp_path, '/output/big.bin')
+        assert os.listdir(tmp_path) == []
+        # Removing a missing checkpoint is a no-op
+        UploadCheckpoint.remove(tmp_path, '/output/big.bin')
@@ -0,0 +1,94 @@
+import os
+from types import SimpleNamespace
+from dropbox_helper.content_hash import content_hash
+from dropbox_helper.upload_stream import UploadStream
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class RecordingHelper:
+    """
+    Stands in for the helper's upload calls, recording the chunks sent.
+    """
+
+    upload_workers = 2
+
+    def __init__(self):
+        self.chunks = []
+        self.uploaded = None
+        self.resumable_path = None
+        self.dbx = SimpleNamespace(files_upload=self._files_upload)
+
+    def _upload_chunk_size(self, chunk_size=None):
+        return CHUNK_SIZE
+
+    def _start_upload_session(self):
+        return "session"
+
+    def _append_upload_chunk(self, session_id, offset, chunk, close=False):
+        self.chunks.append((offset, chunk))
+
+    def _upload_to_session(self, content, chunk_size=None, max_workers=None, full_path=None):
+        self.chunks.append((0, bytes(content)))
+        self.resumable_path = full_path
+        return "session", len(content)
+
+    def _finish_upload_session(self, session_id, total, full_path):
+        self.uploaded = b"".join(chunk for _, chunk in sorted(self.chunks))
+        return SimpleNamespace(size=total)
+
+    def _files_upload(self, content, full_path, mode=None):
+        self.uploaded = content
+        return SimpleNamespace(size=len(content))
+
+    def _cache_metadata(self, md):
+        pass
+
+
+def _write(helper, data, unchanged_hash=None, resume_size=None):
+    with UploadStream(helper, "/out/data.bin", unchanged_hash=unchanged_hash, resume_size=resume_size) as stream:
+        # Uneven writes, across chunk boundaries
+        for start in range(0, len(data), 1_000_000):
+            stream.write(data[start:start + 1_000_000])
+        assert stream.tell() == len(data)
+    return stream
+
+
+def test_unchanged_output_sends_nothing():
+    data = os.urandom(3 * CHUNK_SIZE + 12345)
+    helper = RecordingHelper()
+    stream = _write(helper, data, unchanged_hash=content_hash(data))
+
+    assert stream.skipped
+    assert helper.chunks == [], "Chunks of an unchanged file were uploaded!"
+    assert helper.uploaded is None
+
+
+def test_changed_output_is_uploaded():
+    data = os.urandom(3 * CHUNK_SIZE + 12345)
+    helper = RecordingHelper()
+    stream = _write(helper, data, unchanged_hash=content_hash(b"old version"))
+
+    assert not stream.skipped
+    assert helper.uploaded == data
+    assert stream.metadata.size == len(data)
+
+
+def test_small_output_uses_single_upload():
+    helper = RecordingHelper()
+    stream = _write(helper, b"a,b\n1,2\n", unchanged_hash=content_hash(b"old version"))
+    assert helper.chunks == [] and helper.uploaded == b"a,b\n1,2\n"
+    assert not stream.skipped
+
+
+def test_large_spooled_output_is_uploaded_resumably():
+    data = os.urandom(3 * CHUNK_SIZE + 12345)
+    helper = RecordingHelper()
+    stream = _write(helper, data, resume_size=2 * CHUNK_SIZE)
+    assert helper.resumable_path == "/out/data.bin", "Spooled output wasn't uploaded in a checkpointed session!"
+    assert helper.uploaded == data and stream.metadata.size == len(data)
+
+    # Below the threshold, the spool is sent chunk by chunk
+    helper = RecordingHelper()
+    _write(helper, data, resume_size=len(data) + 1)
+    assert helper.resumable_path is None and helper.uploaded == data